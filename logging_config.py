@@ -30,12 +30,12 @@ LOGGING_CONFIG = {
             "formatter": "standard",
             "level": "INFO",
         },
+        # queued + batched: records are shipped from a background thread, one push per interval / batch
         "loki": {
-            "class": "logging_loki.LokiHandler",
+            "()": "src.helpers.logging_helpers.loki_batch_handler.queued_loki_handler",
             "formatter": "json",
             "url": os.getenv("LOKI_URL", "http://localhost:3100") + "/loki/api/v1/push",
             "tags": {"app": "etl-weather"},
-            "version": "2",
             "level": "INFO",
         }
     },
@@ -0,0 +1,80 @@
+"""
+Offline throughput benchmark of the bronze, silver and gold layers at configurable location counts.
+
+The workers run against local stand-ins instead of the live services (src/benchmarks):
+    weather APIs - fixture_server, recorded responses of the providers in api_data_parsers
+    ADLS         - local_datalake, the FileSystemClient subset the workers use, on a temp directory
+    Postgres     - disposable_database, a scratch database with sql/tables, dropped afterwards
+                   (on BENCH_PG_ADMIN_DSN, or a throwaway pgserver instance when it is not set)
+
+Reported per location count and layer: median wall time, slowest run, rows and rows/sec, then per stage.
+
+    python -m scripts.benchmark_pipeline                                  # 10, 100 and 500 locations
+    python -m scripts.benchmark_pipeline --locations 50 --runs 5 --api-latency-ms 120
+    python -m scripts.benchmark_pipeline --json pipeline.json             # keep the numbers to compare runs
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+
+# the workers read these on first use, the stand-ins don't care about the values
+for _name, _default in {"BASE_DIR_RAW": "bench/raw", "BASE_DIR_SILVER": "bench/silver",
+                        "BASE_DIR_GOLD": "bench/gold"}.items():
+    os.environ.setdefault(_name, _default)
+# placeholder keys, so a real key never ends up in a request to the fixture server
+for _name in ("ACCUWEATHER_API_KEY", "FORECA_API_KEY", "METEOBLUE_API_KEY", "OPENWEATHERMAP_API_KEY",
+              "TOMMOROW_API_KEY", "WEATHERAPI_API_KEY"):
+    os.environ[_name] = "bench"
+
+from src.benchmarks.pipeline_benchmark import run_pipeline_benchmark  # noqa: E402
+
+
+def _rate(value) -> str:
+    return f"{value:12,.0f}" if value is not None else f"{'-':>12}"
+
+
+def print_results(results: dict):
+    for count, layers in results.items():
+        print(f"\n{count} locations")
+        print(f"  {'layer / stage':<28} {'median s':>10} {'max s':>10} {'rows':>10} {'rows/sec':>12}")
+        for layer, result in layers.items():
+            print(f"  {layer:<28} {result['seconds']:10.3f} {result['max_seconds']:10.3f} "
+                  f"{result['rows'] or 0:10d} {_rate(result['rows_per_sec'])}")
+            for stage, timing in result["stages"].items():
+                print(f"    {stage:<26} {timing['seconds']:10.3f} {timing['max_seconds']:10.3f} "
+                      f"{timing['rows'] or 0:10d} {_rate(timing['rows_per_sec'])}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--locations", type=int, nargs="+", default=[10, 100, 500], help="location counts to run")
+    parser.add_argument("--runs", type=int, default=3, help="measured runs per location count, the median is reported")
+    parser.add_argument("--warmup", type=int, default=1, help="unreported runs before the measured ones")
+    parser.add_argument("--api-latency-ms", type=float, default=0, help="delay the fixture server adds to a response")
+    parser.add_argument("--pg-admin-dsn", help="server to create the scratch database on (default BENCH_PG_ADMIN_DSN)")
+    parser.add_argument("--json", help="also write the results to this file")
+    parser.add_argument("--verbose", action="store_true", help="keep the workers' INFO logs")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+    if not args.verbose:
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    def progress(count, run, total):
+        print(f"\r{count} locations: run {run + 1}/{total}", end="", file=sys.stderr, flush=True)
+
+    results = run_pipeline_benchmark(args.locations, runs=args.runs, warmup=args.warmup,
+                                     api_latency_ms=args.api_latency_ms, admin_dsn=args.pg_admin_dsn,
+                                     progress=progress)
+    print(file=sys.stderr)
+    print_results(results)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
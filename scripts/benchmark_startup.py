@@ -0,0 +1,113 @@
+"""
+Cold start benchmark for the deployment entrypoints in prefect.yaml.
+
+Every entrypoint module is imported in a fresh interpreter with -X importtime (what a container job
+pays before the flow function runs), `--runs` times. Reported per entrypoint: median wall time of
+the import, peak RSS of the child and the modules with the largest cumulative import time.
+
+    python -m scripts.benchmark_startup                     # all deployments
+    python -m scripts.benchmark_startup --only orchestrator --top 25
+    python -m scripts.benchmark_startup --json startup.json # keep the numbers to compare runs
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+import yaml
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# imported as a plain module (not __main__), so the `if __name__ == "__main__"` block doesn't start a flow
+_CHILD = """
+import importlib.util, json, resource, sys, time
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location("entrypoint_under_test", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+getattr(module, sys.argv[2])
+print(json.dumps({"seconds": time.perf_counter() - start,
+                  "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+                  "modules": len(sys.modules)}))
+"""
+
+
+def deployment_entrypoints(prefect_yaml: Path = PROJECT_ROOT / "prefect.yaml") -> dict[str, str]:
+    """{deployment name: "path/to/flow.py:function"} from prefect.yaml."""
+    with open(prefect_yaml) as f:
+        deployments = yaml.safe_load(f).get("deployments") or []
+    return {d["name"]: d["entrypoint"] for d in deployments if d.get("entrypoint")}
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """-X importtime lines as (module, self us, cumulative us)."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def measure_entrypoint(entrypoint: str, runs: int = 3, top: int = 15) -> dict:
+    path, function = entrypoint.split(":")
+    env = {**os.environ, "PYTHONPATH": str(PROJECT_ROOT), "PYTHONDONTWRITEBYTECODE": "0"}
+    samples = []
+    imports = []
+    for _ in range(runs):
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", _CHILD, str(PROJECT_ROOT / path), function],
+                              capture_output=True, text=True, env=env, cwd=PROJECT_ROOT)
+        if proc.returncode != 0:
+            error = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f"exit {proc.returncode}"
+            return {"entrypoint": entrypoint, "error": error}
+        samples.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+        imports = parse_importtime(proc.stderr)
+
+    # top-level packages only, their cumulative time already covers the submodules
+    packages = {}
+    for name, _, cumulative_us in imports:
+        root = name.split(".")[0]
+        if name == root or root not in packages:
+            packages[root] = max(packages.get(root, 0), cumulative_us)
+    heaviest = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+
+    return {
+        "entrypoint": entrypoint,
+        "seconds": statistics.median(s["seconds"] for s in samples),
+        "max_rss_mb": max(s["max_rss_mb"] for s in samples),
+        "modules": samples[-1]["modules"],
+        "heaviest": [{"package": name, "cumulative_ms": round(us / 1000, 1)} for name, us in heaviest],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3, help="fresh interpreters per entrypoint, the median is reported")
+    parser.add_argument("--top", type=int, default=10, help="heaviest top-level packages to list")
+    parser.add_argument("--only", help="substring of the deployment name")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, entrypoint in deployment_entrypoints().items():
+        if args.only and args.only.lower() not in name.lower():
+            continue
+        result = results[name] = measure_entrypoint(entrypoint, args.runs, args.top)
+        if "error" in result:
+            print(f"{name:<40} FAILED  {result['error']}")
+            continue
+        print(f"{name:<40} {result['seconds']:6.2f}s  {result['max_rss_mb']:7.1f} MB  {result['modules']:5d} modules")
+        for item in result["heaviest"]:
+            print(f"    {item['package']:<36} {item['cumulative_ms']:9.1f} ms")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Fill bronze_location_cache for every place in api_location_mapper.LOCATIONS,
+so hourly bronze runs don't make any geocoding requests.
+
+    python -m scripts.warm_location_cache
+"""
+from src.helpers.bronze.api_location_mapper import LOCATIONS
+from src.helpers.bronze.get_accuweather_location_id import get_accuweather_location_id_from_place_name
+from src.helpers.bronze.get_foreca_location_id import get_foreca_location_id_from_place_name
+from src.helpers.bronze.get_meteoblue_location import get_lat_lon_from_place_name
+from src.helpers.bronze.get_openweathermap_location import get_owm_lat_lon_from_place_name_iso_country_code
+from src.helpers.logging_helpers.combine_loggers_helper import get_logger
+
+LOOKUPS = {
+    "accuweather": (get_accuweather_location_id_from_place_name, lambda loc: (loc["name"],)),
+    "foreca": (get_foreca_location_id_from_place_name, lambda loc: (loc["name"],)),
+    "meteoblue": (get_lat_lon_from_place_name, lambda loc: (loc["name"], loc["country_name"])),
+    "openweathermap": (get_owm_lat_lon_from_place_name_iso_country_code,
+                       lambda loc: (loc["name"], loc["country_code"])),
+}
+
+
+def warm_location_cache(locations=LOCATIONS) -> dict[str, int]:
+    logger = get_logger()
+    failed = 0
+    resolved = 0
+    for loc in locations:
+        for provider, (lookup, args_for) in LOOKUPS.items():
+            args = args_for(loc)
+            try:
+                result = lookup.refresh(*args)
+            except Exception as e:  # one provider down shouldn't stop the rest
+                failed += 1
+                logger.warning(f"Warm-up failed | provider={provider} | query={args} | error={e}")
+                continue
+            resolved += 1
+            logger.info(f"Warm-up | provider={provider} | query={args} | result={result}")
+    return {"resolved": resolved, "failed": failed}
+
+
+if __name__ == "__main__":
+    print(warm_location_cache())
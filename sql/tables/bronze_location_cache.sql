@@ -0,0 +1,9 @@
+CREATE TABLE bronze_location_cache (
+    provider     TEXT        NOT NULL,   -- accuweather / foreca / meteoblue_search / openweathermap / weatherapi
+    lookup_key   TEXT        NOT NULL,   -- normalized JSON list of the lookup arguments
+    result       JSONB,                  -- location id or [lat, lon]; NULL for negative entries
+    is_negative  BOOLEAN     NOT NULL DEFAULT FALSE,
+    expires_at   TIMESTAMPTZ NOT NULL,
+    updated_at   TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (provider, lookup_key)
+);
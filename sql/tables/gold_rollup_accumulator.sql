@@ -0,0 +1,65 @@
+CREATE TABLE gold_rollup_accumulator (
+    grain              TEXT        NOT NULL,   -- weekly / monthly / seasonal / yearly
+    period_start       DATE        NOT NULL,
+    period_label       TEXT        NOT NULL,   -- week_28_2026 / july_2026 / summer_2026 / 2026
+    place_name         TEXT        NOT NULL,
+    partitions         INT         NOT NULL DEFAULT 0,
+    temp_sum           DOUBLE PRECISION NOT NULL DEFAULT 0,
+    temp_count         BIGINT      NOT NULL DEFAULT 0,
+    temp_min           DOUBLE PRECISION,
+    temp_max           DOUBLE PRECISION,
+    wind_speed_sum     DOUBLE PRECISION NOT NULL DEFAULT 0,
+    wind_speed_count   BIGINT      NOT NULL DEFAULT 0,
+    wind_speed_min     DOUBLE PRECISION,
+    wind_speed_max     DOUBLE PRECISION,
+    rain_sum           DOUBLE PRECISION NOT NULL DEFAULT 0,
+    rain_count         BIGINT      NOT NULL DEFAULT 0,
+    rain_min           DOUBLE PRECISION,
+    rain_max           DOUBLE PRECISION,
+    snow_sum           DOUBLE PRECISION NOT NULL DEFAULT 0,
+    snow_count         BIGINT      NOT NULL DEFAULT 0,
+    snow_min           DOUBLE PRECISION,
+    snow_max           DOUBLE PRECISION,
+    cloud_cover_sum    DOUBLE PRECISION NOT NULL DEFAULT 0,
+    cloud_cover_count  BIGINT      NOT NULL DEFAULT 0,
+    cloud_cover_min    DOUBLE PRECISION,
+    cloud_cover_max    DOUBLE PRECISION,
+    humidity_sum       DOUBLE PRECISION NOT NULL DEFAULT 0,
+    humidity_count     BIGINT      NOT NULL DEFAULT 0,
+    humidity_min       DOUBLE PRECISION,
+    humidity_max       DOUBLE PRECISION,
+    folded_dates       DATE[]      NOT NULL DEFAULT '{}',   -- days already folded in, makes a re-run a no-op
+    is_closed          BOOLEAN     NOT NULL DEFAULT FALSE,  -- set once the period summary is loaded
+    updated_at         TIMESTAMP   NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (grain, period_start, place_name)
+);
+
+-- Current (open or closed) period summaries straight from the accumulators
+CREATE VIEW gold_rollup_current AS
+SELECT
+    grain,
+    period_start,
+    period_label,
+    place_name,
+    temp_max,
+    temp_min,
+    ROUND((temp_sum / NULLIF(temp_count, 0))::NUMERIC, 2)               AS temp_avg,
+    wind_speed_max,
+    wind_speed_min,
+    ROUND((wind_speed_sum / NULLIF(wind_speed_count, 0))::NUMERIC, 2)   AS wind_speed_avg,
+    rain_max,
+    rain_min,
+    ROUND((rain_sum / NULLIF(rain_count, 0))::NUMERIC, 2)               AS rain_avg,
+    snow_max,
+    snow_min,
+    ROUND((snow_sum / NULLIF(snow_count, 0))::NUMERIC, 2)               AS snow_avg,
+    cloud_cover_max,
+    cloud_cover_min,
+    ROUND((cloud_cover_sum / NULLIF(cloud_cover_count, 0))::NUMERIC, 2) AS cloud_cover_avg,
+    humidity_max,
+    humidity_min,
+    ROUND((humidity_sum / NULLIF(humidity_count, 0))::NUMERIC, 2)       AS humidity_avg,
+    CARDINALITY(folded_dates)                                           AS days_folded,
+    is_closed,
+    updated_at
+FROM gold_rollup_accumulator;
@@ -1,6 +1,7 @@
 CREATE TABLE processing_state (
     processing_level   TEXT        NOT NULL,
     partition_date     DATE        NOT NULL,
+    period_name        TEXT,                   -- season label of gold_seasonal partitions (winter_2026)
     status             TEXT        NOT NULL,   -- pending / processing / success / failed / abandoned
     expected_count     INT,
     actual_count       INT,
@@ -11,9 +12,22 @@ CREATE TABLE processing_state (
     updated_at         TIMESTAMP   NOT NULL DEFAULT NOW(),
     error_type         TEXT,
     error_message      TEXT,
+    lease_owner        TEXT,                   -- worker that claimed the partition (claim_pending_work)
+    lease_expires_at   TIMESTAMPTZ,            -- after this an unfinished 'processing' row can be reclaimed
     PRIMARY KEY (processing_level, partition_date)
 );
 
 -- Optional: index for get_pending_work query pattern
 CREATE INDEX idx_processing_state_pending
-    ON processing_state (processing_level, status, retry_count);
\ No newline at end of file
+    ON processing_state (processing_level, status, retry_count);
+
+-- claim_pending_work: pending rows + expired leases of a level
+CREATE INDEX idx_processing_state_lease
+    ON processing_state (processing_level, lease_expires_at)
+    WHERE status = 'processing';
+
+-- existing databases:
+-- ALTER TABLE processing_state
+--     ADD COLUMN IF NOT EXISTS period_name      TEXT,
+--     ADD COLUMN IF NOT EXISTS lease_owner      TEXT,
+--     ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMPTZ;
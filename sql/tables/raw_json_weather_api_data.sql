@@ -0,0 +1,10 @@
+CREATE TABLE raw_json_weather_api_data (
+    id          BIGSERIAL   PRIMARY KEY,
+    source      TEXT        NOT NULL,   -- accuweather_api / meteoblue_api / ... (api label of the bronze run)
+    place_name  TEXT        NOT NULL,
+    payload     JSONB       NOT NULL,   -- provider response as received
+    ingest_date DATE        NOT NULL,
+    ingest_hour INT         NOT NULL CHECK (ingest_hour BETWEEN 0 AND 23),
+    created_at  TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    UNIQUE (source, place_name, ingest_date, ingest_hour)
+);
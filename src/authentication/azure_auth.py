@@ -1,10 +1,11 @@
-from azure.identity import ClientSecretCredential
-from azure.storage.filedatalake import DataLakeServiceClient
-
 def get_datalake_client(tenant_id, client_id, client_secret, account_url, file_system):
     """
     Create and return a Data Lake file system client.
     """
+    # the azure SDK takes ~0.5s to import, only pay for it when a client is actually built
+    from azure.identity import ClientSecretCredential
+    from azure.storage.filedatalake import DataLakeServiceClient
+
     credential = ClientSecretCredential(
         tenant_id=tenant_id,
         client_id=client_id,
@@ -12,4 +13,4 @@ def get_datalake_client(tenant_id, client_id, client_secret, account_url, file_s
     )
     service_client = DataLakeServiceClient(account_url=account_url, credential=credential)
     fs_client = service_client.get_file_system_client(file_system=file_system)
-    return fs_client
\ No newline at end of file
+    return fs_client
@@ -0,0 +1,128 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from src.clients import http_client
+from src.clients.http_client import HTTP_PROVIDERS
+
+"""
+Local stand-in for the weather APIs: one HTTP server answering every provider from recorded responses.
+
+    with fixture_server(locations, latency_ms=80) as server:   # HTTP_PROVIDERS point at the server
+        results = asyncio.run(extract_all_api_data(build_api_locations(locations)))
+
+Requests are routed by the first path segment, the provider key the base_url was rewritten to
+(http://127.0.0.1:<port>/<provider>/...). Forecast routes return fixtures/<provider>.json for any
+location, geocoding routes answer from the benchmark locations, so the location helpers and their
+cache run unchanged. latency_ms is added to every response to stand in for the network round trip.
+"""
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures"
+
+# forecast payload of every provider in api_data_parsers
+FIXTURE_PROVIDERS = ["open_meteo", "foreca", "accuweather", "meteoblue", "weatherbit", "tomorrow", "openweathermap",
+                     "weatherapi"]
+
+
+def load_fixtures(fixture_dir: Path = FIXTURE_DIR) -> dict[str, bytes]:
+    """{provider: recorded response body}, replace a file with a fresh recording to benchmark on it."""
+    return {provider: (fixture_dir / f"{provider}.json").read_bytes() for provider in FIXTURE_PROVIDERS}
+
+
+def _geocode(provider: str, path: str, params: dict, locations: dict[str, dict]):
+    """Answer of a location lookup, None when the path is not a geocoding route of the provider."""
+    if provider == "accuweather" and path == "/locations/v1/cities/search":
+        loc = locations.get(params.get("q", "").lower())
+        return [{"Key": str(loc["key"]), "LocalizedName": loc["name"]}] if loc else []
+    if provider == "meteoblue_search" and path == "/en/server/search/query3":
+        loc = locations.get(params.get("query", "").lower())
+        return {"results": [{"name": loc["name"], "country": loc["country_name"], "lat": loc["lat"],
+                             "lon": loc["lon"]}] if loc else []}
+    if provider == "openweathermap" and path == "/geo/1.0/direct":
+        loc = locations.get(params.get("q", "").split(",")[0].lower())
+        return [{"name": loc["name"], "lat": loc["lat"], "lon": loc["lon"], "country": loc["country_code"]}] if loc else []
+    if provider == "foreca" and path.startswith("/api/v1/location/search/"):
+        loc = locations.get(unquote(path.rsplit("/", 1)[-1]).lower())
+        return {"locations": [{"id": loc["key"], "name": loc["name"], "lat": loc["lat"], "lon": loc["lon"]}]
+                if loc else []}
+    return None
+
+
+class FixtureServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, locations: list[dict], latency_ms: float = 0, fixtures: dict[str, bytes] | None = None):
+        super().__init__(("127.0.0.1", 0), _FixtureHandler)
+        self.fixtures = fixtures or load_fixtures()
+        self.latency_ms = latency_ms
+        self.locations = {loc["name"].lower(): {**loc, "key": 100000 + i} for i, loc in enumerate(locations)}
+        self.requests = 0
+        self._count_lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def count_request(self):
+        with self._count_lock:
+            self.requests += 1
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the pooled clients expect
+    disable_nagle_algorithm = True  # headers and body are separate writes, don't wait for the delayed ACK
+
+    def do_GET(self):
+        server: FixtureServer = self.server
+        server.count_request()
+        if server.latency_ms:
+            time.sleep(server.latency_ms / 1000)
+
+        url = urlsplit(self.path)
+        provider, _, rest = url.path.lstrip("/").partition("/")
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        answer = _geocode(provider, "/" + rest, params, server.locations)
+        if answer is not None:
+            self._send(200, json.dumps(answer).encode())
+        elif provider == "meteoblue_search":
+            self._send(404, b'{"error": "unknown route"}')
+        elif provider in server.fixtures:
+            self._send(200, server.fixtures[provider])
+        else:
+            self._send(404, b'{"error": "unknown provider"}')
+
+    def _send(self, status: int, body: bytes):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # one line per request would drown the benchmark output
+
+
+@contextmanager
+def fixture_server(locations: list[dict], latency_ms: float = 0, fixtures: dict[str, bytes] | None = None):
+    """Serve the fixtures and point every HTTP_PROVIDERS base_url at the server for the block."""
+    server = FixtureServer(locations, latency_ms, fixtures)
+    thread = threading.Thread(target=server.serve_forever, name="fixture-server", daemon=True)
+    thread.start()
+
+    original = {provider: settings["base_url"] for provider, settings in HTTP_PROVIDERS.items()}
+    http_client.close_http_clients()  # pooled sync clients still carry the real base_url
+    for provider, settings in HTTP_PROVIDERS.items():
+        settings["base_url"] = f"{server.url}/{provider}"
+    try:
+        yield server
+    finally:
+        for provider, base_url in original.items():
+            HTTP_PROVIDERS[provider]["base_url"] = base_url
+        http_client.close_http_clients()
+        server.shutdown()
+        server.server_close()
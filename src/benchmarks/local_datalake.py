@@ -0,0 +1,197 @@
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
+
+from src.clients import datalake_client
+
+"""
+Local-filesystem stand-in for the ADLS FileSystemClient, the subset the workers call:
+
+    fs_client.get_directory_client(path) / get_file_client(path) / get_paths(path=, recursive=)
+    directory_client.create_directory() / get_file_client(name) / get_paths()
+    file_client.exists() / create_file() / append_data(data, offset, length) / flush_data(length)
+    file_client.download_file().readall() / .properties.etag / get_file_properties().etag / upload_data()
+    file_client.delete_file()
+
+Paths map to files under a root directory. Like ADLS, appended data is only visible after
+flush_data, and flushing replaces the file atomically, so concurrent readers never see half a blob.
+Missing paths raise the azure ResourceNotFoundError the workers already handle.
+
+    with local_datalake() as lake:     # temp root, module level fs_client points at it for the block
+        load_silver_data_to_azure_worker(df)
+"""
+
+
+def _etag(stat: os.stat_result) -> str:
+    return f'"0x{stat.st_mtime_ns:X}{stat.st_size:X}"'
+
+
+def _as_bytes(data) -> bytes:
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return bytes(data)
+    if isinstance(data, str):
+        return data.encode("utf-8")
+    if hasattr(data, "read"):
+        return data.read()
+    return b"".join(data)
+
+
+class _Download:
+    def __init__(self, content: bytes, properties):
+        self._content = content
+        self.properties = properties
+
+    def readall(self) -> bytes:
+        return self._content
+
+    def readinto(self, stream) -> int:
+        stream.write(self._content)
+        return len(self._content)
+
+
+class LocalFileClient:
+    def __init__(self, root: Path, path: str):
+        self.path_name = path.strip("/")
+        self._file = root / self.path_name
+        self._staged = bytearray()
+
+    def exists(self) -> bool:
+        return self._file.is_file()
+
+    def create_file(self, **kwargs):
+        self._file.parent.mkdir(parents=True, exist_ok=True)
+        self._file.write_bytes(b"")
+        self._staged = bytearray()
+
+    def append_data(self, data, offset: int, length: int = None, **kwargs):
+        chunk = _as_bytes(data)
+        if length is not None:
+            chunk = chunk[:length]
+        if offset != len(self._staged):
+            raise ValueError(f"append_data at offset {offset}, {len(self._staged)} bytes are staged")
+        self._staged += chunk
+
+    def flush_data(self, offset: int, **kwargs):
+        self._file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self._file.parent, prefix=f".{self._file.name}.")
+        with os.fdopen(fd, "wb") as f:
+            f.write(self._staged[:offset])
+        os.replace(tmp, self._file)
+        self._staged = bytearray()
+
+    def upload_data(self, data, overwrite: bool = False, **kwargs):
+        if self.exists() and not overwrite:
+            raise ResourceExistsError(f"The specified path already exists: {self.path_name}")
+        content = _as_bytes(data)
+        self._staged = bytearray()
+        self.append_data(content, offset=0)
+        self.flush_data(len(content))
+
+    def download_file(self, **kwargs) -> _Download:
+        try:
+            with open(self._file, "rb") as f:  # content and properties of the same file, even if it is replaced
+                return _Download(f.read(), self._properties(os.fstat(f.fileno())))
+        except FileNotFoundError:
+            raise ResourceNotFoundError(f"The specified path does not exist: {self.path_name}") from None
+
+    def get_file_properties(self, **kwargs):
+        try:
+            return self._properties(self._file.stat())
+        except FileNotFoundError:
+            raise ResourceNotFoundError(f"The specified path does not exist: {self.path_name}") from None
+
+    def _properties(self, stat: os.stat_result):
+        return SimpleNamespace(name=self.path_name, etag=_etag(stat), size=stat.st_size,
+                               last_modified=datetime.fromtimestamp(stat.st_mtime, timezone.utc))
+
+    def delete_file(self, **kwargs):
+        try:
+            self._file.unlink()
+        except FileNotFoundError:
+            raise ResourceNotFoundError(f"The specified path does not exist: {self.path_name}") from None
+
+
+class LocalDirectoryClient:
+    def __init__(self, file_system: "LocalFileSystemClient", path: str):
+        self._file_system = file_system
+        self.path_name = path.strip("/")
+
+    def create_directory(self, **kwargs):
+        # ADLS creates the directory again without complaint, the uploaders also accept ResourceExistsError
+        (self._file_system.root / self.path_name).mkdir(parents=True, exist_ok=True)
+
+    def exists(self) -> bool:
+        return (self._file_system.root / self.path_name).is_dir()
+
+    def get_file_client(self, file_name: str) -> LocalFileClient:
+        return self._file_system.get_file_client(f"{self.path_name}/{file_name}")
+
+    def get_paths(self, recursive: bool = True, **kwargs):
+        return self._file_system.get_paths(path=self.path_name, recursive=recursive)
+
+
+class LocalFileSystemClient:
+    def __init__(self, root, account_name: str = "localbench", file_system_name: str = "bench"):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.account_name = account_name
+        self.file_system_name = file_system_name
+        self.url = self.root.as_uri()
+
+    def get_directory_client(self, path: str) -> LocalDirectoryClient:
+        return LocalDirectoryClient(self, path)
+
+    def get_file_client(self, path: str) -> LocalFileClient:
+        return LocalFileClient(self.root, path)
+
+    def get_paths(self, path: str = None, recursive: bool = True, **kwargs):
+        """Path items (name relative to the file system, is_directory, etag, content_length) in name order."""
+        base = self.root / path.strip("/") if path else self.root
+        if not base.is_dir():
+            raise ResourceNotFoundError(f"The specified path does not exist: {path}")
+
+        entries = base.rglob("*") if recursive else base.iterdir()
+        items = []
+        for entry in entries:
+            if entry.name.startswith("."):  # flush_data temp files
+                continue
+            stat = entry.stat()
+            items.append(SimpleNamespace(
+                name=entry.relative_to(self.root).as_posix(),
+                is_directory=entry.is_dir(),
+                etag=_etag(stat),
+                content_length=0 if entry.is_dir() else stat.st_size,
+                last_modified=datetime.fromtimestamp(stat.st_mtime, timezone.utc),
+            ))
+        return iter(sorted(items, key=lambda item: item.name))
+
+    def usage_bytes(self) -> int:
+        return sum(f.stat().st_size for f in self.root.rglob("*") if f.is_file())
+
+    def __repr__(self):
+        return f"<LocalFileSystemClient {self.root}>"
+
+
+@contextmanager
+def local_datalake(root=None):
+    """
+    A LocalFileSystemClient, also installed as the process-wide fs_client for the block
+    (workers that import fs_client from src.clients.datalake_client write to it too).
+    Without a root a temp directory is used and removed afterwards.
+    """
+    owned = root is None
+    root = Path(tempfile.mkdtemp(prefix="etl-bench-lake-")) if owned else Path(root)
+    lake = LocalFileSystemClient(root)
+    previous = datalake_client.set_fs_client(lake)
+    try:
+        yield lake
+    finally:
+        datalake_client.set_fs_client(previous)
+        if owned:
+            shutil.rmtree(root, ignore_errors=True)
@@ -0,0 +1,117 @@
+import os
+import tempfile
+import uuid
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+
+import psycopg
+from decouple import config
+from psycopg import sql
+from psycopg.conninfo import make_conninfo
+from sqlalchemy.engine import make_url
+
+from src.clients.postgres_client import close_pg_clients
+
+"""
+Disposable Postgres database for the offline benchmarks.
+
+    with disposable_database() as db:     # DB_CONN_RAW points at a fresh database with sql/tables applied
+        copy_silver_data_to_postgres_worker(df)
+        db.truncate()                     # empty the data tables between runs
+
+The database is created next to an existing server (BENCH_PG_ADMIN_DSN, a role allowed to CREATE
+DATABASE) and dropped afterwards. Without one, a throwaway server is started in a temp directory when
+the pgserver package is installed (requirements-dev.txt). SQLite is not an option, the loaders rely on
+COPY, ON CONFLICT, unnest and jsonb.
+"""
+
+SQL_TABLES_DIR = Path(__file__).resolve().parents[2] / "sql" / "tables"
+
+# server the scratch database is created on, e.g. postgresql://postgres@localhost:5432/postgres
+BENCH_PG_ADMIN_DSN = config("BENCH_PG_ADMIN_DSN", default="")
+
+# caches that should stay warm across benchmark runs, like they are between hourly runs in production
+KEEP_ON_TRUNCATE = {"bronze_location_cache"}
+
+
+class DisposableDatabase:
+    def __init__(self, dsn: str):
+        self.dsn = dsn
+
+    def apply_schema(self, tables_dir: Path = SQL_TABLES_DIR):
+        with psycopg.connect(self.dsn, autocommit=True) as conn:
+            for path in sorted(tables_dir.glob("*.sql")):
+                conn.execute(path.read_text(encoding="utf-8"))
+
+    def tables(self) -> list[str]:
+        with psycopg.connect(self.dsn) as conn:
+            rows = conn.execute(
+                "SELECT tablename FROM pg_tables WHERE schemaname = current_schema() ORDER BY tablename"
+            ).fetchall()
+        return [name for name, in rows]
+
+    def truncate(self, keep: set[str] = KEEP_ON_TRUNCATE):
+        tables = [name for name in self.tables() if name not in keep]
+        if not tables:
+            return
+        with psycopg.connect(self.dsn, autocommit=True) as conn:
+            conn.execute(sql.SQL("TRUNCATE {} RESTART IDENTITY").format(
+                sql.SQL(", ").join(sql.Identifier(name) for name in tables)))
+
+    def count(self, table: str) -> int:
+        with psycopg.connect(self.dsn) as conn:
+            return conn.execute(sql.SQL("SELECT COUNT(*) FROM {}").format(sql.Identifier(table))).fetchone()[0]
+
+
+@contextmanager
+def _scratch_server():
+    """Admin DSN of a throwaway server (pgserver), stopped and deleted on exit."""
+    try:
+        import pgserver
+    except ImportError:
+        raise RuntimeError(
+            "No Postgres for the benchmark: set BENCH_PG_ADMIN_DSN or pip install -r requirements-dev.txt"
+        ) from None
+
+    with tempfile.TemporaryDirectory(prefix="etl-bench-pg-") as pgdata:
+        server = pgserver.get_server(pgdata, cleanup_mode="stop")
+        try:
+            yield server.get_uri()
+        finally:
+            server.cleanup()
+
+
+@contextmanager
+def disposable_database(admin_dsn: str = BENCH_PG_ADMIN_DSN):
+    """
+    Fresh database with the sql/tables schema, DB_CONN_RAW points at it for the block
+    (the shared pool and engine are rebuilt on it), dropped on exit.
+    """
+    with (_scratch_server() if not admin_dsn else nullcontext(admin_dsn)) as server_dsn:
+        name = f"etl_bench_{uuid.uuid4().hex[:12]}"
+        with psycopg.connect(server_dsn, autocommit=True) as conn:
+            conn.execute(sql.SQL("CREATE DATABASE {}").format(sql.Identifier(name)))
+
+        db = DisposableDatabase(make_conninfo(server_dsn, dbname=name))
+        previous = os.environ.get("DB_CONN_RAW")
+        try:
+            db.apply_schema()
+            close_pg_clients()
+            os.environ["DB_CONN_RAW"] = _as_url(server_dsn, name)
+            yield db
+        finally:
+            close_pg_clients()
+            if previous is None:
+                os.environ.pop("DB_CONN_RAW", None)
+            else:
+                os.environ["DB_CONN_RAW"] = previous
+            with psycopg.connect(server_dsn, autocommit=True) as conn:
+                conn.execute(sql.SQL("DROP DATABASE IF EXISTS {} WITH (FORCE)").format(sql.Identifier(name)))
+
+
+def _as_url(server_dsn: str, dbname: str) -> str:
+    """DB_CONN_RAW is read by both psycopg and SQLAlchemy, so it has to stay a postgresql:// URL."""
+    if not server_dsn.startswith("postgres"):
+        raise ValueError("BENCH_PG_ADMIN_DSN must be a postgresql:// URL")
+    url = make_url(server_dsn.replace("postgres://", "postgresql://", 1))
+    return url.set(database=dbname).render_as_string(hide_password=False)
@@ -0,0 +1,191 @@
+import asyncio
+import statistics
+import time
+
+import pandas as pd
+import pendulum
+from decouple import config
+
+from src.benchmarks.fixture_server import fixture_server, load_fixtures
+from src.benchmarks.local_datalake import local_datalake
+from src.benchmarks.local_postgres import disposable_database
+from src.helpers.bronze.api_location_mapper import build_api_locations
+from src.helpers.bronze.extract_tasks_mapper import api_workers
+from src.helpers.bronze.json_codec import decode_payload
+from src.workers.bronze.async_extraction_engine import extract_all_api_data
+from src.workers.bronze.load_raw_data_from_weather_APIs_to_Azure_workers import upload_bronze_bundle
+from src.workers.bronze.load_raw_data_from_weather_APIs_to_local_postgres_workers import \
+    load_raw_api_data_batch_to_postgres
+from src.workers.gold.rollup_accumulators import fold_daily_state
+from src.workers.gold.rollup_engine import build_rollup_state, upload_rollup_state
+from src.workers.gold.transform_gold_data import get_daily_summ_data_worker, get_weekly_summ_from_states_worker
+from src.workers.gold.transform_silver_data import get_df_data
+from src.workers.silver.compiled_cleaning_workers import clean_silver_df_compiled
+from src.workers.silver.extract_bronze_data_for_transformation import download_bronze_bundle_from_adls_worker
+from src.workers.silver.load_transformed_data_to_azure import load_silver_data_to_azure_worker
+from src.workers.silver.load_transformed_data_to_local_postgres import copy_silver_data_to_postgres_worker
+from src.workers.silver.transform_bronze_data import parse_records_from_api
+
+"""
+Offline throughput benchmark of the bronze -> silver -> gold workers, no Azure, APIs or shared Postgres.
+
+    results = run_pipeline_benchmark([10, 100], runs=3)
+
+For every location count the workers run against the stand-ins (fixture_server, local_datalake,
+disposable_database) in the order the flows call them:
+
+    bronze  extract (async engine, every provider with a worker) -> bronze bundle to the lake -> raw rows to Postgres
+    silver  bundle from the lake -> parse -> clean -> Parquet to the lake -> COPY to Postgres
+    gold    daily gold rows per forecast day -> daily summaries -> rollup states to the lake
+            -> fold into the Postgres accumulators -> weekly summary from the states
+
+Every run starts on an empty lake and empty tables (the geocoding cache stays warm, like between hourly
+runs), so runs are comparable; `warmup` runs are done first and not reported. Providers the bronze
+engine has no worker for yet (api_data_parsers has more) are added to the silver input from their
+fixtures, so every parser is measured.
+
+Flows, Prefect and the Pushgateway are not involved - this measures the work, not the orchestration.
+"""
+
+# the ingest hour every run writes, the forecast fixtures start on this day
+BENCH_INGEST_TIME = pendulum.datetime(2026, 1, 5, 7, tz="UTC")
+BASE_DIR_RAW = config("BASE_DIR_RAW", default="bench/raw")
+
+# stage whose row count is the throughput of the layer: API responses, cleaned silver rows, hourly gold rows
+LAYER_ROWS_STAGE = {"bronze": "extract", "silver": "clean", "gold": "daily_rows"}
+
+
+def bench_locations(count: int) -> list[dict]:
+    """`count` distinct places in build_api_locations shape, spread over a lat/lon grid."""
+    return [
+        {
+            "name": f"Bench-{i:05d}",
+            "lat": round(41.0 + (i // 100) * 0.05, 4),
+            "lon": round(22.5 + (i % 100) * 0.05, 4),
+            "country_code": "BG",
+            "country_name": "Bulgaria",
+        }
+        for i in range(count)
+    ]
+
+
+class _Stages:
+    """Wall time and row count of each stage of one run."""
+
+    def __init__(self):
+        self.timings = {}
+
+    def run(self, name: str, fn, *args, rows=None, **kwargs):
+        start = time.perf_counter()
+        result = fn(*args, **kwargs)
+        seconds = time.perf_counter() - start
+        self.timings[name] = {"seconds": seconds, "rows": rows(result) if callable(rows) else rows}
+        return result
+
+
+def _unwired_provider_records(locations: list[dict], date_str: str, hour: int) -> list[dict]:
+    fixtures = load_fixtures()
+    sources = [provider for provider in fixtures if provider not in api_workers]
+    return [
+        {"source": source, "place_name": loc["name"], "ingest_date": date_str, "ingest_hour": hour,
+         "payload": decode_payload(source, fixtures[source])}
+        for source in sources
+        for loc in locations
+    ]
+
+
+def run_bronze(stages: _Stages, locations: list[dict], lake, now: pendulum.DateTime) -> list[dict]:
+    date_str, hour_str = now.format("YYYY-MM-DD"), now.format("HH")
+
+    results = stages.run("extract", asyncio.run,
+                         extract_all_api_data(build_api_locations(locations), retries=0),
+                         rows=lambda r: sum(1 for item in r if item["data"] is not None))
+    failed = [f"{r['api_name']}/{r['label']}: {r['error']}" for r in results if r["error"]]
+    if failed:
+        raise RuntimeError(f"{len(failed)} fixture requests failed, first: {failed[0]}")
+
+    stages.run("to_lake", upload_bronze_bundle, lake, BASE_DIR_RAW, date_str, hour_str, results, rows=len(results))
+    stages.run("to_postgres", load_raw_api_data_batch_to_postgres, results, now, rows=len(results))
+    return results
+
+
+def run_silver(stages: _Stages, locations: list[dict], lake, now: pendulum.DateTime) -> pd.DataFrame:
+    date_str, hour_str = now.format("YYYY-MM-DD"), now.format("HH")
+
+    records = stages.run("from_lake", download_bronze_bundle_from_adls_worker, lake, BASE_DIR_RAW, date_str, hour_str,
+                         rows=len)
+    records += _unwired_provider_records(locations, date_str, now.hour)
+
+    silver_df = stages.run("parse", parse_records_from_api, records, rows=len)
+    cleaned_df, _ = stages.run("clean", clean_silver_df_compiled, silver_df, rows=len(silver_df))
+    stages.run("to_lake", load_silver_data_to_azure_worker, cleaned_df, rows=len(cleaned_df))
+    stages.run("to_postgres", copy_silver_data_to_postgres_worker, cleaned_df, rows=lambda r: r["inserted"])
+    return cleaned_df
+
+
+def run_gold(stages: _Stages, silver_df: pd.DataFrame, lake, now: pendulum.DateTime) -> None:
+    forecast_days = sorted(set(pd.to_datetime(silver_df["forecast_date_utc"]).dt.date))
+    day_partitions = [(pendulum.datetime(d.year, d.month, d.day, tz="UTC"), silver_df) for d in forecast_days]
+
+    gold_days = stages.run("daily_rows", get_df_data, day_partitions, now,
+                           rows=lambda r: sum(len(df) for _, df in r))
+    stages.run("daily_summaries", get_daily_summ_data_worker, gold_days, rows=lambda r: sum(len(df) for _, df in r))
+
+    day_states = stages.run("rollup_states", lambda: [(ts, build_rollup_state(df)) for ts, df in gold_days],
+                            rows=lambda r: sum(len(state) for _, state in r))
+    stages.run("states_to_lake", lambda: [upload_rollup_state(lake, "daily", ts, state) for ts, state in day_states],
+               rows=len(day_states))
+    stages.run("fold_accumulators",
+               lambda: sum(fold_daily_state(ts, state)["folded"] for ts, state in day_states),
+               rows=lambda folded: folded)
+
+    week_start = now.start_of("week")
+    week_states = [state for ts, state in day_states if ts.start_of("week") == week_start]
+    stages.run("weekly_rollup", get_weekly_summ_from_states_worker, week_start, week_states, rows=lambda r: len(r[0]))
+
+
+def _summarize(runs: list[dict]) -> dict:
+    """Per layer and stage: median seconds, slowest run, rows and rows/sec at the median."""
+    summary = {}
+    for layer in runs[0]:
+        stages = {}
+        for stage in runs[0][layer]:
+            samples = [run[layer][stage]["seconds"] for run in runs]
+            seconds = statistics.median(samples)
+            rows = runs[-1][layer][stage]["rows"]
+            stages[stage] = {"seconds": seconds, "max_seconds": max(samples), "rows": rows,
+                             "rows_per_sec": rows / seconds if rows is not None and seconds > 0 else None}
+
+        totals = [sum(s["seconds"] for s in run[layer].values()) for run in runs]
+        rows = stages[LAYER_ROWS_STAGE[layer]]["rows"]
+        seconds = statistics.median(totals)
+        summary[layer] = {"seconds": seconds, "max_seconds": max(totals), "rows": rows,
+                          "rows_per_sec": rows / seconds if seconds > 0 else None, "stages": stages}
+    return summary
+
+
+def run_pipeline_benchmark(location_counts: list[int], runs: int = 3, warmup: int = 1, api_latency_ms: float = 0,
+                           admin_dsn: str = None, progress=None) -> dict:
+    """
+    {location count: {"bronze" | "silver" | "gold": {"seconds", "max_seconds", "rows", "rows_per_sec", "stages"}}}
+    admin_dsn overrides BENCH_PG_ADMIN_DSN, progress(count, run, total) is called before every run.
+    """
+    results = {}
+    with disposable_database(**({"admin_dsn": admin_dsn} if admin_dsn else {})) as db:
+        for count in location_counts:
+            locations = bench_locations(count)
+            measured = []
+            with fixture_server(locations, latency_ms=api_latency_ms):
+                for run in range(warmup + runs):
+                    if progress is not None:
+                        progress(count, run, warmup + runs)
+                    db.truncate()
+                    layers = {"bronze": _Stages(), "silver": _Stages(), "gold": _Stages()}
+                    with local_datalake() as lake:
+                        run_bronze(layers["bronze"], locations, lake, BENCH_INGEST_TIME)
+                        silver_df = run_silver(layers["silver"], locations, lake, BENCH_INGEST_TIME)
+                        run_gold(layers["gold"], silver_df, lake, BENCH_INGEST_TIME)
+                    if run >= warmup:
+                        measured.append({layer: stages.timings for layer, stages in layers.items()})
+            results[count] = _summarize(measured)
+    return results
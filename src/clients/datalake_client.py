@@ -1,11 +1,64 @@
+import os
+import threading
+
 from decouple import config
 
 from src.authentication.azure_auth import get_datalake_client
 
-fs_client = get_datalake_client(
-    tenant_id=config("TENANT_ID"),
-    client_id=config("CLIENT_ID"),
-    client_secret=config("CLIENT_SECRET"),
-    account_url=config("ACCOUNT_URL"),
-    file_system=config("FILE_SYSTEM")
-)
\ No newline at end of file
+"""
+Process-wide ADLS file system client, built on first use instead of at import.
+
+    get_fs_client() - the FileSystemClient, created once per process (credential + service client)
+    fs_client       - stand-in for it, so `from src.clients.datalake_client import fs_client` and
+                      defaults like azure_fs_client=fs_client cost nothing until a blob is touched
+
+Importing a flow or task module no longer imports the azure SDK or reads the credentials.
+A forked child builds its own client, the parent's sessions are not reused across processes.
+"""
+
+_client = None
+_owner_pid = None
+_lock = threading.Lock()
+
+
+def get_fs_client():
+    global _client, _owner_pid
+    with _lock:
+        if _client is None or _owner_pid != os.getpid():
+            _client = get_datalake_client(
+                tenant_id=config("TENANT_ID"),
+                client_id=config("CLIENT_ID"),
+                client_secret=config("CLIENT_SECRET"),
+                account_url=config("ACCOUNT_URL"),
+                file_system=config("FILE_SYSTEM")
+            )
+            _owner_pid = os.getpid()
+        return _client
+
+
+def set_fs_client(client):
+    """
+    Use `client` as this process's FileSystemClient (the offline benchmarks point it at a local stand-in).
+    Returns the client it replaced, None to go back to building the real one on first use.
+    """
+    global _client, _owner_pid
+    with _lock:
+        previous = _client
+        _client = client
+        _owner_pid = os.getpid() if client is not None else None
+        return previous
+
+
+class _LazyFileSystemClient:
+    """Forwards every attribute to get_fs_client()."""
+
+    def __getattr__(self, name):
+        if name.startswith("__"):  # copy/pickle/inspect probes shouldn't build the client
+            raise AttributeError(name)
+        return getattr(get_fs_client(), name)
+
+    def __repr__(self):
+        return f"<lazy FileSystemClient{' (not created)' if _client is None else ''}>"
+
+
+fs_client = _LazyFileSystemClient()
@@ -0,0 +1,111 @@
+import asyncio
+import atexit
+import os
+import threading
+
+import httpx
+from decouple import config
+
+# One pooled keep-alive client per provider host, reused by the extract workers and the location resolvers.
+# http2 is negotiated through ALPN, hosts that only talk HTTP/1.1 silently fall back to keep-alive 1.1.
+# gzip/deflate are always decoded by httpx, br is decoded when the brotli package is installed.
+# Timeouts can be overridden per provider: HTTP_<PROVIDER>_CONNECT_TIMEOUT / HTTP_<PROVIDER>_READ_TIMEOUT
+HTTP_PROVIDERS = {
+    "foreca": {"base_url": "https://pfa.foreca.com", "http2": True, "connect_timeout": 5.0, "read_timeout": 20.0},
+    "accuweather": {"base_url": "https://dataservice.accuweather.com", "http2": True,
+                    "connect_timeout": 5.0, "read_timeout": 20.0},
+    "meteoblue": {"base_url": "https://my.meteoblue.com", "http2": True, "connect_timeout": 5.0, "read_timeout": 30.0},
+    "meteoblue_search": {"base_url": "https://www.meteoblue.com", "http2": True,
+                         "connect_timeout": 5.0, "read_timeout": 15.0},
+    "tomorrow": {"base_url": "https://api.tomorrow.io", "http2": True, "connect_timeout": 5.0, "read_timeout": 20.0},
+    "openweathermap": {"base_url": "https://api.openweathermap.org", "http2": True,
+                       "connect_timeout": 5.0, "read_timeout": 20.0},
+    "weatherapi": {"base_url": "https://api.weatherapi.com", "http2": True, "connect_timeout": 5.0, "read_timeout": 20.0},
+    "open_meteo": {"base_url": "https://api.open-meteo.com", "http2": True, "connect_timeout": 5.0, "read_timeout": 20.0},
+}
+
+HTTP_MAX_CONNECTIONS = config("HTTP_MAX_CONNECTIONS", default=20, cast=int)
+HTTP_MAX_KEEPALIVE_CONNECTIONS = config("HTTP_MAX_KEEPALIVE_CONNECTIONS", default=10, cast=int)
+HTTP_KEEPALIVE_EXPIRY_SECONDS = config("HTTP_KEEPALIVE_EXPIRY_SECONDS", default=60, cast=float)
+
+_lock = threading.Lock()
+_clients: dict[str, httpx.Client] = {}
+_async_clients: dict[tuple[str, int], httpx.AsyncClient] = {}
+_owner_pid = os.getpid()
+
+
+def _client_kwargs(provider: str) -> dict:
+    settings = HTTP_PROVIDERS[provider]
+    prefix = f"HTTP_{provider.upper()}"
+    connect_timeout = config(f"{prefix}_CONNECT_TIMEOUT", default=settings["connect_timeout"], cast=float)
+    read_timeout = config(f"{prefix}_READ_TIMEOUT", default=settings["read_timeout"], cast=float)
+
+    return {
+        "base_url": settings["base_url"],
+        "http2": settings["http2"],
+        "timeout": httpx.Timeout(read_timeout, connect=connect_timeout),
+        "limits": httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+        "headers": {"accept": "application/json"},
+        "follow_redirects": True,
+    }
+
+
+def _reset_after_fork():
+    """Sockets are not shared with a forked child, it starts with its own empty pools."""
+    global _owner_pid
+    if os.getpid() != _owner_pid:
+        _clients.clear()
+        _async_clients.clear()
+        _owner_pid = os.getpid()
+
+
+def get_http_client(provider: str) -> httpx.Client:
+    """Return the process-wide sync client for a provider, created on first use."""
+    with _lock:
+        _reset_after_fork()
+        client = _clients.get(provider)
+        if client is None or client.is_closed:
+            client = httpx.Client(**_client_kwargs(provider))
+            _clients[provider] = client
+        return client
+
+
+def get_async_http_client(provider: str) -> httpx.AsyncClient:
+    """
+    Return the async client for a provider bound to the running event loop.
+    An AsyncClient can't outlive its loop, so call aclose_async_http_clients() before the loop ends.
+    """
+    key = (provider, id(asyncio.get_running_loop()))
+    with _lock:
+        _reset_after_fork()
+        client = _async_clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(**_client_kwargs(provider))
+            _async_clients[key] = client
+        return client
+
+
+async def aclose_async_http_clients():
+    """Close the async clients of the running event loop."""
+    loop_id = id(asyncio.get_running_loop())
+    with _lock:
+        keys = [key for key in _async_clients if key[1] == loop_id]
+        clients = [_async_clients.pop(key) for key in keys]
+    for client in clients:
+        await client.aclose()
+
+
+def close_http_clients():
+    """Close the sync pools, registered to run at interpreter exit."""
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+
+atexit.register(close_http_clients)
@@ -0,0 +1,164 @@
+import hashlib
+import os
+import tempfile
+import threading
+from io import BytesIO
+
+import pandas as pd
+from decouple import config
+
+from src.helpers.lazy_imports import lazy_module
+from src.helpers.logging_helpers.combine_loggers_helper import get_logger
+
+"""
+Local disk cache for Parquet blobs read from ADLS (silver hours, gold daily/monthly summaries, rollup states).
+
+Entries are content addressed: the file name is sha256(blob path + etag), so an overwritten blob gets
+a new etag and simply misses, there is nothing to invalidate. The etag comes from the directory listing
+when the caller has it, otherwise from a properties (HEAD) request - a warm read costs that one small
+request instead of the whole download. A miss is stored under the etag returned with the download, so
+a blob replaced between the lookup and the download never ends up under the old etag.
+
+The cache directory is shared by all flows/processes on the machine: entries are written to a temp
+file and renamed into place, the least recently used entries (file mtime, bumped on every hit) are
+removed once PARQUET_CACHE_MAX_BYTES is exceeded. With PARQUET_CACHE_MMAP the Parquet file is
+memory-mapped from the cache instead of read into a buffer.
+"""
+
+pq = lazy_module("pyarrow.parquet")  # only the mmap read path needs it
+
+PARQUET_CACHE_ENABLED = config("PARQUET_CACHE_ENABLED", default=True, cast=bool)
+# empty -> <system temp dir>/etl_parquet_cache
+PARQUET_CACHE_DIR = config("PARQUET_CACHE_DIR", default="") or os.path.join(tempfile.gettempdir(), "etl_parquet_cache")
+PARQUET_CACHE_MAX_BYTES = config("PARQUET_CACHE_MAX_BYTES", default=2 * 1024 ** 3, cast=int)  # 2 GiB
+PARQUET_CACHE_MMAP = config("PARQUET_CACHE_MMAP", default=False, cast=bool)
+
+_lock = threading.Lock()
+_cached_bytes: int | None = None  # running size of the cache dir, scanned on first write
+
+
+def _entry_path(file_path: str, etag: str) -> str:
+    digest = hashlib.sha256(f"{file_path}|{etag}".encode()).hexdigest()
+    return os.path.join(PARQUET_CACHE_DIR, f"{digest}.parquet")
+
+
+def _entries() -> list[os.DirEntry]:
+    try:
+        return [e for e in os.scandir(PARQUET_CACHE_DIR) if e.is_file() and e.name.endswith(".parquet")]
+    except FileNotFoundError:
+        return []
+
+
+def _evict():
+    """Drop least recently used entries until the cache fits the budget. Caller holds _lock."""
+    global _cached_bytes
+    entries = []
+    for entry in _entries():
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:  # evicted by another process
+            continue
+        entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+    _cached_bytes = sum(size for _, size, _ in entries)
+    evicted = 0
+    for _, size, path in sorted(entries):
+        if _cached_bytes <= PARQUET_CACHE_MAX_BYTES:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        _cached_bytes -= size
+        evicted += 1
+
+    if evicted:
+        get_logger().debug(f"Parquet cache evicted {evicted} entries", extra={"cache_bytes": _cached_bytes})
+
+
+def _store(entry_path: str, data: bytes):
+    global _cached_bytes
+    os.makedirs(PARQUET_CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=PARQUET_CACHE_DIR, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, entry_path)
+
+    with _lock:
+        if _cached_bytes is None:
+            _evict()
+        else:
+            _cached_bytes += len(data)
+            if _cached_bytes > PARQUET_CACHE_MAX_BYTES:
+                _evict()
+
+
+def _touch(entry_path: str) -> bool:
+    """Mark an entry as recently used, False when it isn't cached."""
+    try:
+        os.utime(entry_path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def cached_blob_path(fs_client, file_path: str, etag: str = None) -> str | None:
+    """
+    Local path of the cached copy of a blob, downloading it on a miss.
+    Returns None when the cache is disabled. ResourceNotFoundError propagates like a plain download.
+    """
+    if not PARQUET_CACHE_ENABLED:
+        return None
+
+    file_client = fs_client.get_file_client(file_path)
+    if etag is None:
+        etag = file_client.get_file_properties().etag
+
+    entry_path = _entry_path(file_path, etag)
+    if _touch(entry_path):
+        return entry_path
+
+    downloader = file_client.download_file()
+    data = downloader.readall()
+    # keyed by the etag the bytes came with: the blob may have been replaced since `etag` was read
+    entry_path = _entry_path(file_path, downloader.properties.etag)
+    _store(entry_path, data)
+    return entry_path
+
+
+def read_blob_bytes(fs_client, file_path: str, etag: str = None) -> bytes:
+    entry_path = cached_blob_path(fs_client, file_path, etag)
+    if entry_path is None:
+        return fs_client.get_file_client(file_path).download_file().readall()
+    try:
+        with open(entry_path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:  # evicted between lookup and read
+        return fs_client.get_file_client(file_path).download_file().readall()
+
+
+def read_parquet_blob(fs_client, file_path: str, etag: str = None, columns: list[str] = None,
+                      filters: list[tuple] = None) -> pd.DataFrame:
+    """
+    pd.read_parquet of a blob, through the local cache.
+    columns/filters are pushed down to pyarrow: only those columns are decoded and row groups
+    whose min/max statistics can't match the filters are skipped.
+    """
+    if PARQUET_CACHE_ENABLED and PARQUET_CACHE_MMAP:
+        entry_path = cached_blob_path(fs_client, file_path, etag)
+        try:
+            return pq.read_table(entry_path, columns=columns, filters=filters, memory_map=True).to_pandas()
+        except FileNotFoundError:
+            pass
+    return pd.read_parquet(BytesIO(read_blob_bytes(fs_client, file_path, etag)), columns=columns, filters=filters)
+
+
+def clear_parquet_cache():
+    global _cached_bytes
+    with _lock:
+        for entry in _entries():
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+        _cached_bytes = 0
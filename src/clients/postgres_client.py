@@ -0,0 +1,82 @@
+import atexit
+import threading
+
+from decouple import config
+from psycopg_pool import ConnectionPool
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+
+"""
+Process-wide Postgres access, every helper/worker/task borrows from here instead of connecting itself.
+
+    get_pg_pool()           - psycopg 3 pool for hand-written SQL (processing_state, metadata, COPY, caches)
+    get_sqlalchemy_engine() - one SQLAlchemy engine for pandas read_sql / to_sql
+
+Both are created on first use and sized by PG_POOL_MIN_SIZE / PG_POOL_MAX_SIZE. Connections are health
+checked when they are handed out (pool check / pool_pre_ping), so a restarted database costs one
+reconnect instead of a failed task. psycopg prepares a statement server-side once it has been executed
+PG_PREPARE_THRESHOLD times on a connection - the state queries the gold flows repeat for every partition.
+Set it to none when connecting through a transaction-mode pooler (pgbouncer, Supabase pooler).
+"""
+
+PG_POOL_MIN_SIZE = config("PG_POOL_MIN_SIZE", default=1, cast=int)
+PG_POOL_MAX_SIZE = config("PG_POOL_MAX_SIZE", default=5, cast=int)
+# seconds to wait for a free connection before PoolTimeout
+PG_POOL_TIMEOUT = config("PG_POOL_TIMEOUT", default=30, cast=float)
+PG_POOL_HEALTH_CHECK = config("PG_POOL_HEALTH_CHECK", default=True, cast=bool)
+PG_PREPARE_THRESHOLD = config("PG_PREPARE_THRESHOLD", default="5",
+                              cast=lambda v: None if str(v).strip().lower() in ("", "none") else int(v))
+
+_pool: ConnectionPool | None = None
+_engine: Engine | None = None
+_lock = threading.Lock()
+
+
+def get_pg_pool() -> ConnectionPool:
+    """
+    Process-wide psycopg connection pool on DB_CONN_RAW, opened on first use.
+        with get_pg_pool().connection() as conn:  # commits on success, rolls back on error
+    """
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = ConnectionPool(
+                config("DB_CONN_RAW"),
+                min_size=PG_POOL_MIN_SIZE,
+                max_size=PG_POOL_MAX_SIZE,
+                timeout=PG_POOL_TIMEOUT,
+                kwargs={"prepare_threshold": PG_PREPARE_THRESHOLD},
+                check=ConnectionPool.check_connection if PG_POOL_HEALTH_CHECK else None,
+                name="etl_pg_pool",
+                open=True,
+            )
+            atexit.register(_pool.close)
+        return _pool
+
+
+def get_sqlalchemy_engine() -> Engine:
+    """Process-wide SQLAlchemy engine on DB_CONN_RAW, for pandas and the existing SQLAlchemy workers."""
+    global _engine
+    with _lock:
+        if _engine is None:
+            _engine = create_engine(
+                config("DB_CONN_RAW"),
+                pool_size=PG_POOL_MAX_SIZE,
+                max_overflow=0,
+                pool_timeout=PG_POOL_TIMEOUT,
+                pool_pre_ping=PG_POOL_HEALTH_CHECK,
+            )
+            atexit.register(_engine.dispose)
+        return _engine
+
+
+def close_pg_clients():
+    """Close the pool and the engine, the next get_* builds them again on the current DB_CONN_RAW."""
+    global _pool, _engine
+    with _lock:
+        pool, engine = _pool, _engine
+        _pool = _engine = None
+    if pool is not None:
+        pool.close()
+    if engine is not None:
+        engine.dispose()
@@ -7,4 +7,8 @@ class InsufficientMonthsError(DataIssueError):
 
 
 class MissingDataError(DataIssueError):
-    pass
\ No newline at end of file
+    pass
+
+
+class LocationNotFoundError(ValueError):
+    pass
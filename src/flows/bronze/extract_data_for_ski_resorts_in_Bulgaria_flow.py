@@ -8,20 +8,27 @@ from logging_config import setup_logging
 from src.helpers.observability_helpers.decorators import measure_flow_duration
 from src.clients.datalake_client import fs_client
 from src.helpers.bronze.api_location_mapper import api_locations
-from src.helpers.bronze.extract_tasks_mapper import api_tasks
+from src.helpers.bronze.bronze_layout import BRONZE_LAYOUT, writes_files, writes_bundle
 from src.helpers.logging_helpers.combine_loggers_helper import get_logger
+from src.helpers.master.layer_handoff import bronze_records_from_results, current_handoff, persist
+from src.tasks.bronze.extract_raw_weather_data_tasks import extract_raw_weather_data
+from src.workers.bronze.async_extraction_engine import MAX_CONCURRENCY
+from src.workers.silver.streaming_silver_batch import StreamingSilverBatch, streaming_enabled
 from src.tasks.bronze.load_raw_weather_data_tasks import load_raw_api_data_to_azure_blob, \
-    load_raw_api_data_to_postgres_local
+    load_raw_api_data_bundle_to_azure_blob, load_raw_api_data_batch_to_postgres_local
 
 
 # INTERVAL = 3600
 
 @flow(
-    flow_run_name=lambda: f"extract_data_for_ski_resorts_in_Bulgaria - {pendulum.now("UTC").format("YYYY-MM-DD HH:mm:ss")}",
+    flow_run_name=lambda: f"extract_data_for_ski_resorts_in_Bulgaria - {pendulum.now('UTC').format('YYYY-MM-DD HH:mm:ss')}",
     # Lambda give dynamically timestamp on every flow execution
 )
 @measure_flow_duration(flow_name="bronze_flow")
-def weather_flow_run(debug: bool = False):
+def weather_flow_run(debug: bool = False,
+                     max_concurrency: int = MAX_CONCURRENCY,
+                     per_api_concurrency: dict[str, int] | None = None,
+                     layout: str = BRONZE_LAYOUT):
     now = pendulum.now("UTC")
     date_str = now.format("YYYY-MM-DD")
     hour_str = now.format("HH")
@@ -30,30 +37,55 @@ def weather_flow_run(debug: bool = False):
 
     logger.info("Starting flow extract bronze data")
 
-    for api_name, locations in api_locations.items():
-        api_task = api_tasks[api_name]
+    # Pipelined orchestrator run: responses are parsed into the silver batch as they arrive
+    handoff = current_handoff()
+    silver_stream = StreamingSilverBatch(date_str, hour_str) if handoff is not None and streaming_enabled() else None
 
-        for label, payload in locations:
-            # Call API
-            # data = api_task(payload)
-            call_args = (payload,) if isinstance(payload, str) else payload
-            state = api_task.submit(*call_args, return_state=True)
+    # All (API, location) calls run concurrently, wall time follows the slowest call
+    results = extract_raw_weather_data(api_locations, max_concurrency, per_api_concurrency,
+                                       on_result=silver_stream.add if silver_stream is not None else None)
 
-            if state.is_failed():
-                # 🔴 логваш, метрики, алерт и продължаваш
-                logger.warning(f"❌ Failed for {api_name} - {label}")
-                continue
+    succeeded = []
+    for result in results:
+        api_name, label = result["api_name"], result["label"]
 
-            data = state.result()
+        if result["error"]:
+            # 🔴 логваш, метрики, алерт и продължаваш
+            logger.warning(f"❌ Failed for {api_name} - {label} | error={result['error']}")
+            continue
 
+        if writes_files(layout):
             # Build human-readable folder/file names
             folder_name = f"{date_str}_{api_name}_{label}"
             file_name = f"{hour_str}.json"
 
             # Upload JSON to Azure
-            load_raw_api_data_to_azure_blob(fs_client, config("BASE_DIR_RAW"), folder_name, file_name, data["data"])
-            # Upload JSON local to postgres
-            load_raw_api_data_to_postgres_local(data, label, now)
+            persist(f"bronze_to_azure_{api_name}_{label}", load_raw_api_data_to_azure_blob,
+                    fs_client, config("BASE_DIR_RAW"), folder_name, file_name, result["data"])
+        succeeded.append(result)
+
+    if writes_bundle(layout) and succeeded:
+        # One compressed object for the whole hour instead of one per api/place
+        persist("bronze_bundle_to_azure", load_raw_api_data_bundle_to_azure_blob,
+                fs_client, config("BASE_DIR_RAW"), date_str, hour_str, succeeded)
+
+    # Upload all JSON payloads local to postgres in one transaction, diagnostics only in debug
+    persist("bronze_to_postgres", load_raw_api_data_batch_to_postgres_local, succeeded, now, debug)
+
+    # Pipelined orchestrator run: silver takes the parsed batch (or the records) from memory while the writes above run
+    if handoff is not None and succeeded:
+        silver_df = None
+        if silver_stream is not None:
+            try:
+                silver_df = silver_stream.finish()
+            except Exception as e:
+                logger.warning(f"Streaming silver batch failed, handing over the records | error={e}")
+        if silver_df is not None:
+            handoff.put("silver_df", silver_df)
+        else:
+            handoff.put("bronze_records", bronze_records_from_results(succeeded, date_str, hour_str))
+    elif silver_stream is not None:
+        silver_stream.close()
     logger.info(f"Running flow at {now}")
 
 
@@ -6,6 +6,7 @@ from prefect import flow
 
 from src.helpers.observability_helpers.decorators import measure_flow_duration
 from src.helpers.logging_helpers.combine_loggers_helper import get_logger
+from src.helpers.master.layer_handoff import current_handoff
 from src.tasks.gold.extract_from_silver import get_silver_parquet_azure
 from src.tasks.gold.load_gold_data import load_gold_daily_data_to_azure, \
     load_gold_daily_data_to_postgres, load_gold_five_day_data_to_azure, load_gold_five_day_data_to_postgres
@@ -37,7 +38,10 @@ def daily_forecast(forecast_day=None, max_hour=None):  # possibly can pass old d
     silver_result = []
     try:
         # task return list of tuples (hour, df) for missing hours
-        silver_result = get_silver_parquet_azure(pipeline_name, forecast_day, max_hour)
+        # hours the silver flow of this orchestrator run handed over are not downloaded again
+        handoff = current_handoff()
+        held_hours = handoff.take("silver_hours") if handoff is not None else None
+        silver_result = get_silver_parquet_azure(pipeline_name, forecast_day, max_hour, held_hours)
     except ResourceNotFoundError as e:
         logger.info(
             f"No parquet file found for day  {forecast_day.format('DD')}/{max_hour.hour}.parquet, fall back to postgres | error={e}",
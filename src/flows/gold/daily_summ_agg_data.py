@@ -8,8 +8,10 @@ from prefect.states import Completed
 from src.helpers.observability_helpers.decorators import measure_flow_duration
 from src.helpers.logging_helpers.combine_loggers_helper import get_logger
 from src.tasks.gold.extract_from_gold import get_hourly_gold_azure, get_hourly_gold_postgres
-from src.tasks.gold.load_gold_data import load_gold_daily_summ_data_to_azure, load_gold_daily_summ_data_to_postgres
-from src.tasks.gold.transform_gold_data import get_daily_summ_data
+from src.tasks.gold.load_gold_data import load_gold_daily_summ_data_to_azure, load_gold_daily_summ_data_to_postgres, \
+    load_gold_rollup_state_to_azure, fold_gold_rollup_states_to_postgres
+from src.tasks.gold.transform_gold_data import get_daily_summ_data, build_daily_rollup_states
+from src.workers.gold.rollup_accumulators import GOLD_ROLLUP_ACCUMULATORS
 
 
 @flow(name="Aggregate hourly to daily flow")
@@ -57,6 +59,21 @@ def hourly_to_daily_aggregation(forecast_day=None):
     load_gold_daily_summ_data_to_azure(pipeline_name, daily_summ_result)
     load_gold_daily_summ_data_to_postgres(daily_summ_result)
 
+    # partial states for the weekly/monthly rollups, a missing state is derived from the summary later
+    daily_states = build_daily_rollup_states(gold_result)
+    for ts, state in daily_states:
+        try:
+            load_gold_rollup_state_to_azure("daily", ts, state)
+        except Exception:
+            logger.exception(f"Rollup state upload failed for {ts.to_date_string()}")
+
+    # fold the new days into the open week/month/season/year accumulators
+    if GOLD_ROLLUP_ACCUMULATORS:
+        try:
+            fold_gold_rollup_states_to_postgres(daily_states)
+        except Exception:
+            logger.exception("Folding daily rollup states into accumulators failed")
+
     # print first 5 rows vertically for dev logs
     for i, (ts, df) in enumerate(daily_summ_result[:5]):
         logger.info("\nItem %s timestamp: %s", i, ts)
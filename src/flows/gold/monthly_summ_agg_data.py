@@ -1,105 +1,78 @@
 import config as env_config
 import pendulum
 import prefect
-from decouple import config
 from prefect import flow
 from prefect.states import Completed
-from sqlalchemy import create_engine
 
+from src.clients.postgres_client import get_sqlalchemy_engine
 from src.helpers.observability_helpers.decorators import measure_flow_duration
 from src.clients.datalake_client import fs_client
+from src.helpers.gold.partition_executor import run_partitions
 from src.helpers.logging_helpers.combine_loggers_helper import get_logger
-from src.helpers.observability_helpers.find_process_state import get_pending_work
+from src.helpers.observability_helpers.find_process_state import claim_pending_work
 from src.helpers.observability_helpers.initial_run_states import generate_dates
 from src.helpers.observability_helpers.pipeline_config import PIPELINE_CONFIG, PIPELINE_STATUS_MAP, PIPELINE_ERROR_MAP
 from src.helpers.observability_helpers.state_helpers import get_last_reconciled_date, reconcile_processing_state, \
     upsert_state_fn, get_current_retry_count
-from src.tasks.gold.extract_from_gold import get_daily_gold_azure, get_daily_gold_postgres
-from src.tasks.gold.load_gold_data import load_gold_monthly_summ_data_to_azure, load_gold_monthly_summ_data_to_postgres
-from src.tasks.gold.transform_gold_data import get_monthly_summ_data
+from src.tasks.gold.extract_from_gold import get_daily_gold_azure, get_daily_gold_postgres, get_gold_rollup_accumulator, \
+    get_gold_rollup_states
+from src.tasks.gold.load_gold_data import load_gold_monthly_summ_data_to_azure, load_gold_monthly_summ_data_to_postgres, \
+    load_gold_rollup_state_to_azure, close_gold_rollup_accumulator
+from src.tasks.gold.transform_gold_data import get_monthly_summ_data, get_monthly_summ_from_states, \
+    get_monthly_summ_from_accumulator
+from src.workers.gold.rollup_accumulators import GOLD_ROLLUP_ACCUMULATORS
+from src.workers.gold.rollup_engine import GOLD_ROLLUP_ENGINE
 
 PIPELINE_NAME = "gold_monthly"
 
-@flow(name="Aggregate daily to monthly flow")
-@measure_flow_duration(flow_name="gold_monthly_summ_flow")
-def daily_to_monthly_aggregation():
-    logger = get_logger()
-    now = pendulum.now("UTC")
-    engine = create_engine(config("DB_CONN_RAW"))
-    cfg = PIPELINE_CONFIG[PIPELINE_NAME]
-    max_missing_ratio = cfg["max_missing_ratio"]
-
-    logger.info(
-        f"Starting {PIPELINE_NAME}",
-        extra={
-            "flow_run_id": prefect.runtime.flow_run.id,
-            "utc_time": now.to_iso8601_string(),
-        },
-    )
-
-    now = pendulum.now("UTC")
-    end_date = now.start_of("month")  # текущият месец excluded
 
-    last_reconciled = get_last_reconciled_date(PIPELINE_NAME)
+# ── one month: extract → transform → load ────────────────────────────────────
 
-    if last_reconciled is None:
-        reconcile_start = pendulum.datetime(now.year - 1, 1, 1)
-        logger.info(f"[{PIPELINE_NAME}] First run — reconciling from {reconcile_start.to_date_string()}")
-    else:
-        reconcile_start = last_reconciled
-        logger.info(
-            f"[{PIPELINE_NAME}] Reconciling from {reconcile_start.to_date_string()} "
-            f"→ {end_date.to_date_string()}"
-        )
-
-    reconcile_processing_state(
-        pipeline_name=PIPELINE_NAME,
-        start_date=reconcile_start,
-        end_date=end_date,
-        fs_client=fs_client,
-        engine=engine,
-    )
+def _process_month(month_start: pendulum.DateTime, cfg: dict, engine) -> str:
+    """Runs one pending month end to end, returns "success", "skipped" (missing days) or "failed"."""
+    logger = get_logger()
+    max_missing_ratio = cfg["max_missing_ratio"]
+    month_label = month_start.to_date_string()
+    month_days = generate_dates(month_start, month_start.add(months=1), grain="day")
+    expected_days = month_start.days_in_month
 
-    # ── fetch pending work ────────────────────────────────────────────────────
-    pending_months: list[pendulum.DateTime] = get_pending_work(
+    # mark as processing — prevents duplicate runs
+    upsert_state_fn(
         processing_level=PIPELINE_NAME,
-        statuses=PIPELINE_STATUS_MAP[PIPELINE_NAME],
-        error_types=PIPELINE_ERROR_MAP[PIPELINE_NAME],
-        max_retries=cfg["max_retries"],
+        partition_date=month_start,
+        status="processing",
+        expected_count=expected_days,
     )
 
-    if not pending_months:
-        logger.info(f"[{PIPELINE_NAME}] No pending months — nothing to do")
-        return Completed(message="Skipped-AlreadyProcessed")
-
-    logger.info(f"[{PIPELINE_NAME}] {len(pending_months)} month(s) to process")
+    monthly_summ = None
+    monthly_state = None
 
-    # ── process each pending month ─────────────────────────────────────────────
-    all_months_summ = []
-    skipped_months = []
-    failed_months = []
+    # ── accumulator: days were folded in as they landed, finalize one row per place ──
+    accumulated = get_gold_rollup_accumulator("monthly", month_start) if GOLD_ROLLUP_ACCUMULATORS else None
+    if accumulated is not None:
+        accumulated_state, folded_days = accumulated
+        if expected_days - len(folded_days) <= round(expected_days * max_missing_ratio):
+            try:
+                monthly_summ, monthly_state = get_monthly_summ_from_accumulator(month_start, accumulated_state,
+                                                                                max_missing_ratio)
+            except ValueError:
+                logger.exception(f"[{PIPELINE_NAME}] Accumulator for {month_label} not usable, reading daily partitions")
 
-    for month_start in pending_months:
-        month_label = month_start.to_date_string()
-        month_days = generate_dates(month_start, month_start.add(months=1), grain="day")
-        expected_days = month_start.days_in_month
+    if monthly_summ is None:
+        # ── stored daily states first, summaries are only needed for the days without one ──
+        if GOLD_ROLLUP_ENGINE == "states":
+            stored_states, stateless_days = get_gold_rollup_states("daily", month_days)
+        else:
+            stored_states, stateless_days = {}, month_days
 
-        # mark as processing — prevents duplicate runs
-        upsert_state_fn(
-            processing_level=PIPELINE_NAME,
-            partition_date=month_start,
-            status="processing",
-            expected_count=expected_days,
-        )
         # ── extract: Azure first, Postgres fallback ───────────────────────────
-
-        all_days_dfs, missing_days = get_daily_gold_azure(month_days, pipeline_name=PIPELINE_NAME)
+        all_days_dfs, missing_days = (get_daily_gold_azure(stateless_days, pipeline_name=PIPELINE_NAME)
+                                      if stateless_days else ([], []))
 
         if missing_days:
-            missing_dates = [d for d in month_days if d.to_date_string() in missing_days]
+            missing_dates = [d for d in stateless_days if d.to_date_string() in missing_days]
             logger.info(f"[{PIPELINE_NAME}] {len(missing_dates)} day(s) missing from Azure, trying Postgres")
 
-
             pg_dfs, still_missing = get_daily_gold_postgres(missing_dates, engine, pipeline_name=PIPELINE_NAME)
             all_days_dfs.extend(pg_dfs)
             missing_days = still_missing
@@ -138,8 +111,7 @@ def daily_to_monthly_aggregation():
                 error_type="missing_partitions",
                 error_message=error_message,
             )
-            skipped_months.append(month_label)
-            continue
+            return "skipped"
 
         if missing_days:
             logger.warning(
@@ -148,72 +120,145 @@ def daily_to_monthly_aggregation():
             )
         # ── transform ─────────────────────────────────────────────────────────
         try:
-            monthly_summ = get_monthly_summ_data(month_start, all_days_dfs, max_missing_ratio)
+            if GOLD_ROLLUP_ENGINE == "states":
+                monthly_summ, monthly_state = get_monthly_summ_from_states(month_start, stored_states, all_days_dfs,
+                                                                            max_missing_ratio)
+            else:
+                monthly_summ, monthly_state = get_monthly_summ_data(month_start, all_days_dfs, max_missing_ratio), None
         except ValueError as e:
             upsert_state_fn(
                 processing_level=PIPELINE_NAME,
                 partition_date=month_start,
                 status="failed",
                 expected_count=expected_days,
-                actual_count=len(all_days_dfs),
+                actual_count=len(stored_states) + len(all_days_dfs),
                 error_type="insufficient_data",
                 error_message=str(e),
             )
-            failed_months.append(month_label)
-            continue
+            return "failed"
         except Exception as e:
             upsert_state_fn(
                 processing_level=PIPELINE_NAME,
                 partition_date=month_start,
                 status="failed",
                 expected_count=expected_days,
-                actual_count=len(all_days_dfs),
+                actual_count=len(stored_states) + len(all_days_dfs),
                 error_type="transformation_error",
                 error_message=str(e),
             )
-            failed_months.append(month_label)
-            continue
-
-        all_months_summ.append((month_start, monthly_summ))
+            return "failed"
 
     # ── load ──────────────────────────────────────────────────────────────────
-    for month_start, monthly_summ in all_months_summ:
-        month_label = month_start.to_date_string()
-        expected_days = month_start.days_in_month
-        azure_ok = False
-        postgres_ok = False
+    azure_ok = False
+    postgres_ok = False
+
+    try:
+        load_gold_monthly_summ_data_to_azure(PIPELINE_NAME, month_start, monthly_summ)
+        azure_ok = True
+    except Exception:
+        logger.exception(f"[{PIPELINE_NAME}] Azure upload failed for {month_label}")
 
+    try:
+        load_gold_monthly_summ_data_to_postgres(PIPELINE_NAME, month_start,[monthly_summ])
+        postgres_ok = True
+    except Exception:
+        logger.exception(f"[{PIPELINE_NAME}] Postgres load failed for {month_label}")
+
+    if monthly_state is not None and (azure_ok or postgres_ok):
         try:
-            load_gold_monthly_summ_data_to_azure(PIPELINE_NAME, month_start, monthly_summ)
-            azure_ok = True
+            load_gold_rollup_state_to_azure("monthly", month_start, monthly_state)
         except Exception:
-            logger.exception(f"[{PIPELINE_NAME}] Azure upload failed for {month_label}")
+            logger.exception(f"[{PIPELINE_NAME}] Rollup state upload failed for {month_label}")
 
+    if GOLD_ROLLUP_ACCUMULATORS and (azure_ok or postgres_ok):
         try:
-            load_gold_monthly_summ_data_to_postgres(PIPELINE_NAME, month_start,[monthly_summ])
-            postgres_ok = True
+            close_gold_rollup_accumulator("monthly", month_start)
         except Exception:
-            logger.exception(f"[{PIPELINE_NAME}] Postgres load failed for {month_label}")
+            logger.exception(f"[{PIPELINE_NAME}] Closing accumulator failed for {month_label}")
+
+    if azure_ok or postgres_ok:
+        upsert_state_fn(
+            processing_level=PIPELINE_NAME,
+            partition_date=month_start,
+            status="success",
+            expected_count=expected_days,
+            actual_count=expected_days,
+        )
+        return "success"
+
+    upsert_state_fn(
+        processing_level=PIPELINE_NAME,
+        partition_date=month_start,
+        status="failed",
+        expected_count=expected_days,
+        actual_count=0,
+        error_type="missing_partitions",
+        error_message="Both Azure and Postgres load failed",
+    )
+    return "failed"
+
+
+@flow(name="Aggregate daily to monthly flow")
+@measure_flow_duration(flow_name="gold_monthly_summ_flow")
+def daily_to_monthly_aggregation():
+    logger = get_logger()
+    now = pendulum.now("UTC")
+    engine = get_sqlalchemy_engine()
+    cfg = PIPELINE_CONFIG[PIPELINE_NAME]
+
+    logger.info(
+        f"Starting {PIPELINE_NAME}",
+        extra={
+            "flow_run_id": prefect.runtime.flow_run.id,
+            "utc_time": now.to_iso8601_string(),
+        },
+    )
+
+    now = pendulum.now("UTC")
+    end_date = now.start_of("month")  # текущият месец excluded
+
+    last_reconciled = get_last_reconciled_date(PIPELINE_NAME)
+
+    if last_reconciled is None:
+        reconcile_start = pendulum.datetime(now.year - 1, 1, 1)
+        logger.info(f"[{PIPELINE_NAME}] First run — reconciling from {reconcile_start.to_date_string()}")
+    else:
+        reconcile_start = last_reconciled
+        logger.info(
+            f"[{PIPELINE_NAME}] Reconciling from {reconcile_start.to_date_string()} "
+            f"→ {end_date.to_date_string()}"
+        )
+
+    reconcile_processing_state(
+        pipeline_name=PIPELINE_NAME,
+        start_date=reconcile_start,
+        end_date=end_date,
+        fs_client=fs_client,
+        engine=engine,
+    )
+
+    # ── claim pending work ────────────────────────────────────────────────────
+    pending_months: list[pendulum.DateTime] = claim_pending_work(
+        processing_level=PIPELINE_NAME,
+        statuses=PIPELINE_STATUS_MAP[PIPELINE_NAME],
+        error_types=PIPELINE_ERROR_MAP[PIPELINE_NAME],
+        max_retries=cfg["max_retries"],
+    )
+
+    if not pending_months:
+        logger.info(f"[{PIPELINE_NAME}] No pending months — nothing to do")
+        return Completed(message="Skipped-AlreadyProcessed")
+
+    logger.info(f"[{PIPELINE_NAME}] {len(pending_months)} month(s) to process")
+
+    # ── process pending months, independent months run side by side ──────────
+    outcomes = run_partitions(lambda month_start: _process_month(month_start, cfg, engine), pending_months,
+                              thread_name_prefix="gold-monthly")
+
+    processed_months = [m.to_date_string() for m, o in zip(pending_months, outcomes) if o == "success"]
+    skipped_months = [m.to_date_string() for m, o in zip(pending_months, outcomes) if o == "skipped"]
+    failed_months = [m.to_date_string() for m, o in zip(pending_months, outcomes) if o == "failed"]
 
-        if azure_ok or postgres_ok:
-            upsert_state_fn(
-                processing_level=PIPELINE_NAME,
-                partition_date=month_start,
-                status="success",
-                expected_count=expected_days,
-                actual_count=expected_days,
-            )
-        else:
-            upsert_state_fn(
-                processing_level=PIPELINE_NAME,
-                partition_date=month_start,
-                status="failed",
-                expected_count=expected_days,
-                actual_count=0,
-                error_type="missing_partitions",
-                error_message="Both Azure and Postgres load failed",
-            )
-            failed_months.append(month_label)
     # ── final report ──────────────────────────────────────────────────────────
     all_failed = list(set(skipped_months) | set(failed_months))
     if all_failed:
@@ -221,7 +266,7 @@ def daily_to_monthly_aggregation():
 
     logger.info(
         f"[{PIPELINE_NAME}] Finished | "
-        f"processed={len(all_months_summ)} | "
+        f"processed={len(processed_months)} | "
         f"missed={len(skipped_months)} | "
         f"failed={len(failed_months)}",
         extra={
@@ -232,7 +277,7 @@ def daily_to_monthly_aggregation():
     if all_failed:
         return Completed(message=f"Partial-Failure: {len(all_failed)} month(s) failed: {all_failed}")
 
-    return Completed(message=f"Success: {len(all_months_summ)} month(s) processed")
+    return Completed(message=f"Success: {len(processed_months)} month(s) processed")
 
 if __name__ == "__main__":
     daily_to_monthly_aggregation()
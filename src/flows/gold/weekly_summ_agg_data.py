@@ -1,15 +1,15 @@
 import config as env_config
 import pendulum
 import prefect
-from decouple import config
 from prefect import flow
 from prefect.states import Completed
-from sqlalchemy import create_engine
 
+from src.clients.postgres_client import get_sqlalchemy_engine
 from src.helpers.observability_helpers.decorators import measure_flow_duration
 from src.clients.datalake_client import fs_client
+from src.helpers.gold.partition_executor import run_partitions
 from src.helpers.logging_helpers.combine_loggers_helper import get_logger
-from src.helpers.observability_helpers.find_process_state import get_pending_work
+from src.helpers.observability_helpers.find_process_state import claim_pending_work
 from src.helpers.observability_helpers.initial_run_states import generate_dates
 from src.helpers.observability_helpers.pipeline_config import (
     PIPELINE_CONFIG,
@@ -23,99 +23,65 @@ from src.helpers.observability_helpers.state_helpers import (
     upsert_state_fn,
 )
 from src.tasks.gold.extract_from_gold import (
-    get_daily_gold_azure, get_daily_gold_postgres,
+    get_daily_gold_azure, get_daily_gold_postgres, get_gold_rollup_accumulator, get_gold_rollup_states,
 )
 from src.tasks.gold.load_gold_data import (
     load_gold_weekly_summ_data_to_azure,
     load_gold_weekly_summ_data_to_postgres,
+    load_gold_rollup_state_to_azure,
+    close_gold_rollup_accumulator,
 )
-from src.tasks.gold.transform_gold_data import get_weekly_summ_data
+from src.tasks.gold.transform_gold_data import get_weekly_summ_data, get_weekly_summ_from_states, \
+    get_weekly_summ_from_accumulator
+from src.workers.gold.rollup_accumulators import GOLD_ROLLUP_ACCUMULATORS
+from src.workers.gold.rollup_engine import GOLD_ROLLUP_ENGINE
 
 PIPELINE_NAME = "gold_weekly"
 MAX_MISSING_DAYS = 3
 
 
-# ── flow ──────────────────────────────────────────────────────────────────────
+# ── one week: extract → transform → load ─────────────────────────────────────
 
-@flow(name="Aggregate daily to weekly flow")
-@measure_flow_duration(flow_name="gold_weekly_summ_flow")
-def daily_to_weekly_aggregation():
+def _process_week(week_start: pendulum.DateTime, cfg: dict, engine) -> str:
+    """Runs one pending week end to end, returns "success", "skipped" (missing days) or "failed"."""
     logger = get_logger()
-    now = pendulum.now("UTC")
-    engine = create_engine(config("DB_CONN_RAW"))
-    cfg = PIPELINE_CONFIG[PIPELINE_NAME]
-
-    logger.info(
-        f"Starting {PIPELINE_NAME}",
-        extra={
-            "flow_run_id": prefect.runtime.flow_run.id,
-            "utc_time": now.to_iso8601_string(),
-        },
-    )
-
-    # ── date boundaries ───────────────────────────────────────────────────────
-    year_start = pendulum.datetime(now.year, 1, 4).start_of("week")
-    end_date = now.start_of("week")  # current week excluded (<, not <=)
+    week_label = week_start.to_date_string()
+    week_dates = generate_dates(week_start, week_start.add(weeks=1), grain="day")
 
-    # ── reconcile: always run, only for new partitions ────────────────────────
-    last_reconciled = get_last_reconciled_date(PIPELINE_NAME)
-
-    if last_reconciled is None:
-        # first run — reconcile from start of year
-        reconcile_start = year_start
-        logger.info(f"[{PIPELINE_NAME}] First run — reconciling from {year_start.to_date_string()}")
-    else:
-        # subsequent runs — reconcile only new weeks since last known partition
-        reconcile_start = last_reconciled
-        logger.info(
-            f"[{PIPELINE_NAME}] Reconciling from {reconcile_start.to_date_string()} "
-            f"→ {end_date.to_date_string()}"
-        )
-
-    reconcile_processing_state(
-        pipeline_name=PIPELINE_NAME,
-        start_date=reconcile_start,
-        end_date=end_date,
-        fs_client=fs_client,
-        engine=engine,
-    )
-
-    # ── fetch pending work ────────────────────────────────────────────────────
-    pending_weeks: list[pendulum.DateTime] = get_pending_work(
+    # mark as processing — prevents duplicate runs
+    upsert_state_fn(
         processing_level=PIPELINE_NAME,
-        statuses=PIPELINE_STATUS_MAP[PIPELINE_NAME],
-        error_types=PIPELINE_ERROR_MAP[PIPELINE_NAME],
-        max_retries=cfg["max_retries"],
+        partition_date=week_start,
+        status="processing",
+        expected_count=cfg["expected_count"],
     )
 
-    if not pending_weeks:
-        logger.info(f"[{PIPELINE_NAME}] No pending weeks — nothing to do")
-        return Completed(message="Skipped-AlreadyProcessed")
-
-    logger.info(f"[{PIPELINE_NAME}] {len(pending_weeks)} week(s) to process")
-
-    # ── process each pending week ─────────────────────────────────────────────
-    all_weeks_summ = []
-    skipped_weeks = []
-    failed_weeks = []
-
-    for week_start in pending_weeks:
-        week_label = week_start.to_date_string()
-        week_dates = generate_dates(week_start, week_start.add(weeks=1), grain="day")
-
-        # mark as processing — prevents duplicate runs
-        upsert_state_fn(
-            processing_level=PIPELINE_NAME,
-            partition_date=week_start,
-            status="processing",
-            expected_count=cfg["expected_count"],
-        )
+    weekly_summ = None
+    weekly_state = None
+
+    # ── accumulator: days were folded in as they landed, finalize one row per place ──
+    accumulated = get_gold_rollup_accumulator("weekly", week_start) if GOLD_ROLLUP_ACCUMULATORS else None
+    if accumulated is not None:
+        accumulated_state, folded_days = accumulated
+        if len(week_dates) - len(folded_days) <= MAX_MISSING_DAYS:
+            try:
+                weekly_summ, weekly_state = get_weekly_summ_from_accumulator(week_start, accumulated_state)
+            except ValueError:
+                logger.exception(f"[{PIPELINE_NAME}] Accumulator for {week_label} not usable, reading daily partitions")
+
+    if weekly_summ is None:
+        # ── stored daily states first, summaries are only needed for the days without one ──
+        if GOLD_ROLLUP_ENGINE == "states":
+            stored_states, stateless_days = get_gold_rollup_states("daily", week_dates)
+        else:
+            stored_states, stateless_days = {}, week_dates
 
         # ── extract: Azure first, Postgres fallback за missing дни ────────────
-        all_days_dfs, missing_days = get_daily_gold_azure(week_dates, pipeline_name=PIPELINE_NAME)
+        all_days_dfs, missing_days = (get_daily_gold_azure(stateless_days, pipeline_name=PIPELINE_NAME)
+                                      if stateless_days else ([], []))
 
         if missing_days:
-            missing_dates = [d for d in week_dates if d.to_date_string() in missing_days]
+            missing_dates = [d for d in stateless_days if d.to_date_string() in missing_days]
             logger.info(f"[{PIPELINE_NAME}] {len(missing_dates)} day(s) missing from Azure, trying Postgres")
             pg_dfs, still_missing = get_daily_gold_postgres(missing_dates, engine, pipeline_name=PIPELINE_NAME)
             all_days_dfs.extend(pg_dfs)
@@ -152,8 +118,7 @@ def daily_to_weekly_aggregation():
                 error_type="missing_partitions",
                 error_message=error_message,
             )
-            skipped_weeks.append(week_label)
-            continue
+            return "skipped"
 
         if missing_days:
             logger.warning(
@@ -163,76 +128,154 @@ def daily_to_weekly_aggregation():
 
         # ── transform ─────────────────────────────────────────────────────────
         try:
-            weekly_summ = get_weekly_summ_data(week_start, all_days_dfs)
+            if GOLD_ROLLUP_ENGINE == "states":
+                weekly_summ, weekly_state = get_weekly_summ_from_states(week_start, stored_states, all_days_dfs)
+            else:
+                weekly_summ, weekly_state = get_weekly_summ_data(week_start, all_days_dfs), None
         except ValueError as e:
             upsert_state_fn(
                 processing_level=PIPELINE_NAME,
                 partition_date=week_start,
                 status="failed",
                 expected_count=cfg["expected_count"],
-                actual_count=len(all_days_dfs),
+                actual_count=len(stored_states) + len(all_days_dfs),
                 error_type="insufficient_data",
                 error_message=str(e),
             )
-            failed_weeks.append(week_label)
-            continue
+            return "failed"
         except Exception as e:
             upsert_state_fn(
                 processing_level=PIPELINE_NAME,
                 partition_date=week_start,
                 status="failed",
                 expected_count=cfg["expected_count"],
-                actual_count=len(all_days_dfs),
+                actual_count=len(stored_states) + len(all_days_dfs),
                 error_type="transformation_error",
                 error_message=str(e),
             )
-            failed_weeks.append(week_label)
-            continue
-
-        all_weeks_summ.append((week_start, weekly_summ))
+            return "failed"
 
     # ── load ──────────────────────────────────────────────────────────────────
-    for week_start, weekly_summ in all_weeks_summ:
-        week_label = week_start.to_date_string()
-        azure_ok = False
-        postgres_ok = False
-
+    azure_ok = False
+    postgres_ok = False
+
+    try:
+        load_gold_weekly_summ_data_to_azure(PIPELINE_NAME, weekly_summ)
+        azure_ok = True
+    except Exception:
+        logger.exception(f"[{PIPELINE_NAME}] Azure upload failed for {week_label}")
+
+    try:
+        load_gold_weekly_summ_data_to_postgres(PIPELINE_NAME, [weekly_summ])
+        postgres_ok = True
+    except Exception:
+        logger.exception(f"[{PIPELINE_NAME}] Postgres load failed for {week_label}")
+
+    if weekly_state is not None and (azure_ok or postgres_ok):
         try:
-            load_gold_weekly_summ_data_to_azure(PIPELINE_NAME, weekly_summ)
-            azure_ok = True
+            load_gold_rollup_state_to_azure("weekly", week_start, weekly_state)
         except Exception:
-            logger.exception(f"[{PIPELINE_NAME}] Azure upload failed for {week_label}")
+            logger.exception(f"[{PIPELINE_NAME}] Rollup state upload failed for {week_label}")
 
+    if GOLD_ROLLUP_ACCUMULATORS and (azure_ok or postgres_ok):
         try:
-            load_gold_weekly_summ_data_to_postgres(PIPELINE_NAME, [weekly_summ])
-            postgres_ok = True
+            close_gold_rollup_accumulator("weekly", week_start)
         except Exception:
-            logger.exception(f"[{PIPELINE_NAME}] Postgres load failed for {week_label}")
+            logger.exception(f"[{PIPELINE_NAME}] Closing accumulator failed for {week_label}")
 
-        if azure_ok or postgres_ok:
-            upsert_state_fn(
-                processing_level=PIPELINE_NAME,
-                partition_date=week_start,
-                status="success",
-                expected_count=cfg["expected_count"],
-                actual_count=cfg["expected_count"],
-            )
-        else:
-            upsert_state_fn(
-                processing_level=PIPELINE_NAME,
-                partition_date=week_start,
-                status="failed",
-                expected_count=cfg["expected_count"],
-                actual_count=0,
-                error_type="missing_partitions",
-                error_message="Both Azure and Postgres load failed",
-            )
-            failed_weeks.append(week_label)
+    if azure_ok or postgres_ok:
+        upsert_state_fn(
+            processing_level=PIPELINE_NAME,
+            partition_date=week_start,
+            status="success",
+            expected_count=cfg["expected_count"],
+            actual_count=cfg["expected_count"],
+        )
+        return "success"
+
+    upsert_state_fn(
+        processing_level=PIPELINE_NAME,
+        partition_date=week_start,
+        status="failed",
+        expected_count=cfg["expected_count"],
+        actual_count=0,
+        error_type="missing_partitions",
+        error_message="Both Azure and Postgres load failed",
+    )
+    return "failed"
+
+
+# ── flow ──────────────────────────────────────────────────────────────────────
+
+@flow(name="Aggregate daily to weekly flow")
+@measure_flow_duration(flow_name="gold_weekly_summ_flow")
+def daily_to_weekly_aggregation():
+    logger = get_logger()
+    now = pendulum.now("UTC")
+    engine = get_sqlalchemy_engine()
+    cfg = PIPELINE_CONFIG[PIPELINE_NAME]
+
+    logger.info(
+        f"Starting {PIPELINE_NAME}",
+        extra={
+            "flow_run_id": prefect.runtime.flow_run.id,
+            "utc_time": now.to_iso8601_string(),
+        },
+    )
+
+    # ── date boundaries ───────────────────────────────────────────────────────
+    year_start = pendulum.datetime(now.year, 1, 4).start_of("week")
+    end_date = now.start_of("week")  # current week excluded (<, not <=)
+
+    # ── reconcile: always run, only for new partitions ────────────────────────
+    last_reconciled = get_last_reconciled_date(PIPELINE_NAME)
+
+    if last_reconciled is None:
+        # first run — reconcile from start of year
+        reconcile_start = year_start
+        logger.info(f"[{PIPELINE_NAME}] First run — reconciling from {year_start.to_date_string()}")
+    else:
+        # subsequent runs — reconcile only new weeks since last known partition
+        reconcile_start = last_reconciled
+        logger.info(
+            f"[{PIPELINE_NAME}] Reconciling from {reconcile_start.to_date_string()} "
+            f"→ {end_date.to_date_string()}"
+        )
+
+    reconcile_processing_state(
+        pipeline_name=PIPELINE_NAME,
+        start_date=reconcile_start,
+        end_date=end_date,
+        fs_client=fs_client,
+        engine=engine,
+    )
+
+    # ── claim pending work ────────────────────────────────────────────────────
+    pending_weeks: list[pendulum.DateTime] = claim_pending_work(
+        processing_level=PIPELINE_NAME,
+        statuses=PIPELINE_STATUS_MAP[PIPELINE_NAME],
+        error_types=PIPELINE_ERROR_MAP[PIPELINE_NAME],
+        max_retries=cfg["max_retries"],
+    )
+
+    if not pending_weeks:
+        logger.info(f"[{PIPELINE_NAME}] No pending weeks — nothing to do")
+        return Completed(message="Skipped-AlreadyProcessed")
+
+    logger.info(f"[{PIPELINE_NAME}] {len(pending_weeks)} week(s) to process")
+
+    # ── process pending weeks, independent weeks run side by side ────────────
+    outcomes = run_partitions(lambda week_start: _process_week(week_start, cfg, engine), pending_weeks,
+                              thread_name_prefix="gold-weekly")
+
+    processed_weeks = [w.to_date_string() for w, o in zip(pending_weeks, outcomes) if o == "success"]
+    skipped_weeks = [w.to_date_string() for w, o in zip(pending_weeks, outcomes) if o == "skipped"]
+    failed_weeks = [w.to_date_string() for w, o in zip(pending_weeks, outcomes) if o == "failed"]
 
     # ── final report ──────────────────────────────────────────────────────────
     logger.info(
         f"[{PIPELINE_NAME}] Finished | "
-        f"success={len(all_weeks_summ)} "
+        f"success={len(processed_weeks)} "
         f"skipped={len(skipped_weeks)} "
         f"failed={len(failed_weeks)}",
         extra={
@@ -248,7 +291,7 @@ def daily_to_weekly_aggregation():
     if all_failed:
         return Completed(message=f"Partial-Failure: {len(all_failed)} week(s) failed: {all_failed}")
 
-    return Completed(message=f"Success: {len(all_weeks_summ)} week(s) processed")
+    return Completed(message=f"Success: {len(processed_weeks)} week(s) processed")
 
 
 if __name__ == "__main__":
@@ -1,32 +1,77 @@
 import config as env_config
 import pendulum
 import prefect
-from decouple import config
 from prefect import flow
 from prefect.states import Completed
-from sqlalchemy import create_engine
 
+from src.clients.postgres_client import get_sqlalchemy_engine
 from src.helpers.observability_helpers.decorators import measure_flow_duration
 from src.clients.datalake_client import fs_client
 from src.core.exceptions import DataIssueError
+from src.helpers.gold.partition_executor import run_partitions
 from src.helpers.logging_helpers.combine_loggers_helper import get_logger
-from src.helpers.observability_helpers.find_process_state import get_pending_work
+from src.helpers.observability_helpers.find_process_state import claim_pending_work
 from src.helpers.observability_helpers.pipeline_config import PIPELINE_CONFIG, PIPELINE_STATUS_MAP, PIPELINE_ERROR_MAP
 from src.helpers.observability_helpers.state_helpers import get_last_reconciled_date, reconcile_processing_state, \
     upsert_state_fn, get_current_retry_count
-from src.tasks.gold.extract_from_gold import get_monthly_gold_azure, get_monthly_gold_postgres
-from src.tasks.gold.load_gold_data import load_gold_yearly_summ_data_to_azure, load_gold_yearly_summ_data_to_postgres
-from src.tasks.gold.transform_gold_data import aggregate_gold_months
+from src.tasks.gold.extract_from_gold import get_monthly_gold_azure, get_monthly_gold_postgres, get_gold_rollup_states
+from src.tasks.gold.load_gold_data import load_gold_yearly_summ_data_to_azure, load_gold_yearly_summ_data_to_postgres, \
+    load_gold_rollup_state_to_azure
+from src.tasks.gold.transform_gold_data import aggregate_gold_months, aggregate_gold_month_states
+from src.workers.gold.rollup_engine import GOLD_ROLLUP_ENGINE
 
 PIPELINE_NAME = "gold_yearly"
 
 
+# ── one month: Azure first, Postgres fallback ────────────────────────────────
+
+def _extract_month(month: pendulum.DateTime, expected_months: int):
+    """Monthly summary of one pending month, None when neither Azure nor Postgres has it."""
+    logger = get_logger()
+    month_label = month.to_date_string()
+
+    upsert_state_fn(
+        processing_level=PIPELINE_NAME,
+        partition_date=month,
+        status="processing",
+        expected_count=expected_months,
+    )
+
+    try:
+        month_df = get_monthly_gold_azure(month)
+    except Exception as e:
+        logger.warning(
+            f"[{PIPELINE_NAME}] Azure failed for {month_label}, falling back to Postgres | {e}"
+        )
+        try:
+            month_df = get_monthly_gold_postgres(month)
+        except Exception as e2:
+            logger.error(
+                f"[{PIPELINE_NAME}] Postgres fallback also failed for {month_label} | {e2}"
+            )
+            upsert_state_fn(
+                processing_level=PIPELINE_NAME,
+                partition_date=month,
+                status="pending",
+                expected_count=expected_months,
+            )
+            return None
+
+    upsert_state_fn(
+        processing_level=PIPELINE_NAME,
+        partition_date=month,
+        status="success",
+        expected_count=expected_months,
+    )
+    return month_df
+
+
 @flow(name="Aggregate monthly to yearly flow")
 @measure_flow_duration(flow_name="gold_monthly_to_yearly_flow")
 def monthly_to_yearly_aggregation():
     logger = get_logger()
     now = pendulum.now("UTC")
-    engine = create_engine(config("DB_CONN_RAW"))
+    engine = get_sqlalchemy_engine()
     cfg = PIPELINE_CONFIG[PIPELINE_NAME]
     max_missing_ratio = cfg["max_missing_ratio"]
 
@@ -67,8 +112,8 @@ def monthly_to_yearly_aggregation():
         engine=engine,
     )
 
-    # ── fetch pending work ────────────────────────────────────────────────────
-    pending_months: list[pendulum.DateTime] = get_pending_work(
+    # ── claim pending work ────────────────────────────────────────────────────
+    pending_months: list[pendulum.DateTime] = claim_pending_work(
         processing_level=PIPELINE_NAME,
         statuses=PIPELINE_STATUS_MAP[PIPELINE_NAME],
         error_types=PIPELINE_ERROR_MAP[PIPELINE_NAME],
@@ -81,54 +126,26 @@ def monthly_to_yearly_aggregation():
 
     logger.info(f"[{PIPELINE_NAME}] {len(pending_months)} month(s) to process")
 
-    # ── extract ───────────────────────────────────────────────────────────────
-    all_months_dfs = []
-    missing_months = []
-
-    for month in pending_months:
-        month_label = month.to_date_string()
+    # ── stored monthly states first, summaries are only needed for the months without one ──
+    if GOLD_ROLLUP_ENGINE == "states":
+        stored_states, stateless_months = get_gold_rollup_states("monthly", pending_months)
+    else:
+        stored_states, stateless_months = {}, pending_months
 
+    for month in stored_states:
         upsert_state_fn(
             processing_level=PIPELINE_NAME,
             partition_date=month,
-            status="processing",
+            status="success",
             expected_count=expected_months,
         )
 
-        try:
-            month_df = get_monthly_gold_azure(month)
-            all_months_dfs.append((month, month_df))
-            upsert_state_fn(
-                processing_level=PIPELINE_NAME,
-                partition_date=month,
-                status="success",
-                expected_count=expected_months,
-            )
-        except Exception as e:
-            logger.warning(
-                f"[{PIPELINE_NAME}] Azure failed for {month_label}, falling back to Postgres | {e}"
-            )
-            try:
-                month_df = get_monthly_gold_postgres(month)
-                all_months_dfs.append((month, month_df))
-                upsert_state_fn(
-                    processing_level=PIPELINE_NAME,
-                    partition_date=month,
-                    status="success",
-                    expected_count=expected_months,
-                )
-            except Exception as e2:
-                logger.error(
-                    f"[{PIPELINE_NAME}] Postgres fallback also failed for {month_label} | {e2}"
-                )
-                missing_months.append(month)
-                upsert_state_fn(
-                    processing_level=PIPELINE_NAME,
-                    partition_date=month,
-                    status="pending",
-                    expected_count=expected_months,
-                )
-                continue
+    # ── extract: the remaining months are fetched side by side ────────────────
+    month_dfs = run_partitions(lambda month: _extract_month(month, expected_months), stateless_months,
+                               thread_name_prefix="gold-yearly")
+
+    all_months_dfs = [(month, df) for month, df in zip(stateless_months, month_dfs) if df is not None]
+    missing_months = [month for month, df in zip(stateless_months, month_dfs) if df is None]
 
     # ── missing months gate ───────────────────────────────────────────────────
     if len(missing_months) > max_missing:
@@ -170,14 +187,19 @@ def monthly_to_yearly_aggregation():
     # ── transform ────────────────────────────────────────────────────────────
     year = now.year
     try:
-        yearly_summ = aggregate_gold_months(all_months_dfs, expected_months, max_missing_ratio, year)
+        if GOLD_ROLLUP_ENGINE == "states":
+            yearly_summ, yearly_state = aggregate_gold_month_states(stored_states, all_months_dfs, expected_months,
+                                                                    max_missing_ratio, year)
+        else:
+            yearly_summ, yearly_state = aggregate_gold_months(all_months_dfs, expected_months,
+                                                              max_missing_ratio, year), None
     except DataIssueError as e:
         upsert_state_fn(
             processing_level=PIPELINE_NAME,
             partition_date=pendulum.datetime(year, 1, 1),
             status="pending",
             expected_count=expected_months,
-            actual_count=len(all_months_dfs),
+            actual_count=len(stored_states) + len(all_months_dfs),
             error_type="insufficient_data",
             error_message=str(e),
         )
@@ -188,7 +210,7 @@ def monthly_to_yearly_aggregation():
             partition_date=pendulum.datetime(year, 1, 1),
             status="failed",
             expected_count=expected_months,
-            actual_count=len(all_months_dfs),
+            actual_count=len(stored_states) + len(all_months_dfs),
             error_type="transformation_error",
             error_message=str(e),
         )
@@ -209,6 +231,12 @@ def monthly_to_yearly_aggregation():
     except Exception:
         logger.exception(f"[{PIPELINE_NAME}] Postgres load failed for {year}")
 
+    if yearly_state is not None and (azure_ok or postgres_ok):
+        try:
+            load_gold_rollup_state_to_azure("yearly", pendulum.datetime(year, 1, 1), yearly_state)
+        except Exception:
+            logger.exception(f"[{PIPELINE_NAME}] Rollup state upload failed for {year}")
+
     if azure_ok or postgres_ok:
         upsert_state_fn(
             processing_level=PIPELINE_NAME,
@@ -2,6 +2,7 @@ import config
 from prefect import flow, runtime
 from logging_config import setup_logging
 from src.helpers.logging_helpers.combine_loggers_helper import get_logger
+from src.helpers.master.layer_handoff import pipelined_run
 from src.helpers.observability_helpers.decorators import measure_flow_duration
 from src.helpers.observability_helpers.processing_state_reader import get_processing_state_metrics
 from src.helpers.observability_helpers.pushgateway_utils import push_processing_state_metrics
@@ -18,23 +19,26 @@ def orchestrator_flow():
     setup_logging()
     logger = get_logger()
     try:
-        logger.info("Starting First Flow Deployment...",
-                    extra={"flow_run_id": runtime.flow_run.id})
-        weather_flow_run()
-        logger.info("Completed First Flow Deployment",
-                    extra={"flow_run_id": runtime.flow_run.id, "state": "success"})
-
-        logger.info("Starting Silver Flow Deployment...",
-                    extra={"flow_run_id": runtime.flow_run.id})
-        transform_bronze_data()
-        logger.info("Completed Silver Flow Deployment",
-                    extra={"flow_run_id": runtime.flow_run.id, "state": "success"})
-
-        logger.info("Starting Gold Flow Deployment...",
-                    extra={"flow_run_id": runtime.flow_run.id})
-        daily_forecast()
-        logger.info("Completed Gold Flow Deployment",
-                    extra={"flow_run_id": runtime.flow_run.id, "state": "success"})
+        # layers hand their output to the next one in memory, bronze/silver writes run in the background
+        # and are awaited when the block ends (PIPELINE_HANDOFF=False -> every layer reads from storage)
+        with pipelined_run():
+            logger.info("Starting First Flow Deployment...",
+                        extra={"flow_run_id": runtime.flow_run.id})
+            weather_flow_run()
+            logger.info("Completed First Flow Deployment",
+                        extra={"flow_run_id": runtime.flow_run.id, "state": "success"})
+
+            logger.info("Starting Silver Flow Deployment...",
+                        extra={"flow_run_id": runtime.flow_run.id})
+            transform_bronze_data()
+            logger.info("Completed Silver Flow Deployment",
+                        extra={"flow_run_id": runtime.flow_run.id, "state": "success"})
+
+            logger.info("Starting Gold Flow Deployment...",
+                        extra={"flow_run_id": runtime.flow_run.id})
+            daily_forecast()
+            logger.info("Completed Gold Flow Deployment",
+                        extra={"flow_run_id": runtime.flow_run.id, "state": "success"})
     finally:
         logger.info("Entering processing_state metrics push")
         try:
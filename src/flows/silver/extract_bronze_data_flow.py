@@ -12,6 +12,7 @@ from src.helpers.observability_helpers.pushgateway_utils import push_metrics_to_
 from src.helpers.observability_helpers.decorators import measure_flow_duration
 from src.clients.datalake_client import fs_client
 from src.helpers.logging_helpers.combine_loggers_helper import get_logger
+from src.helpers.master.layer_handoff import after_persisted, current_handoff, persist, silver_hour_key
 from src.tasks.silver.extract_from_bronze_layer_tasks import extract_bronze_data_from_postgres, \
     extract_bronze_data_from_azure_blob_task
 from src.tasks.silver.load_silver_data import load_silver_data_to_postgres, load_silver_data_to_azure
@@ -33,6 +34,15 @@ def transform_bronze_data(date: Optional[str] = None,
     flow_name = "Transform bronze data"
     PIPELINE_RUNNING.labels(flow_name).set(1)
 
+    def report(status):
+        duration = (pendulum.now("UTC") - start).in_seconds()
+        # update FLOW_DURATION for local use
+        FLOW_DURATION.labels(flow_name).observe(duration)
+
+        # Push all metrics to Pushgateway
+        push_metrics_to_gateway(flow_name=flow_name, status=status, duration=duration)
+
+    status = "failed"
     try:
         now = pendulum.now("UTC")
 
@@ -40,20 +50,31 @@ def transform_bronze_data(date: Optional[str] = None,
         hour_str = now.format("HH")  # Azure
         hour_int = int(hour_str)  # Postgres
 
-        try:
-            bronze_records = extract_bronze_data_from_azure_blob_task(azure_fs_client, base_dir, date, hour_str)
-            # logger.info(
-            #     "Records:\n%s",
-            #     json.dumps(bronze_records, indent=2, ensure_ascii=False)
-            # )
-
-        except ResourceNotFoundError as e:
-            logger.warning(
-                "Azure file not found, falling back to Postgres | error=%s", e
-            )
-            bronze_records = extract_bronze_data_from_postgres(date, hour_int)
-
-        silver_df = parse_api_records(bronze_records)
+        handoff = current_handoff()
+        # pipelined orchestrator run: bronze parsed its responses as they arrived (silver_df)
+        # or handed its records over, no download either way
+        silver_df = handoff.take("silver_df") if handoff is not None else None
+        bronze_records = handoff.take("bronze_records") if handoff is not None else None
+        if silver_df is not None:
+            logger.info(f"Using the streamed silver batch of {len(silver_df)} rows")
+        else:
+            if bronze_records:
+                logger.info(f"Using {len(bronze_records)} bronze records handed over in memory")
+            else:
+                try:
+                    bronze_records = extract_bronze_data_from_azure_blob_task(azure_fs_client, base_dir, date, hour_str)
+                    # logger.info(
+                    #     "Records:\n%s",
+                    #     json.dumps(bronze_records, indent=2, ensure_ascii=False)
+                    # )
+
+                except ResourceNotFoundError as e:
+                    logger.warning(
+                        "Azure file not found, falling back to Postgres | error=%s", e
+                    )
+                    bronze_records = extract_bronze_data_from_postgres(date, hour_int)
+
+            silver_df = parse_api_records(bronze_records)
 
         logger.info("Silver_df before cleaning preview:\n%s", silver_df.head(301).to_string())
 
@@ -68,21 +89,22 @@ def transform_bronze_data(date: Optional[str] = None,
         # valid = validate_silver_data(silver_df)
         #     # Step 6: load
 
-        load_silver_data_to_azure(cleaned_silver_df)
-        load_silver_data_to_postgres(cleaned_silver_df)
+        # background writes in a pipelined run, gold reads the hour from memory meanwhile
+        persist("silver_to_azure", load_silver_data_to_azure, cleaned_silver_df)
+        persist("silver_to_postgres", load_silver_data_to_postgres, cleaned_silver_df)
+        if handoff is not None and not cleaned_silver_df.empty:
+            first = cleaned_silver_df.iloc[0]
+            handoff.put("silver_hours", {silver_hour_key(first["ingest_date"], first["ingest_hour"]): cleaned_silver_df})
 
         status = "success"
-    except Exception:
-        status = "failed"
-        raise
     finally:
-        duration = (pendulum.now("UTC") - start).in_seconds()
-        # update FLOW_DURATION and PIPELINE_RUNNING for local use
-        FLOW_DURATION.labels(flow_name).observe(duration)
         PIPELINE_RUNNING.labels(flow_name).set(0)
-
-        # Push all metrics to Pushgateway
-        push_metrics_to_gateway(flow_name=flow_name, status=status, duration=duration)
+        if status == "success":
+            # in a pipelined run the writes above are only queued, silver succeeded once they are durable
+            after_persisted(["silver_to_azure", "silver_to_postgres"],
+                            lambda failed: report("failed" if failed else "success"))
+        else:
+            report(status)
 
 
 if __name__ == "__main__":
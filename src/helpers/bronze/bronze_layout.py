@@ -0,0 +1,22 @@
+from decouple import config
+
+# Bronze object layout in ADLS:
+#   "files"  - one JSON per api/place/hour: {BASE_DIR_RAW}/{date}_{api}_{place}/{HH}.json (default)
+#   "bundle" - one zstd Parquet per ingest hour with a payload column: {BASE_DIR_RAW}/bundles/{date}/{HH}.parquet
+#   "both"   - write both, silver reads the bundle first and falls back to the files (for switching over)
+BRONZE_LAYOUT = config("BRONZE_LAYOUT", default="files")
+BRONZE_LAYOUTS = ("files", "bundle", "both")
+
+BUNDLE_DIR = "bundles"
+
+
+def writes_files(layout: str = BRONZE_LAYOUT) -> bool:
+    return layout in ("files", "both")
+
+
+def writes_bundle(layout: str = BRONZE_LAYOUT) -> bool:
+    return layout in ("bundle", "both")
+
+
+def bronze_bundle_dir(base_dir: str, date: str) -> str:
+    return f"{base_dir}/{BUNDLE_DIR}/{date}"
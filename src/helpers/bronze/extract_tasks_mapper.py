@@ -1,18 +1,18 @@
-# Map API names to their functions
-from src.tasks.bronze.extract_raw_weather_data_tasks import get_accuweather_data, get_meteoblue_data,    \
-    get_tomorrow_data, get_openweathermap_data, get_weatherapi_data, get_open_meteo_data
+# Map API names to (api label, async worker) used by the async extraction engine
+from src.workers.bronze.extract_data_from_weather_APIs_workers import extract_data_from_accuweather_api, \
+    get_from_meteoblue_api, extract_data_from_tomorrow_api, extract_data_from_openweathermap_api, \
+    extract_data_from_weatherapi_api, extract_data_from_open_meteo_api
 
-api_tasks = {
-    "accuweather": get_accuweather_data,
-    "meteoblue": get_meteoblue_data,
-    "tomorrow": get_tomorrow_data,
-    "openweathermap": get_openweathermap_data,
-    "weatherapi": get_weatherapi_data,
-    "open_meteo": get_open_meteo_data,
+api_workers = {
+    "accuweather": ("accuweather_api", extract_data_from_accuweather_api),
+    "meteoblue": ("meteoblue_api", get_from_meteoblue_api),
+    "tomorrow": ("tomorrow_api", extract_data_from_tomorrow_api),
+    "openweathermap": ("openweathermap_api", extract_data_from_openweathermap_api),
+    "weatherapi": ("weatherapi_api", extract_data_from_weatherapi_api),
+    "open_meteo": ("open_meteo_api", extract_data_from_open_meteo_api),
 }
 
 
-
 # api_tasks = {
 #     "accuweather": get_accuweather_data,
 #     "meteoblue": lambda payload: get_meteoblue_data(payload[0], payload[1]),
@@ -1,7 +1,11 @@
-import requests
 import logging
+
+import httpx
 from decouple import config
 
+from src.clients.http_client import get_http_client
+from src.helpers.bronze.location_cache import cached_location
+
 # Configure logging
 logging.basicConfig(
     filename='etl_warnings.log',  # log file for ETL warnings/errors
@@ -9,15 +13,17 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+# Transport/status/decode errors are raised (not cached), None means the place was not found
+@cached_location("accuweather")
 def get_accuweather_location_id_from_place_name(place_name):
     try:
-        url = f"https://dataservice.accuweather.com/locations/v1/cities/search?q={place_name}"
+        url = "/locations/v1/cities/search"
         headers = {"Authorization": f"Bearer {config('ACCUWEATHER_API_KEY')}"}
-        response = requests.get(url, headers=headers, timeout=10)
+        response = get_http_client("accuweather").get(url, params={"q": place_name}, headers=headers)
 
         if response.status_code != 200:
             logging.warning(f"Request for '{place_name}' failed with status code {response.status_code}")
-            return None
+            response.raise_for_status()
 
         data = response.json()
         if not data:
@@ -26,15 +32,15 @@ def get_accuweather_location_id_from_place_name(place_name):
 
         return data[0].get("Key")  # safely get the first location key
 
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logging.warning(f"Request error for '{place_name}': {e}")
-        return None
+        raise
     except ValueError as e:
         logging.warning(f"JSON decode error for '{place_name}': {e}")
-        return None
+        raise
     except Exception as e:
         logging.warning(f"Unexpected error for '{place_name}': {e}")
-        return None
+        raise
 
 
 
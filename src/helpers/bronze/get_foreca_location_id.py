@@ -1,11 +1,14 @@
-import requests
 from decouple import config
 
+from src.clients.http_client import get_http_client
+from src.helpers.bronze.location_cache import cached_location
+
 """Function that return ID based on provided place name"""
 
+@cached_location("foreca")
 def get_foreca_location_id_from_place_name(place_name):
-    url = f"https://pfa.foreca.com/api/v1/location/search/{place_name}?lang=es&token={config("FORECA_API_KEY")}"
-    response = requests.get(url)
+    url = f"/api/v1/location/search/{place_name}"
+    response = get_http_client("foreca").get(url, params={"lang": "es", "token": config("FORECA_API_KEY")})
     if response.status_code != 200:
         raise Exception(f"Request failed with status code: {response.status_code}")
     else:
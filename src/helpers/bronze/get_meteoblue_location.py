@@ -1,14 +1,17 @@
-import requests
+from src.clients.http_client import get_http_client
+from src.core.exceptions import LocationNotFoundError
+from src.helpers.bronze.location_cache import cached_location
 
 
+@cached_location("meteoblue_search")
 def get_lat_lon_from_place_name(place_name, country):
-    url = f"https://www.meteoblue.com/en/server/search/query3?query={place_name}"
-    response = requests.get(url)
+    url = "/en/server/search/query3"
+    response = get_http_client("meteoblue_search").get(url, params={"query": place_name})
     data = response.json()
     results = data.get("results", [])
 
     if not results:
-        raise ValueError("No search results found")
+        raise LocationNotFoundError("No search results found")
     for result in results:
         if (result.get("name", "").lower() == place_name.lower() and
             result.get("country", "").lower() == country.lower()):
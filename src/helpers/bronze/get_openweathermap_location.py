@@ -1,14 +1,22 @@
-import requests
 from decouple import config
 
+from src.clients.http_client import get_http_client
+from src.core.exceptions import LocationNotFoundError
+from src.helpers.bronze.location_cache import cached_location
 
+
+@cached_location("openweathermap")
 def get_owm_lat_lon_from_place_name_iso_country_code(place_name, iso_country_code):
-    url = f"http://api.openweathermap.org/geo/1.0/direct?q={place_name},{iso_country_code}&limit=1&appid={config('OPENWEATHERMAP_API_KEY')}&lang=en"
-    response = requests.get(url)
+    url = "/geo/1.0/direct"
+    params = {"q": f"{place_name},{iso_country_code}", "limit": 1, "appid": config("OPENWEATHERMAP_API_KEY"),
+              "lang": "en"}
+    response = get_http_client("openweathermap").get(url, params=params)
     if response.status_code != 200:
         raise Exception(f"Request failed with status code: {response.status_code}")
     else:
         data = response.json()
+        if not data:
+            raise LocationNotFoundError(f"No location found for {place_name},{iso_country_code}")
         lat = data[0]["lat"]
         lon = data[0]["lon"]
         return lat, lon
@@ -1,13 +1,13 @@
-from os import WCONTINUED
-
-import requests
 from decouple import config
-from sqlalchemy_utils.types.password import passlib
+
+from src.clients.http_client import get_http_client
+from src.helpers.bronze.location_cache import cached_location
 
 
+@cached_location("weatherapi")
 def get_wa_lat_lon_from_place_name(place_name):
-    url = f"https://api.weatherapi.com/v1/search.json?key={config('WEATHERAPI_API_KEY')}&q={place_name}"
-    response = requests.get(url)
+    url = "/v1/search.json"
+    response = get_http_client("weatherapi").get(url, params={"key": config("WEATHERAPI_API_KEY"), "q": place_name})
     data=response.json()
     if not data:  # No results returned
         return None, None
@@ -0,0 +1,63 @@
+import json
+
+import msgspec
+import orjson
+from decouple import config
+
+from src.helpers.bronze.payload_schemas import payload_schemas
+from src.helpers.silver.source_naming_mapper import canonical_api_map
+
+"""
+JSON codec used by every bronze read/write path (API responses, ADLS files and bundles, Postgres payloads).
+
+BRONZE_JSON_CODEC: orjson (default) | msgspec | json
+BRONZE_TYPED_PAYLOADS: decode payloads of providers with a schema in payload_schemas straight into
+msgspec Structs (read by the columnar silver parsers); the rest stay dicts.
+"""
+
+BRONZE_JSON_CODEC = config("BRONZE_JSON_CODEC", default="orjson")
+BRONZE_TYPED_PAYLOADS = config("BRONZE_TYPED_PAYLOADS", default=False, cast=bool)
+
+_msgspec_encoder = msgspec.json.Encoder()
+_msgspec_decoder = msgspec.json.Decoder()
+_typed_decoders = {api_name: msgspec.json.Decoder(schema) for api_name, schema in payload_schemas.items()}
+
+
+def _orjson_dumps(obj) -> bytes:
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def _json_dumps(obj) -> bytes:
+    return json.dumps(obj).encode("utf-8")
+
+
+_codecs = {
+    "orjson": (_orjson_dumps, orjson.loads),
+    "msgspec": (_msgspec_encoder.encode, _msgspec_decoder.decode),
+    "json": (_json_dumps, json.loads),
+}
+
+
+def dumps(obj, codec: str = BRONZE_JSON_CODEC) -> bytes:
+    """Encode to UTF-8 JSON bytes (msgspec Structs are encoded by every codec)."""
+    if isinstance(obj, msgspec.Struct):
+        return _msgspec_encoder.encode(obj)
+    return _codecs[codec][0](obj)
+
+
+def dumps_str(obj, codec: str = BRONZE_JSON_CODEC) -> str:
+    return dumps(obj, codec).decode("utf-8")
+
+
+def loads(data: bytes | str, codec: str = BRONZE_JSON_CODEC):
+    return _codecs[codec][1](data)
+
+
+def decode_payload(api_name: str, data: bytes | str, typed: bool = BRONZE_TYPED_PAYLOADS):
+    """Decode a bronze payload, into its msgspec Struct when typed decoding is on and a schema exists."""
+    decoder = _typed_decoders.get(canonical_api_map.get(api_name, api_name)) if typed else None
+    if decoder is None:
+        return loads(data)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return decoder.decode(data)
@@ -0,0 +1,150 @@
+import json
+import threading
+from functools import wraps
+
+import pendulum
+import psycopg
+from decouple import config
+
+from src.clients.postgres_client import get_pg_pool
+from src.core.exceptions import LocationNotFoundError
+from src.helpers.logging_helpers.combine_loggers_helper import get_logger
+
+"""
+Location-resolution cache in front of the geocoding helpers (get_*_location*.py).
+
+Place names -> provider location id / lat,lon barely ever change, so results are kept in Postgres
+(bronze_location_cache) with a TTL and memoized per process. A lookup whose decoded response has no result
+(the helper returns None or raises LocationNotFoundError) is cached as negative for a shorter TTL, so a bad
+place name doesn't burn quota every hour. Transport/status errors and responses that can't be decoded are
+never cached - they propagate and the engine retries them.
+If the cache table is unreachable the lookup just goes to the provider.
+"""
+
+LOCATION_CACHE_ENABLED = config("LOCATION_CACHE_ENABLED", default=True, cast=bool)
+LOCATION_CACHE_TTL_HOURS = config("LOCATION_CACHE_TTL_HOURS", default=24 * 30, cast=int)
+LOCATION_CACHE_NEGATIVE_TTL_HOURS = config("LOCATION_CACHE_NEGATIVE_TTL_HOURS", default=6, cast=int)
+# an unreachable cache must not hold up the bronze fan-out, give up on the pool after this
+LOCATION_CACHE_DB_TIMEOUT_SECONDS = 5
+
+_memory: dict[tuple[str, str], tuple[object, pendulum.DateTime]] = {}
+_memory_lock = threading.Lock()
+
+
+def _lookup_key(args) -> str:
+    return json.dumps([str(a).strip().lower() for a in args])
+
+
+def _is_negative(result) -> bool:
+    return result is None or (isinstance(result, tuple) and all(v is None for v in result))
+
+
+def _from_json(value):
+    # (lat, lon) tuples come back from jsonb as lists
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _read_store(provider: str, lookup_key: str):
+    """Returns (hit, result, expires_at) from Postgres."""
+    with get_pg_pool().connection(timeout=LOCATION_CACHE_DB_TIMEOUT_SECONDS) as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT result, expires_at
+                FROM bronze_location_cache
+                WHERE provider = %s
+                  AND lookup_key = %s
+                  AND expires_at > NOW()
+                """,
+                (provider, lookup_key),
+            )
+            row = cur.fetchone()
+            if not row:
+                return False, None, None
+            expires_at = pendulum.instance(row[1], tz="UTC")
+            return True, _from_json(row[0]), expires_at
+
+
+def _write_store(provider: str, lookup_key: str, result, is_negative: bool, expires_at: pendulum.DateTime):
+    with get_pg_pool().connection(timeout=LOCATION_CACHE_DB_TIMEOUT_SECONDS) as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO bronze_location_cache (provider, lookup_key, result, is_negative, expires_at, updated_at)
+                VALUES (%s, %s, %s::jsonb, %s, %s, NOW())
+                ON CONFLICT (provider, lookup_key) DO UPDATE SET
+                    result      = EXCLUDED.result,
+                    is_negative = EXCLUDED.is_negative,
+                    expires_at  = EXCLUDED.expires_at,
+                    updated_at  = NOW()
+                """,
+                (provider, lookup_key, json.dumps(result), is_negative, expires_at),
+            )
+
+
+def _get_cached(provider: str, lookup_key: str):
+    now = pendulum.now("UTC")
+    with _memory_lock:
+        cached = _memory.get((provider, lookup_key))
+    if cached and cached[1] > now:
+        return True, cached[0]
+
+    hit, result, expires_at = _read_store(provider, lookup_key)
+    if hit:
+        with _memory_lock:
+            _memory[(provider, lookup_key)] = (result, expires_at)
+    return hit, result
+
+
+def _put_cached(provider: str, lookup_key: str, result):
+    is_negative = _is_negative(result)
+    ttl_hours = LOCATION_CACHE_NEGATIVE_TTL_HOURS if is_negative else LOCATION_CACHE_TTL_HOURS
+    expires_at = pendulum.now("UTC").add(hours=ttl_hours)
+
+    with _memory_lock:
+        _memory[(provider, lookup_key)] = (result, expires_at)
+    _write_store(provider, lookup_key, result, is_negative, expires_at)
+
+
+def cached_location(provider: str):
+    """
+    Decorator for a geocoding helper. Cached results are returned without an HTTP call,
+    negative entries return None. func.refresh(*args) skips the read and re-resolves (used by the warm-up).
+    """
+
+    def decorator(func):
+        def resolve(lookup_key, *args):
+            logger = get_logger()
+            try:
+                result = func(*args)
+            except LocationNotFoundError as e:
+                logger.warning(f"Location not found | provider={provider} | query={args} | error={e}")
+                result = None
+
+            try:
+                _put_cached(provider, lookup_key, result)
+            except psycopg.Error as e:
+                logger.warning(f"Location cache write failed | provider={provider} | error={e}")
+            return result
+
+        @wraps(func)
+        def wrapper(*args):
+            if not LOCATION_CACHE_ENABLED:
+                return func(*args)
+
+            logger = get_logger()
+            lookup_key = _lookup_key(args)
+            try:
+                hit, result = _get_cached(provider, lookup_key)
+                if hit:
+                    logger.debug(f"Location cache hit | provider={provider} | query={args}")
+                    return result
+            except psycopg.Error as e:
+                logger.warning(f"Location cache read failed, calling provider | provider={provider} | error={e}")
+
+            return resolve(lookup_key, *args)
+
+        wrapper.refresh = lambda *args: resolve(_lookup_key(args), *args)
+        return wrapper
+
+    return decorator
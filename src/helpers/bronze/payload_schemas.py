@@ -0,0 +1,139 @@
+import msgspec
+
+"""
+Optional msgspec schemas for bronze payloads. Only the fields silver reads are declared,
+everything else in the provider response is skipped while decoding.
+Registered in payload_schemas so json_codec.decode_payload can decode straight into them,
+the columnar silver parsers read these with attribute access instead of dict lookups.
+Structs are frozen - silver only reads them, and nested defaults have to be immutable.
+"""
+
+
+# ── Open-Meteo ────────────────────────────────────────────────────────────────
+
+class OpenMeteoDaily(msgspec.Struct, frozen=True):
+    time: list[str] = []
+    temperature_2m_max: list[float | None] = []
+    temperature_2m_min: list[float | None] = []
+    precipitation_sum: list[float | None] = []
+    rain_sum: list[float | None] = []
+    windspeed_10m_max: list[float | None] = []
+    cloudcover_mean: list[float | None] = []
+    weathercode: list[int | None] = []
+
+
+class OpenMeteoPayload(msgspec.Struct, frozen=True):
+    daily: OpenMeteoDaily = OpenMeteoDaily()
+
+
+# ── Meteoblue ─────────────────────────────────────────────────────────────────
+
+class MeteoblueMetadata(msgspec.Struct, frozen=True):
+    utc_timeoffset: float = 0
+
+
+class MeteoblueDataDay(msgspec.Struct, frozen=True):
+    time: list[str] = []
+    temperature_max: list[float | None] = []
+    temperature_min: list[float | None] = []
+    temperature_mean: list[float | None] = []
+    precipitation_sum: list[float | None] = []
+
+
+class MeteobluePayload(msgspec.Struct, frozen=True):
+    metadata: MeteoblueMetadata = MeteoblueMetadata()
+    data_day: MeteoblueDataDay = MeteoblueDataDay()
+
+
+# ── OpenWeatherMap ────────────────────────────────────────────────────────────
+
+class OwmCity(msgspec.Struct, frozen=True):
+    timezone: int = 0
+
+
+class OwmMain(msgspec.Struct, frozen=True):
+    temp: float | None = None
+    temp_min: float | None = None
+    temp_max: float | None = None
+    humidity: float | None = None
+
+
+class OwmWeather(msgspec.Struct, frozen=True):
+    id: int | None = None
+    description: str | None = None
+    icon: str | None = None
+
+
+class OwmWind(msgspec.Struct, frozen=True):
+    speed: float | None = None
+    deg: float | None = None
+
+
+class OwmClouds(msgspec.Struct, frozen=True):
+    all: float | None = None
+
+
+class OwmEntry(msgspec.Struct, frozen=True):
+    dt_txt: str
+    main: OwmMain = OwmMain()
+    weather: list[OwmWeather] = []
+    wind: OwmWind = OwmWind()
+    clouds: OwmClouds = OwmClouds()
+    pop: float | None = None
+
+
+class OpenWeatherMapPayload(msgspec.Struct, frozen=True):
+    city: OwmCity = OwmCity()
+    # "list" in the response, renamed so it doesn't shadow the builtin in the class body
+    entries: list[OwmEntry] = msgspec.field(default=[], name="list")
+
+
+# ── WeatherAPI ────────────────────────────────────────────────────────────────
+
+class WeatherApiLocation(msgspec.Struct, frozen=True):
+    tz_id: str = "UTC"
+
+
+class WeatherApiCondition(msgspec.Struct, frozen=True):
+    text: str | None = None
+    icon: str | None = None
+    code: int | None = None
+
+
+class WeatherApiDay(msgspec.Struct, frozen=True):
+    maxtemp_c: float | None = None
+    mintemp_c: float | None = None
+    avgtemp_c: float | None = None
+    totalprecip_mm: float | None = None
+    daily_chance_of_rain: float | None = None
+    maxwind_kph: float | None = None
+    condition: WeatherApiCondition = WeatherApiCondition()
+
+
+class WeatherApiAstro(msgspec.Struct, frozen=True):
+    sunrise: str | None = None
+    sunset: str | None = None
+
+
+class WeatherApiForecastDay(msgspec.Struct, frozen=True):
+    date: str
+    day: WeatherApiDay = WeatherApiDay()
+    astro: WeatherApiAstro = WeatherApiAstro()
+
+
+class WeatherApiForecast(msgspec.Struct, frozen=True):
+    forecastday: list[WeatherApiForecastDay] = []
+
+
+class WeatherApiPayload(msgspec.Struct, frozen=True):
+    location: WeatherApiLocation = WeatherApiLocation()
+    forecast: WeatherApiForecast = WeatherApiForecast()
+
+
+# api name (bronze folder / canonical name) -> schema
+payload_schemas = {
+    "open_meteo": OpenMeteoPayload,
+    "meteoblue": MeteobluePayload,
+    "openweathermap": OpenWeatherMapPayload,
+    "weatherapi": WeatherApiPayload,
+}
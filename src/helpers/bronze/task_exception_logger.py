@@ -1,5 +1,6 @@
 import time
 
+import httpx
 from requests import RequestException
 
 from src.helpers.logging_helpers.combine_loggers_helper import get_logger
@@ -84,3 +85,87 @@ def call_api_with_logging(api_func, *args, name=None, **kwargs):
     )
 
     return result
+
+
+async def call_api_with_logging_async(api_func, *args, name=None, **kwargs):
+    """Coroutine twin of call_api_with_logging for the async bronze workers.
+
+    httpx transport/status errors are re-raised as retryable, the same way RequestException is above.
+    Metrics are only recorded here, the metrics buffer pushes them from its own thread.
+    """
+    logger = get_logger()
+    display_name = name or "unknown location"
+    api_name = api_func.__name__
+    start_time = time.time()
+
+    try:
+        result = await api_func(*args, **kwargs)
+
+        if not result:
+            logger.error(
+                "API returned empty response | api=%s | target=%s",
+                api_name,
+                display_name,
+                extra={
+                    "api": api_name,
+                    "target": display_name,
+                    "result": "empty",
+                }
+            )
+            push_api_error_metrics(api_name=api_name, location=display_name, error_type="empty")
+            raise RuntimeError(f"Empty response for {display_name}")
+
+    except (httpx.HTTPError, RequestException) as e:
+        logger.warning(
+            "API request failed, will retry | api=%s | target=%s | error=%s",
+            api_name,
+            display_name,
+            e,
+            exc_info=True,
+            extra={
+                "api": api_name,
+                "target": display_name,
+                "retryable": True,
+            }
+        )
+        push_api_error_metrics(api_name=api_name, location=display_name, error_type="retryable")
+        raise  # engine retry
+
+    except Exception as e:
+        logger.error(
+            "Non-retryable API error | api=%s | target=%s | error=%s",
+            api_name,
+            display_name,
+            e,
+            exc_info=True,
+            extra={
+                "api": api_name,
+                "target": display_name,
+                "retryable": False,
+            }
+        )
+        push_api_error_metrics(api_name=api_name, location=display_name, error_type="non-retryable")
+        raise RuntimeError(f"Non-retryable error for {display_name}")
+
+    finally:
+        duration = time.time() - start_time
+        logger.info(
+            "API duration | api=%s | target=%s | duration=%.3fs",
+            api_name,
+            display_name,
+            duration,
+        )
+        push_api_metrics(api_name=api_name, location=display_name, duration=duration)
+
+    logger.info(
+        "API call succeeded | api=%s | target=%s",
+        api_name,
+        display_name,
+        extra={
+            "api": api_name,
+            "target": display_name,
+            "result": "success",
+        }
+    )
+
+    return result
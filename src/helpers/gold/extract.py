@@ -3,11 +3,11 @@ from typing import Optional
 
 import pandas as pd
 import pendulum
-import psycopg2
 from azure.core.exceptions import ResourceNotFoundError
-from decouple import config
 from sqlalchemy import create_engine, text
 
+from src.clients.postgres_client import get_pg_pool
+
 expected_months_map = {
     "winter": {12, 1, 2},
     "spring": {3, 4, 5},
@@ -183,8 +183,7 @@ def get_last_processed_timestamp(pipeline_name: str) -> Optional[pendulum.DateTi
     Return last successfully processed timestamp for the pipeline.
     If not records, return None.
     """
-    conn = psycopg2.connect(config("DB_CONN_RAW"))
-    try:
+    with get_pg_pool().connection() as conn:
         with conn.cursor() as cur:
             cur.execute(
                 """
@@ -203,6 +202,3 @@ def get_last_processed_timestamp(pipeline_name: str) -> Optional[pendulum.DateTi
 
         # Конвертираме в pendulum UTC (production-safe сравнения)
         return pendulum.instance(row[0]).in_timezone("UTC")
-
-    finally:
-        conn.close()
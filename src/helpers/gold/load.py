@@ -1,6 +1,6 @@
-import psycopg2
 from azure.core.exceptions import ResourceExistsError
-from decouple import config
+
+from src.clients.postgres_client import get_pg_pool
 
 
 def upload_gold_bytes(fs_client, base_dir, year_folder_name, month_folder_name, day_folder_name, file_name,
@@ -63,17 +63,16 @@ def upload_parquet_bytes(fs_client, base_dir, path_parts,
 
 
 def update_last_processed_timestamp(pipeline_name: str, new_timestamp):
-    conn = psycopg2.connect(config("DB_CONN_RAW"))
-    with conn.cursor() as cur:
-        cur.execute(
-            """
-            INSERT INTO pipeline_metadata (pipeline_name, last_processed_timestamp)
-            VALUES (%s, %s)
-            ON CONFLICT (pipeline_name)
-            DO UPDATE SET
-                last_processed_timestamp = EXCLUDED.last_processed_timestamp,
-                updated_at = NOW()
-            """,
-            (pipeline_name, new_timestamp)
-        )
-    conn.commit()
+    with get_pg_pool().connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO pipeline_metadata (pipeline_name, last_processed_timestamp)
+                VALUES (%s, %s)
+                ON CONFLICT (pipeline_name)
+                DO UPDATE SET
+                    last_processed_timestamp = EXCLUDED.last_processed_timestamp,
+                    updated_at = NOW()
+                """,
+                (pipeline_name, new_timestamp)
+            )
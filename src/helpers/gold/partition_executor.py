@@ -0,0 +1,70 @@
+import contextvars
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable, TypeVar
+
+from decouple import config
+
+from src.clients.postgres_client import PG_POOL_MAX_SIZE
+from src.helpers.logging_helpers.combine_loggers_helper import get_logger
+
+"""
+Runs the independent pending partitions of a gold flow (weeks, months, seasons) side by side.
+
+Every partition does its own extract -> transform -> load and writes its own processing_state rows,
+so while one worker waits on ADLS/Postgres another one aggregates. Workers are threads: the I/O
+releases the GIL, so does most of the pandas/numpy work, and the Prefect task calls of a partition
+run inside a copy of the flow's context, so they are still reported as tasks of the flow run.
+
+GOLD_PARTITION_MAX_WORKERS = 0 means one worker per core, capped by PG_POOL_MAX_SIZE so every
+worker can hold a database connection. 1 keeps the old one-partition-at-a-time loop.
+"""
+
+# 0 -> min(cpu count, PG_POOL_MAX_SIZE)
+GOLD_PARTITION_MAX_WORKERS = config("GOLD_PARTITION_MAX_WORKERS", default=0, cast=int)
+
+P = TypeVar("P")
+R = TypeVar("R")
+
+
+def partition_workers(partition_count: int, max_workers: int = None) -> int:
+    if max_workers is None:
+        max_workers = GOLD_PARTITION_MAX_WORKERS
+    if max_workers <= 0:
+        max_workers = min(os.cpu_count() or 1, PG_POOL_MAX_SIZE)
+    return max(1, min(max_workers, partition_count))
+
+
+def run_partitions(process_fn: Callable[[P], R], partitions: Iterable[P], max_workers: int = None,
+                   thread_name_prefix: str = "gold-partition") -> list[R]:
+    """
+    process_fn(partition) for every partition, on a bounded thread pool. Results come back in
+    partition order. An exception doesn't stop the other partitions, the first one is re-raised
+    once all of them have finished.
+    """
+    logger = get_logger()
+    partitions = list(partitions)
+    workers = partition_workers(len(partitions), max_workers)
+
+    if workers == 1:
+        return [process_fn(partition) for partition in partitions]
+
+    results = {}
+    errors = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=thread_name_prefix) as pool:
+        # one context copy per partition, a Context can't be entered by two threads at once
+        futures = {
+            pool.submit(contextvars.copy_context().run, process_fn, partition): i
+            for i, partition in enumerate(partitions)
+        }
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                logger.exception(f"Partition {partitions[i]} raised")
+                errors[i] = e
+
+    if errors:
+        raise errors[min(errors)]
+    return [results[i] for i in range(len(partitions))]
@@ -0,0 +1,70 @@
+import importlib
+import importlib.util
+import sys
+import threading
+import types
+
+"""
+Deferred imports for heavy modules only some code paths use (pyarrow.parquet on the cache/bundle
+paths, pandera for the scraped-site validation). Module level code keeps its usual shape:
+
+    pq = lazy_module("pyarrow.parquet")          # instead of import pyarrow.parquet as pq
+    validate = lazy_callable("src.validation.scraped_data.x", "validate")
+
+and the import runs on first attribute access / first call instead of when the flow module is
+loaded. scripts/benchmark_startup.py shows what each deployment entrypoint still imports up front.
+"""
+
+_lock = threading.Lock()
+
+
+class _DeferredModule(types.ModuleType):
+    """
+    Stand-in for a module that is imported on first attribute access. It never goes into sys.modules,
+    other importers (pandas' own `import pyarrow.parquet`) get the real module, and concurrent first
+    accesses wait on the lock for one complete import. importlib.util.LazyLoader is not thread-safe on
+    3.11: threads racing the first access saw a half-initialised module.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_module"] = None
+
+    def _load(self):
+        module = self.__dict__["_module"]
+        if module is None:
+            with _lock:
+                module = self.__dict__["_module"]
+                if module is None:
+                    module = self.__dict__["_module"] = importlib.import_module(self.__name__)
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def lazy_module(name: str):
+    """The module `name` when it is already imported, otherwise a stand-in importing it on first attribute access."""
+    if name in sys.modules:
+        return sys.modules[name]
+    if importlib.util.find_spec(name) is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    return _DeferredModule(name)
+
+
+def lazy_callable(module: str, name: str):
+    """A function that imports module.name on its first call and forwards to it."""
+    target = None
+
+    def call(*args, **kwargs):
+        nonlocal target
+        if target is None:
+            target = getattr(importlib.import_module(module), name)
+        return target(*args, **kwargs)
+
+    call.__name__ = call.__qualname__ = name
+    call.__doc__ = f"Deferred {module}.{name}, imported on first call."
+    return call
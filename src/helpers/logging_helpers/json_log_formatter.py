@@ -1,6 +1,16 @@
-import json
 import logging
 
+import orjson
+
+_STANDARD_ATTRS = frozenset((
+    "name", "msg", "args", "levelname", "levelno",
+    "pathname", "filename", "module", "exc_info",
+    "exc_text", "stack_info", "lineno", "funcName",
+    "created", "msecs", "relativeCreated", "thread",
+    "threadName", "processName", "process", "message", "taskName",
+))
+
+
 class JSONFormatter(logging.Formatter):
     def format(self, record):
         log_record = {
@@ -11,11 +21,13 @@ class JSONFormatter(logging.Formatter):
         }
         # Include all extra fields (excluding standard logging attrs)
         for key, value in record.__dict__.items():
-            if key not in ("name", "msg", "args", "levelname", "levelno",
-                           "pathname", "filename", "module", "exc_info",
-                           "exc_text", "stack_info", "lineno", "funcName",
-                           "created", "msecs", "relativeCreated", "thread",
-                           "threadName", "processName", "process"):
+            if key not in _STANDARD_ATTRS:
                 log_record[key] = value
 
-        return json.dumps(log_record)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            log_record["exception"] = record.exc_text
+
+        # orjson: datetimes / numpy natively, anything else (pendulum, paths, ...) as str
+        return orjson.dumps(log_record, default=str, option=orjson.OPT_SERIALIZE_NUMPY).decode()
@@ -0,0 +1,173 @@
+import copy
+import logging
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+import orjson
+from decouple import config
+from logging_loki.emitter import LokiEmitterV1
+
+"""
+Non-blocking log shipping to Loki.
+
+    ETL thread  -> LokiQueueHandler   (record copied into a bounded queue, never blocks)
+    listener    -> BatchingLokiHandler (formats with JSONFormatter, groups lines per label set)
+    flusher     -> one POST /loki/api/v1/push per LOKI_FLUSH_INTERVAL_SECONDS or LOKI_BATCH_SIZE lines
+
+Under backpressure (queue more than LOKI_PRESSURE_RATIO full) only every LOKI_PRESSURE_SAMPLE_RATE-th
+INFO/DEBUG record is kept, once the queue is full records are dropped. Dropped records are counted
+and reported as one warning line in the next push. A failed push drops its batch (stderr note), the
+pipeline never waits on Loki.
+"""
+
+LOKI_BATCH_SIZE = config("LOKI_BATCH_SIZE", default=500, cast=int)
+LOKI_FLUSH_INTERVAL_SECONDS = config("LOKI_FLUSH_INTERVAL_SECONDS", default=2, cast=float)
+LOKI_QUEUE_MAX_SIZE = config("LOKI_QUEUE_MAX_SIZE", default=10000, cast=int)
+LOKI_PRESSURE_RATIO = config("LOKI_PRESSURE_RATIO", default=0.8, cast=float)
+LOKI_PRESSURE_SAMPLE_RATE = config("LOKI_PRESSURE_SAMPLE_RATE", default=10, cast=int)
+LOKI_PUSH_TIMEOUT_SECONDS = config("LOKI_PUSH_TIMEOUT_SECONDS", default=5, cast=float)
+
+_plain_formatter = logging.Formatter()
+
+
+class BatchingLokiHandler(logging.Handler):
+    """Buffers formatted lines per Loki stream and pushes them in one request."""
+
+    def __init__(self, url: str, tags: dict | None = None, batch_size: int = LOKI_BATCH_SIZE,
+                 flush_interval: float = LOKI_FLUSH_INTERVAL_SECONDS):
+        super().__init__()
+        self.emitter = LokiEmitterV1(url, tags)  # labels (tags, severity, logger) built like LokiHandler
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0  # incremented by LokiQueueHandler
+        self._streams: dict[tuple, list] = {}
+        self._pending = 0
+        self._batch_lock = threading.Lock()
+        self._push_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._flusher = threading.Thread(target=self._run, name="loki-flush", daemon=True)
+        self._flusher.start()
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            line = self.format(record)
+            labels = self.emitter.build_tags(record)
+        except Exception:
+            self.handleError(record)
+            return
+        self._append(labels, str(int(record.created * 1e9)), line)
+
+    def _append(self, labels: dict, ts: str, line: str):
+        key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        with self._batch_lock:
+            self._streams.setdefault(key, []).append([ts, line])
+            self._pending += 1
+            full = self._pending >= self.batch_size
+        if full:
+            self.flush()
+
+    def _take_batch(self) -> dict | None:
+        with self._batch_lock:
+            if self.dropped:
+                record = logging.LogRecord("loki", logging.WARNING, __file__, 0,
+                                           f"Dropped {self.dropped} log record(s) under backpressure", None, None)
+                self.dropped = 0
+                key = tuple(sorted((k, str(v)) for k, v in self.emitter.build_tags(record).items()))
+                self._streams.setdefault(key, []).append([str(int(record.created * 1e9)), record.getMessage()])
+            if not self._streams:
+                return None
+            streams, self._streams, self._pending = self._streams, {}, 0
+        return {"streams": [{"stream": dict(key), "values": values} for key, values in streams.items()]}
+
+    def flush(self):
+        with self._push_lock:  # keeps pushes in order
+            payload = self._take_batch()
+            if payload is None:
+                return
+            try:
+                resp = self.emitter.session.post(self.emitter.url, data=orjson.dumps(payload),
+                                                 headers={"Content-Type": "application/json"},
+                                                 timeout=LOKI_PUSH_TIMEOUT_SECONDS)
+                if resp.status_code != self.emitter.success_response_code:
+                    raise ValueError(f"Unexpected Loki API response status code: {resp.status_code}")
+            except Exception as e:
+                lines = sum(len(stream["values"]) for stream in payload["streams"])
+                sys.stderr.write(f"Loki push failed, dropped {lines} log line(s): {e}\n")
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def close(self):
+        self._stop.set()
+        self.flush()
+        self.emitter.close()
+        super().close()
+
+
+class LokiQueueHandler(QueueHandler):
+    """
+    Root-logger side of the pipeline: puts a copy of the record on the bounded queue and returns.
+    Formatting (JSONFormatter set through dictConfig) happens on the listener thread.
+    """
+
+    def __init__(self, log_queue: queue.Queue, target: BatchingLokiHandler,
+                 pressure_ratio: float = LOKI_PRESSURE_RATIO, sample_rate: int = LOKI_PRESSURE_SAMPLE_RATE):
+        super().__init__(log_queue)
+        self.target = target
+        self.pressure_size = max(1, int(log_queue.maxsize * pressure_ratio)) if log_queue.maxsize else None
+        self.sample_rate = max(1, sample_rate)
+        self._sampled = 0
+        self.listener = _BlockingSentinelListener(log_queue, target, respect_handler_level=False)
+        self.listener.start()
+
+    def setFormatter(self, fmt):
+        self.target.setFormatter(fmt)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # same as QueueHandler.prepare minus the formatting: merge args, render the traceback
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            record.exc_text = record.exc_text or _plain_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        record.stack_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        if self.pressure_size is not None and record.levelno < logging.WARNING \
+                and self.queue.qsize() >= self.pressure_size:
+            self._sampled += 1
+            if self._sampled % self.sample_rate:
+                self.target.dropped += 1
+                return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.target.dropped += 1
+
+    def close(self):
+        # logging.shutdown (exit) and dictConfig (setup_logging again) close the root handlers
+        if self.listener is not None:
+            self.listener.stop()  # drains the queue into the batch
+            self.listener = None
+            self.target.close()  # last push
+        super().close()
+
+
+class _BlockingSentinelListener(QueueListener):
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)  # the queue may be full, the listener thread is draining it
+
+    def stop(self):
+        if self._thread is not None:  # a stopped listener doesn't drain, the sentinel would never fit
+            super().stop()
+
+
+def queued_loki_handler(url: str, tags: dict | None = None,
+                        max_queue_size: int = LOKI_QUEUE_MAX_SIZE) -> LokiQueueHandler:
+    """dictConfig factory ("()") for the "loki" handler."""
+    return LokiQueueHandler(queue.Queue(maxsize=max_queue_size), BatchingLokiHandler(url, tags))
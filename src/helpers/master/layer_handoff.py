@@ -0,0 +1,158 @@
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+
+from decouple import config
+
+from src.helpers.bronze.json_codec import BRONZE_TYPED_PAYLOADS, decode_payload, dumps
+from src.helpers.logging_helpers.combine_loggers_helper import get_logger
+
+"""
+In-memory handoff between the layers of one orchestrator run.
+
+    with pipelined_run():          # orchestrator_flow
+        weather_flow_run()         # put("silver_df", ...)       - responses parsed as they arrived (streaming_silver_batch)
+                                   #  or put("bronze_records", ...) - the hour's raw records, as silver reads them
+        transform_bronze_data()    # take either, put("silver_hours", {"YYYY-MM-DD HH": df})
+        daily_forecast()           # take("silver_hours"), only hours it doesn't hold are downloaded
+
+Inside the block the ADLS/Postgres writes of bronze and silver go through persist(), which runs them on
+a small thread pool while the next layer already works on the data; the block waits for all of them
+and raises when one failed, so the run is only successful once everything is durable. A layer that
+reports its own outcome does so from after_persisted(), once its writes are durable. Outside a
+pipelined run (flows started on their own, backfills) put/take are no-ops and persist() writes inline.
+
+The data is handed over through a context variable rather than flow parameters/results: subflow
+parameters are sent to the Prefect API, the raw payloads of an hour should not be.
+"""
+
+PIPELINE_HANDOFF = config("PIPELINE_HANDOFF", default=True, cast=bool)
+HANDOFF_WRITE_WORKERS = config("HANDOFF_WRITE_WORKERS", default=4, cast=int)
+
+
+class LayerHandoff:
+    def __init__(self, write_workers: int = HANDOFF_WRITE_WORKERS):
+        self._data = {}
+        self._pool = ThreadPoolExecutor(max_workers=write_workers, thread_name_prefix="handoff-write")
+        self._writes = []
+
+    def put(self, key: str, value):
+        self._data[key] = value
+
+    def take(self, key: str, default=None):
+        return self._data.pop(key, default)
+
+    def submit_write(self, name: str, fn, *args, **kwargs):
+        # Prefect task calls in the write keep the flow run context
+        future = self._pool.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+        self._writes.append((name, future))
+        return future
+
+    def after_writes(self, names: list[str], callback):
+        """callback(failed names) once the named writes submitted so far finished, on the thread of the last one."""
+        writes = [(name, future) for name, future in self._writes if name in names]
+        if not writes:
+            callback([])
+            return
+        lock = threading.Lock()
+        pending = [len(writes)]
+
+        def done(_):
+            with lock:
+                pending[0] -= 1
+                if pending[0]:
+                    return
+            callback([name for name, future in writes if future.exception() is not None])
+
+        for _, future in writes:
+            future.add_done_callback(done)
+
+    def wait_for_writes(self) -> list[str]:
+        """Blocks until every submitted write finished, returns the names of the failed ones."""
+        logger = get_logger()
+        wait([future for _, future in self._writes])
+        failed = []
+        for name, future in self._writes:
+            if future.exception() is not None:
+                logger.error(f"Background write failed | write={name} | error={future.exception()}",
+                             exc_info=future.exception())
+                failed.append(name)
+        self._writes = []
+        self._pool.shutdown()
+        return failed
+
+
+_current: contextvars.ContextVar[LayerHandoff | None] = contextvars.ContextVar("layer_handoff", default=None)
+
+
+def current_handoff() -> LayerHandoff | None:
+    return _current.get()
+
+
+@contextmanager
+def pipelined_run(enabled: bool = PIPELINE_HANDOFF):
+    """Scope of one pipelined orchestrator run, yields None when the handoff is disabled."""
+    if not enabled:
+        yield None
+        return
+
+    handoff = LayerHandoff()
+    token = _current.set(handoff)
+    try:
+        yield handoff
+    except BaseException:
+        # a layer failed: still let the writes of the earlier layers finish, the layer's error wins
+        handoff.wait_for_writes()
+        raise
+    finally:
+        _current.reset(token)
+
+    failed = handoff.wait_for_writes()
+    if failed:
+        raise RuntimeError(f"Pipelined run finished, but background writes failed: {failed}")
+
+
+def persist(name: str, fn, *args, **kwargs):
+    """Run a persistence write: in the background inside a pipelined run, inline otherwise."""
+    handoff = current_handoff()
+    if handoff is None:
+        return fn(*args, **kwargs)
+    handoff.submit_write(name, fn, *args, **kwargs)
+    return None
+
+
+def after_persisted(names: list[str], callback):
+    """
+    callback(failed names) once the named persist() writes are durable: when the background writes
+    finished inside a pipelined run, right away outside one (persist() already wrote inline).
+    """
+    handoff = current_handoff()
+    if handoff is None:
+        callback([])
+        return
+    handoff.after_writes(names, callback)
+
+
+def bronze_records_from_results(results: list[dict], date_str: str, hour_str: str) -> list[dict]:
+    """
+    Extract results of the bronze flow in the record shape silver reads from ADLS
+    (download_json_from_adls_worker): {"source", "place_name", "ingest_date", "ingest_hour", "payload"}.
+    """
+    return [
+        {
+            "source": result["api_name"],
+            "place_name": result["label"],
+            "ingest_date": date_str,
+            "ingest_hour": int(hour_str),
+            # typed payloads are msgspec Structs, decoded from the same bytes that were uploaded
+            "payload": decode_payload(result["api_name"], dumps(result["data"])) if BRONZE_TYPED_PAYLOADS
+            else result["data"],
+        }
+        for result in results
+    ]
+
+
+def silver_hour_key(ingest_date, ingest_hour) -> str:
+    """Key of a silver hour in the handoff, "YYYY-MM-DD HH" (ingest_date may be a str, date or datetime)."""
+    return f"{str(ingest_date)[:10]} {int(ingest_hour):02d}"
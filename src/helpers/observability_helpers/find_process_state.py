@@ -1,9 +1,68 @@
+import os
+import socket
+
 import pendulum
-import psycopg2
 from decouple import config
 
+from src.clients.postgres_client import get_pg_pool
+from src.helpers.logging_helpers.combine_loggers_helper import get_logger
 from src.helpers.observability_helpers.pipeline_config import PIPELINE_CONFIG
 
+# claim - pending rows are moved to 'processing' under a lease (FOR UPDATE SKIP LOCKED), safe with
+# several workers on one level | select - plain SELECT, the flow marks them processing itself
+WORK_CLAIM_MODE = config("WORK_CLAIM_MODE", default="claim")
+# a claimed partition not finished within this many seconds can be claimed by another worker
+WORK_LEASE_SECONDS = config("WORK_LEASE_SECONDS", default=3600, cast=int)
+# partitions claimed per call, 0 = all claimable (one worker) - set it when several containers share a level
+WORK_CLAIM_BATCH_SIZE = config("WORK_CLAIM_BATCH_SIZE", default=0, cast=int)
+
+
+def _pending_conditions(
+        processing_level: str,
+        statuses: list[str],
+        error_types: list,
+        max_retries: int,
+        period_name: str | None = None,
+) -> tuple[str, list]:
+    """WHERE clause (and its params) of the rows get_pending_work / claim_pending_work pick up."""
+    # Split None from real values
+    real_errors = [e for e in error_types if e is not None]
+    include_null = None in error_types
+
+    status_placeholders = ",".join(["%s"] * len(statuses))
+
+    # Build error_type clause
+    if real_errors and include_null:
+        error_placeholders = ",".join(["%s"] * len(real_errors))
+        error_clause = f"AND (error_type IN ({error_placeholders}) OR error_type IS NULL)"
+        error_params = real_errors
+    elif real_errors:
+        error_placeholders = ",".join(["%s"] * len(real_errors))
+        error_clause = f"AND error_type IN ({error_placeholders})"
+        error_params = real_errors
+    elif include_null:
+        error_clause = "AND error_type IS NULL"
+        error_params = []
+    else:
+        error_clause = ""
+        error_params = []
+
+    conditions = [
+        "processing_level = %s",
+        f"status IN ({status_placeholders})",
+        "retry_count < %s",
+    ]
+    params = [processing_level, *statuses, max_retries, *error_params]
+
+    if error_clause:
+        conditions.append(error_clause.removeprefix("AND "))
+
+    if period_name:
+        conditions.append("period_name = %s")
+        params.append(period_name)
+
+    return " AND ".join(conditions), params
+
 
 def get_pending_work(
         processing_level: str,
@@ -18,52 +77,15 @@ def get_pending_work(
 
     None in error_types → includes rows where error_type IS NULL.
     """
-    conn = psycopg2.connect(config("DB_CONN_RAW"))
     # max_retries = {
     #     "gold_weekly": 3,  # 3 пускания = 3 седмици = приемаме загубата
     #     "gold_daily": 5,
     #     "bronze": 10,  # API issues се оправят по-бързо
     # }
 
-    try:
-        # Split None from real values
-        real_errors = [e for e in error_types if e is not None]
-        include_null = None in error_types
-
-        status_placeholders = ",".join(["%s"] * len(statuses))
-
-        # Build error_type clause
-        if real_errors and include_null:
-            error_placeholders = ",".join(["%s"] * len(real_errors))
-            error_clause = f"AND (error_type IN ({error_placeholders}) OR error_type IS NULL)"
-            error_params = real_errors
-        elif real_errors:
-            error_placeholders = ",".join(["%s"] * len(real_errors))
-            error_clause = f"AND error_type IN ({error_placeholders})"
-            error_params = real_errors
-        elif include_null:
-            error_clause = "AND error_type IS NULL"
-            error_params = []
-        else:
-            error_clause = ""
-            error_params = []
-
-        conditions = [
-            "processing_level = %s",
-            f"status IN ({status_placeholders})",
-            "retry_count < %s",
-        ]
-        params = [processing_level, *statuses, max_retries, *error_params]
-
-        if error_clause:
-            conditions.append(error_clause.removeprefix("AND "))
-
-        if period_name:
-            conditions.append("period_name = %s")
-            params.append(period_name)
-
-        where_clause = " AND ".join(conditions)
+    where_clause, params = _pending_conditions(processing_level, statuses, error_types, max_retries, period_name)
 
+    with get_pg_pool().connection() as conn:
         query = f"""
             SELECT partition_date
             FROM processing_state
@@ -80,5 +102,84 @@ def get_pending_work(
             for row in rows
         ]
 
-    finally:
-        conn.close()
+
+def default_lease_owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def claim_pending_work(
+        processing_level: str,
+        statuses: list[str],
+        error_types: list,
+        max_retries: int,
+        period_name: str | None = None,
+        limit: int | None = None,
+        lease_seconds: int | None = None,
+        owner: str | None = None,
+) -> list[pendulum.DateTime]:
+    """
+    Same rows as get_pending_work, plus 'processing' rows whose lease expired (the worker died),
+    atomically moved to 'processing' under a lease of this worker. Rows claimed by a concurrent
+    worker are locked or already leased and skipped, so every partition goes to exactly one worker.
+
+    Reclaiming an expired lease counts as a retry. The lease ends with the next non-processing
+    upsert_state_fn of the partition (success / failed / pending).
+    WORK_CLAIM_MODE=select falls back to get_pending_work.
+    """
+    if WORK_CLAIM_MODE != "claim":
+        return get_pending_work(processing_level, statuses, error_types, max_retries, period_name)
+
+    logger = get_logger()
+    limit = limit if limit is not None else (WORK_CLAIM_BATCH_SIZE or None)
+    lease_seconds = lease_seconds or WORK_LEASE_SECONDS
+    owner = owner or default_lease_owner()
+
+    pending_clause, pending_params = _pending_conditions(processing_level, statuses, error_types, max_retries,
+                                                         period_name)
+    expired_clause = (
+        "processing_level = %s AND status = 'processing' AND lease_expires_at < NOW() AND retry_count < %s"
+    )
+    expired_params = [processing_level, max_retries]
+    if period_name:
+        expired_clause += " AND period_name = %s"
+        expired_params.append(period_name)
+
+    query = f"""
+        WITH claimable AS (
+            SELECT processing_level, partition_date, status AS previous_status
+            FROM processing_state
+            WHERE ({pending_clause}) OR ({expired_clause})
+            ORDER BY partition_date
+            {"LIMIT %s" if limit else ""}
+            FOR UPDATE SKIP LOCKED
+        )
+        UPDATE processing_state ps
+        SET status           = 'processing',
+            lease_owner      = %s,
+            lease_expires_at = NOW() + make_interval(secs => %s),
+            retry_count      = ps.retry_count + (c.previous_status = 'processing')::int,
+            updated_at       = NOW()
+        FROM claimable c
+        WHERE ps.processing_level = c.processing_level
+          AND ps.partition_date = c.partition_date
+        RETURNING ps.partition_date, c.previous_status
+    """
+    params = [*pending_params, *expired_params, *([limit] if limit else []), owner, lease_seconds]
+
+    with get_pg_pool().connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(query, params)
+            rows = sorted(cur.fetchall())
+
+    reclaimed = [row[0].isoformat() for row in rows if row[1] == "processing"]
+    if reclaimed:
+        logger.warning(f"[{processing_level}] Reclaimed {len(reclaimed)} partition(s) with an expired lease: {reclaimed}",
+                       extra={"lease_owner": owner, "reclaimed": reclaimed})
+    logger.info(f"[{processing_level}] Claimed {len(rows)} partition(s) | lease_owner={owner}",
+                extra={"lease_owner": owner, "lease_seconds": lease_seconds})
+
+    return [
+        pendulum.datetime(row[0].year, row[0].month, row[0].day, tz="UTC")
+        for row in rows
+    ]
+
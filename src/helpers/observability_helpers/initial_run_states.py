@@ -2,10 +2,10 @@ from typing import List
 
 import pandas as pd
 import pendulum
-import psycopg2
 from azure.core.exceptions import ResourceNotFoundError
 from decouple import config
 
+from src.clients.postgres_client import get_pg_pool
 from src.helpers.logging_helpers.combine_loggers_helper import get_logger
 from src.helpers.observability_helpers.pipeline_config import GRAIN_START, GRAIN_STEP
 
@@ -116,10 +116,6 @@ def upsert_state_fn(
     """
     Inserts or updates processing_state row (idempotent)
     """
-    conn = psycopg2.connect(
-        config("DB_CONN_RAW")
-    )
-
     query = """
         INSERT INTO processing_state (
             processing_level,
@@ -177,10 +173,9 @@ def upsert_state_fn(
         error_message,
     )
 
-    with conn.cursor() as cur:
-        cur.execute(query, params)
-
-    conn.commit()
+    with get_pg_pool().connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(query, params)
 
 
 def reconcile_processing_state(
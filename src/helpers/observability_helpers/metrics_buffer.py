@@ -0,0 +1,131 @@
+import atexit
+import os
+import threading
+
+from decouple import config
+from prometheus_client import CollectorRegistry, push_to_gateway
+
+from src.helpers.logging_helpers.combine_loggers_helper import get_logger
+
+"""
+In-memory buffer between the push_* helpers and the Pushgateway.
+
+Every Pushgateway job (flow, flow_task, weather_pipeline, ...) gets one long-lived CollectorRegistry,
+its metrics are registered once and observations only update them in memory. A daemon thread pushes
+the jobs that changed every METRICS_FLUSH_INTERVAL_SECONDS, flows push once more when they finish
+(push_metrics_to_gateway) and whatever is left is pushed at interpreter exit. API calls and tasks
+never wait on the Pushgateway.
+
+Counters and histograms now accumulate for the life of the process instead of being pushed as a
+fresh registry (always 1 observation) per call.
+"""
+
+# buffered - record in memory, push in the background / at flow end | immediate - push on every record
+METRICS_PUSH_MODE = config("METRICS_PUSH_MODE", default="buffered")
+METRICS_FLUSH_INTERVAL_SECONDS = config("METRICS_FLUSH_INTERVAL_SECONDS", default=15, cast=float)
+
+
+class MetricsBuffer:
+    def __init__(self, flush_interval: float = METRICS_FLUSH_INTERVAL_SECONDS):
+        self.flush_interval = flush_interval
+        self._registries: dict[tuple[str, str], CollectorRegistry] = {}  # (pushgateway_url, job) -> registry
+        self._metrics: dict[tuple[str, str, str], object] = {}  # (pushgateway_url, job, metric name) -> metric
+        self._dirty: set[tuple[str, str]] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def record(self, pushgateway_url: str, job: str, metric_cls, name: str, documentation: str,
+               labelnames: list[str], update):
+        """
+        Apply update(metric) to the job's metric, creating it on first use.
+            buffer.record(url, "weather_pipeline", Histogram, "api_call_duration_seconds", "...",
+                          ["api_name", "location"], lambda m: m.labels(api, loc).observe(duration))
+        """
+        key = (pushgateway_url, job)
+        with self._lock:
+            registry = self._registries.get(key)
+            if registry is None:
+                registry = self._registries[key] = CollectorRegistry()
+            metric = self._metrics.get((*key, name))
+            if metric is None:
+                metric = self._metrics[(*key, name)] = metric_cls(name, documentation, labelnames, registry=registry)
+            update(metric)
+            self._dirty.add(key)
+
+        if METRICS_PUSH_MODE == "immediate":
+            self.flush()
+        else:
+            self._ensure_flusher()
+
+    def record_snapshot(self, pushgateway_url: str, job: str, build):
+        """
+        Replace the job's registry with a fresh one filled by build(registry), for jobs that publish the
+        current state of something (processing_state) rather than observations that add up. Label sets
+        missing from the new snapshot disappear and counters start over, like a push of a new registry.
+        """
+        registry = CollectorRegistry()
+        build(registry)
+        key = (pushgateway_url, job)
+        with self._lock:
+            self._registries[key] = registry
+            self._metrics = {name: metric for name, metric in self._metrics.items() if name[:2] != key}
+            self._dirty.add(key)
+
+        if METRICS_PUSH_MODE == "immediate":
+            self.flush()
+        else:
+            self._ensure_flusher()
+
+    def flush(self) -> int:
+        """Push every job that changed since the last flush, returns the number of pushes."""
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            targets = [(key, self._registries[key]) for key in dirty]
+
+        pushed = 0
+        for (pushgateway_url, job), registry in targets:
+            try:
+                push_to_gateway(pushgateway_url, job=job, registry=registry)
+                pushed += 1
+            except Exception as e:
+                get_logger().warning(f"Failed to push metrics to pushgateway: {e}")
+                with self._lock:
+                    self._dirty.add((pushgateway_url, job))  # retried on the next flush
+        return pushed
+
+    def _ensure_flusher(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="metrics-flush", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def close(self):
+        self._stop.set()
+        self.flush()
+
+
+_buffer: MetricsBuffer | None = None
+_owner_pid = None
+_buffer_lock = threading.Lock()
+
+
+def get_metrics_buffer() -> MetricsBuffer:
+    """Process-wide buffer, created on first use. A forked child starts its own (the flusher thread isn't inherited)."""
+    global _buffer, _owner_pid
+    with _buffer_lock:
+        if _buffer is None or _owner_pid != os.getpid():
+            _buffer = MetricsBuffer()
+            _owner_pid = os.getpid()
+            atexit.register(_buffer.close)
+        return _buffer
+
+
+def flush_metrics() -> int:
+    return get_metrics_buffer().flush()
@@ -1,5 +1,4 @@
-import psycopg2
-from decouple import config
+from src.clients.postgres_client import get_pg_pool
 
 
 def get_processing_state_metrics(
@@ -9,8 +8,7 @@ def get_processing_state_metrics(
     Взима последния ред (по partition_date) за всеки processing_level
     със status, completeness_ratio, retry_count, error_type, is_acceptable.
     """
-    conn = psycopg2.connect(config("DB_CONN_RAW"))
-    try:
+    with get_pg_pool().connection() as conn:
         conditions = []
         params = []
 
@@ -45,5 +43,3 @@ def get_processing_state_metrics(
             }
             for row in rows
         ]
-    finally:
-        conn.close()
\ No newline at end of file
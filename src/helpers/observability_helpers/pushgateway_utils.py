@@ -1,15 +1,23 @@
 # pushgateway_utils.py
 
+from functools import cache
+
 from decouple import config
-from prometheus_client import CollectorRegistry, Gauge, Counter, Histogram, push_to_gateway
+from prometheus_client import Gauge, Counter, Histogram
+
+from src.helpers.observability_helpers.metrics_buffer import get_metrics_buffer, flush_metrics
+
 
-from src.helpers.logging_helpers.combine_loggers_helper import get_logger
+@cache
+def get_pushgateway_url() -> str:
+    """Pushgateway address (PUSHGATEWAY_URL), read on the first push instead of at import."""
+    return config("PUSHGATEWAY_URL", default="localhost:9091")
 
-# Optional: configure Pushgateway URL via environment variable
-PUSHGATEWAY_URL = config("PUSHGATEWAY_URL", default="localhost:9091")
+# Observations are recorded in the process-wide metrics buffer (metrics_buffer.py) and pushed from its
+# background thread, only the flow-level push below flushes synchronously.
 
 
-def push_metrics_to_gateway(flow_name: str, status: str, duration: float, pushgateway_url: str = PUSHGATEWAY_URL):
+def push_metrics_to_gateway(flow_name: str, status: str, duration: float, pushgateway_url: str | None = None):
     """
     Push flow-level metrics to Prometheus Pushgateway.
 
@@ -17,48 +25,36 @@ def push_metrics_to_gateway(flow_name: str, status: str, duration: float, pushga
       - Flow runs total (success/failed)
       - Flow execution duration
       - Pipeline running status
+
+    Called when a flow finishes: everything the flow buffered is pushed here, one push per job.
     """
-    registry = CollectorRegistry()
-    logger = get_logger()
+    pushgateway_url = pushgateway_url or get_pushgateway_url()
+    buffer = get_metrics_buffer()
 
     # Flow run counter (success / failed)
-    flow_runs = Counter(
-        "etl_flow_runs_total",
-        "Total ETL flow runs",
-        ["flow_name", "status"],
-        registry=registry
-    )
-    flow_runs.labels(flow_name=flow_name, status=status).inc()
+    buffer.record(pushgateway_url, flow_name, Counter,
+                  "etl_flow_runs_total", "Total ETL flow runs", ["flow_name", "status"],
+                  lambda m: m.labels(flow_name=flow_name, status=status).inc())
 
     # Flow execution duration
-    flow_duration = Histogram(
-        "etl_flow_duration_seconds",
-        "ETL flow execution duration in seconds",
-        ["flow_name"],
-        registry=registry
-    )
-    flow_duration.labels(flow_name=flow_name).observe(duration)
+    buffer.record(pushgateway_url, flow_name, Histogram,
+                  "etl_flow_duration_seconds", "ETL flow execution duration in seconds", ["flow_name"],
+                  lambda m: m.labels(flow_name=flow_name).observe(duration))
 
     # Pipeline running status (0 = finished)
-    pipeline_running = Gauge(
-        "etl_pipeline_running",
-        "ETL pipeline running status (0=finished, 1=running)",
-        ["flow_name"],
-        registry=registry
-    )
-    pipeline_running.labels(flow_name=flow_name).set(0)
+    buffer.record(pushgateway_url, flow_name, Gauge,
+                  "etl_pipeline_running", "ETL pipeline running status (0=finished, 1=running)", ["flow_name"],
+                  lambda m: m.labels(flow_name=flow_name).set(0))
 
     # Push metrics to Pushgateway
-    try:
-        push_to_gateway(pushgateway_url, job=flow_name, registry=registry)
-    except Exception as e:
-        logger.warning(f"Failed to push metrics to pushgateway: {e}")
+    flush_metrics()
+
 
 def push_task_metrics(
         flow_name: str,
         task_name: str,
         duration: float,
-        pushgateway_url: str = PUSHGATEWAY_URL
+        pushgateway_url: str | None = None
 ):
     """
     Push task-level metrics to Prometheus Pushgateway.
@@ -67,17 +63,11 @@ def push_task_metrics(
       - Task execution duration
       - Rows processed
     """
-    registry = CollectorRegistry()
-    logger = get_logger()
-
     # Task duration
-    task_duration = Histogram(
-        "etl_task_duration_seconds",
-        "ETL task execution duration in seconds",
-        ["flow_name", "task_name"],
-        registry=registry
-    )
-    task_duration.labels(flow_name, task_name).observe(duration)
+    get_metrics_buffer().record(pushgateway_url or get_pushgateway_url(), f"{flow_name}_{task_name}", Histogram,
+                                "etl_task_duration_seconds", "ETL task execution duration in seconds",
+                                ["flow_name", "task_name"],
+                                lambda m: m.labels(flow_name, task_name).observe(duration))
 
     # Rows processed
     # rows_processed = Counter(
@@ -88,18 +78,12 @@ def push_task_metrics(
     # )
     # rows_processed.labels(flow_name, task_name).inc(rows)
 
-    # Push metrics to Pushgateway
-    try:
-        push_to_gateway(pushgateway_url, job=f"{flow_name}_{task_name}", registry=registry)
-    except Exception as e:
-        logger.warning(f"Failed to push metrics to pushgateway: {e}")
-
 
 def push_api_metrics(
         api_name: str,
         location: str,
         duration: float,
-        pushgateway_url: str = PUSHGATEWAY_URL
+        pushgateway_url: str | None = None
 ):
     """
     Push call-level metrics to Prometheus Pushgateway.
@@ -110,99 +94,79 @@ def push_api_metrics(
       - Call execution duration
 
     """
-    registry = CollectorRegistry()
-    logger = get_logger()
-
     # Task duration
-    call_duration = Histogram(
-        "api_call_duration_seconds",
-        "API call execution duration in seconds",
-        ["api_name", "location"],
-        registry=registry
-    )
-    call_duration.labels(api_name, location).observe(duration)
-
-    # Push metrics to Pushgateway
-    try:
-        push_to_gateway(pushgateway_url, job="weather_pipeline", registry=registry)
-    except Exception as e:
-        logger.warning(f"Failed to push metrics to pushgateway: {e}")
+    get_metrics_buffer().record(pushgateway_url or get_pushgateway_url(), "weather_pipeline", Histogram,
+                                "api_call_duration_seconds", "API call execution duration in seconds",
+                                ["api_name", "location"],
+                                lambda m: m.labels(api_name, location).observe(duration))
 
 
 def push_processing_state_metrics(
         flow_name: str,
         rows: list[dict],
-        pushgateway_url: str = PUSHGATEWAY_URL
+        pushgateway_url: str | None = None
 ):
-    registry = CollectorRegistry()
-    logger = get_logger()
-
-    completeness = Gauge(
-        "etl_completeness_ratio",
-        "Completeness ratio по processing_level",
-        ["flow_name", "processing_level", "status"],
-        registry=registry
-    )
-    retries = Gauge(
-        "etl_retry_count",
-        "Retry count по processing_level",
-        ["flow_name", "processing_level", "status"],
-        registry=registry
-    )
-    acceptable = Gauge(
-        "etl_is_acceptable",
-        "Дали последният partition е приемлив (1=да, 0=не)",
-        ["flow_name", "processing_level"],
-        registry=registry
-    )
-    errors = Counter(
-        "etl_processing_errors_total",
-        "Брой грешки по тип",
-        ["flow_name", "processing_level", "error_type"],
-        registry=registry
-    )
-
-    for row in rows:
-        level = row["processing_level"]
-        status = row["status"]
-
-        if row["completeness_ratio"] is not None:
-            completeness.labels(flow_name, level, status).set(row["completeness_ratio"])
-
-        retries.labels(flow_name, level, status).set(row["retry_count"])
-
-        acceptable.labels(flow_name, level).set(1 if row["is_acceptable"] else 0)
-
-        if row["error_type"]:
-            errors.labels(flow_name, level, row["error_type"]).inc()
-
-    try:
-        push_to_gateway(pushgateway_url, job=f"{flow_name}_processing_state", registry=registry)
-    except Exception as e:
-        logger.warning(f"Failed to push metrics to pushgateway: {e}")
+    """
+    Publish the processing_state snapshot. Every call replaces the job's previous snapshot: partitions
+    that left it are dropped and the error counts are those of this snapshot, not a running total.
+    """
+    def build(registry):
+        completeness = Gauge("etl_completeness_ratio", "Completeness ratio по processing_level",
+                             ["flow_name", "processing_level", "status"], registry=registry)
+        retries = Gauge("etl_retry_count", "Retry count по processing_level",
+                        ["flow_name", "processing_level", "status"], registry=registry)
+        acceptable = Gauge("etl_is_acceptable", "Дали последният partition е приемлив (1=да, 0=не)",
+                           ["flow_name", "processing_level"], registry=registry)
+        errors = Counter("etl_processing_errors_total", "Брой грешки по тип",
+                         ["flow_name", "processing_level", "error_type"], registry=registry)
+
+        for row in rows:
+            level = row["processing_level"]
+            status = row["status"]
+
+            if row["completeness_ratio"] is not None:
+                completeness.labels(flow_name, level, status).set(row["completeness_ratio"])
+
+            retries.labels(flow_name, level, status).set(row["retry_count"])
+
+            acceptable.labels(flow_name, level).set(1 if row["is_acceptable"] else 0)
+
+            if row["error_type"]:
+                errors.labels(flow_name, level, row["error_type"]).inc()
 
+    get_metrics_buffer().record_snapshot(pushgateway_url or get_pushgateway_url(), f"{flow_name}_processing_state",
+                                         build)
 
 
 def push_api_error_metrics(
         api_name: str,
         location: str,
         error_type: str,
-        pushgateway_url: str = PUSHGATEWAY_URL
+        pushgateway_url: str | None = None
     ):
-    registry = CollectorRegistry()
-    logger = get_logger()
+    get_metrics_buffer().record(pushgateway_url or get_pushgateway_url(), "weather_pipeline", Counter,
+                                "api_errors_total", "Total API call errors",
+                                ["api_name", "location", "error_type"],  # error_type: "retryable" / "non_retryable" / "empty_response"
+                                lambda m: m.labels(api_name, location, error_type).inc())
 
-    api_errors = Counter(
-        "api_errors_total",
-        "Total API call errors",
-        ["api_name", "location", "error_type"],  # error_type: "retryable" / "non_retryable" / "empty_response"
-        registry=registry
-    )
 
-    api_errors.labels(api_name, location, error_type).inc()
+def push_cleaning_metrics(
+        flow_name: str,
+        report: dict,
+        pushgateway_url: str | None = None
+):
+    """
+    Push the per-column report of clean_silver_df_compiled to Prometheus Pushgateway.
 
-    # Push metrics to Pushgateway
-    try:
-        push_to_gateway(pushgateway_url, job="weather_pipeline", registry=registry)
-    except Exception as e:
-        logger.warning(f"Failed to push metrics to pushgateway: {e}")
+    Metrics pushed:
+      - Values clipped / coerced / filled per column in the last cleaning run
+    """
+    def update(cleaned_values):
+        for column, counts in report.items():
+            for action, count in counts.items():
+                cleaned_values.labels(flow_name, column, action).set(count)
+
+    get_metrics_buffer().record(pushgateway_url or get_pushgateway_url(), f"{flow_name}_clean_silver", Gauge,
+                                "etl_cleaned_values", "Values changed by silver cleaning in the last run",
+                                ["flow_name", "column", "action"],  # action: "clipped" / "coerced" / "filled"
+                                update)
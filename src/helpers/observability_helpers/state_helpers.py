@@ -1,12 +1,13 @@
 import pendulum
-import psycopg2
 from azure.core.exceptions import ResourceNotFoundError
 from decouple import config
-from sqlalchemy import text, create_engine
+from sqlalchemy import text
 
+from src.clients.postgres_client import get_pg_pool, get_sqlalchemy_engine
 from src.helpers.gold.extract import get_oldest_season_year_azure, get_oldest_season_year_postgres, \
     get_oldest_monthly_date_azure, get_oldest_monthly_date_postgres
 from src.helpers.logging_helpers.combine_loggers_helper import get_logger
+from src.helpers.observability_helpers.find_process_state import WORK_LEASE_SECONDS, default_lease_owner
 from src.helpers.observability_helpers.initial_run_states import generate_dates
 from src.helpers.observability_helpers.pipeline_config import PIPELINE_CONFIG, GRAIN_LABEL_MAP, SEASON_START_MONTH
 
@@ -49,6 +50,24 @@ def _find_existing_blobs(
     return results
 
 
+def _list_existing_blobs(fs_client, azure_path_env: str) -> set[str]:
+    """All file paths under the pipeline's base dir, one (paginated) listing instead of a HEAD per partition."""
+    try:
+        return {path.name for path in fs_client.get_paths(path=config(azure_path_env), recursive=True)
+                if not path.is_directory}
+    except ResourceNotFoundError:
+        return set()
+
+
+def _find_existing_blobs_listed(
+        dates: list[pendulum.DateTime],
+        fs_client,
+        azure_path_env: str,
+) -> dict[pendulum.DateTime, str]:
+    existing = _list_existing_blobs(fs_client, azure_path_env)
+    return {ts: "success" if _blob_path_for_date(ts, azure_path_env) in existing else "missing" for ts in dates}
+
+
 def _find_existing_postgres(
         dates: list[pendulum.DateTime],
         engine,
@@ -87,8 +106,7 @@ def get_last_reconciled_date(pipeline_name: str, period_name: str | None = None)
     Returns the latest partition_date in processing_state for this pipeline.
     Used to determine reconcile start_date on subsequent runs.
     """
-    conn = psycopg2.connect(config("DB_CONN_RAW"))
-    try:
+    with get_pg_pool().connection() as conn:
         with conn.cursor() as cur:
             query = """
             SELECT MAX(partition_date)
@@ -105,8 +123,6 @@ def get_last_reconciled_date(pipeline_name: str, period_name: str | None = None)
             if row and row[0]:
                 return pendulum.datetime(row[0].year, row[0].month, row[0].day, tz="UTC")
             return None
-    finally:
-        conn.close()
 
 
 def get_current_retry_count(
@@ -115,8 +131,7 @@ def get_current_retry_count(
         period_name: str | None = None,
 ) -> int:
     """Reads the current retry_count for a single row."""
-    conn = psycopg2.connect(config("DB_CONN_RAW"))
-    try:
+    with get_pg_pool().connection() as conn:
         with conn.cursor() as cur:
             if period_name is None:
                 cur.execute(
@@ -143,8 +158,46 @@ def get_current_retry_count(
 
             row = cur.fetchone()
             return row[0] if row else 0
-    finally:
-        conn.close()
+
+
+_UPSERT_STATE_CONFLICT = """
+            ON CONFLICT (processing_level, partition_date) DO UPDATE SET
+                period_name        = COALESCE(EXCLUDED.period_name, processing_state.period_name),
+                status             = EXCLUDED.status,
+                expected_count     = EXCLUDED.expected_count,
+                actual_count       = EXCLUDED.actual_count,
+                completeness_ratio = EXCLUDED.completeness_ratio,
+                is_acceptable      = EXCLUDED.is_acceptable,
+                updated_at         = NOW(),
+                error_type         = EXCLUDED.error_type,
+                error_message      = EXCLUDED.error_message,
+                retry_count        = CASE
+                    WHEN EXCLUDED.status = 'pending'
+                    THEN processing_state.retry_count + 1
+                    ELSE processing_state.retry_count
+                END,
+                -- the lease lives as long as the partition is processing, the owner starting the work renews it
+                lease_owner        = CASE WHEN EXCLUDED.status = 'processing' THEN processing_state.lease_owner END,
+                lease_expires_at   = CASE WHEN EXCLUDED.status = 'processing' THEN
+                    CASE WHEN processing_state.lease_owner = EXCLUDED.lease_owner
+                         THEN EXCLUDED.lease_expires_at
+                         ELSE processing_state.lease_expires_at
+                    END
+                END
+            WHERE processing_state.status != 'abandoned'
+"""
+
+# reconcile must not reset a partition another worker holds a live lease on
+_SKIP_LEASED = """
+              AND NOT (processing_state.status = 'processing' AND processing_state.lease_expires_at > NOW())
+"""
+
+
+def _completeness(expected_count: int | None, actual_count: int | None) -> tuple[float | None, bool | None]:
+    completeness_ratio = round(actual_count / expected_count,
+                               4) if expected_count and actual_count is not None else None
+    is_acceptable = completeness_ratio >= 1.0 if completeness_ratio is not None else None
+    return completeness_ratio, is_acceptable
 
 
 def upsert_state_fn(
@@ -156,58 +209,97 @@ def upsert_state_fn(
         error_type: str = None,
         error_message: str = None,
         period_name: str | None = None,
+        skip_leased: bool = False,
 ):
-    """Idempotent upsert for processing_state."""
-    conn = psycopg2.connect(config("DB_CONN_RAW"))
-    completeness_ratio = round(actual_count / expected_count,
-                               4) if expected_count and actual_count is not None else None
-    is_acceptable = completeness_ratio >= 1.0 if completeness_ratio is not None else None
+    """
+    Idempotent upsert for processing_state. skip_leased leaves rows under a live lease untouched.
+    status="processing" by the worker holding the lease (claim_pending_work) renews it for WORK_LEASE_SECONDS,
+    so a partition that waited in the run's pool before starting isn't reclaimed by an overlapping run.
+    """
+    completeness_ratio, is_acceptable = _completeness(expected_count, actual_count)
+    lease_owner = default_lease_owner() if status == "processing" else None
 
     query = """
             INSERT INTO processing_state (
                 processing_level, partition_date,
                 status, expected_count, actual_count,
                 completeness_ratio, period_name, is_acceptable,
-                updated_at, error_type, error_message
+                updated_at, error_type, error_message,
+                lease_owner, lease_expires_at
             )
             VALUES (
                 %s, %s, %s, %s, %s, %s,
-                %s, %s, NOW(), %s, %s
+                %s, %s, NOW(), %s, %s,
+                %s, CASE WHEN %s::text IS NOT NULL THEN NOW() + make_interval(secs => %s) END
             )
-            ON CONFLICT (processing_level, partition_date) DO UPDATE SET
-                period_name        = COALESCE(EXCLUDED.period_name, processing_state.period_name),
-                status             = EXCLUDED.status,
-                expected_count     = EXCLUDED.expected_count,
-                actual_count       = EXCLUDED.actual_count,
-                completeness_ratio = EXCLUDED.completeness_ratio,
-                is_acceptable      = EXCLUDED.is_acceptable,
-                updated_at         = NOW(),
-                error_type         = EXCLUDED.error_type,
-                error_message      = EXCLUDED.error_message,
-                retry_count        = CASE
-                    WHEN EXCLUDED.status = 'pending'
-                    THEN processing_state.retry_count + 1
-                    ELSE processing_state.retry_count
-                END
-            WHERE processing_state.status != 'abandoned';
-        """
+        """ + _UPSERT_STATE_CONFLICT + (_SKIP_LEASED if skip_leased else "")
 
     params = [
         processing_level, partition_date.date(), status,
         expected_count, actual_count, completeness_ratio,
         period_name, is_acceptable, error_type, error_message,
+        lease_owner, lease_owner, WORK_LEASE_SECONDS,
     ]
 
-    try:
+    with get_pg_pool().connection() as conn:
         with conn.cursor() as cur:
             cur.execute(query, params)
-        conn.commit()
-    finally:
-        conn.close()
+
+
+def upsert_states_bulk(processing_level: str, states: list[dict], skip_leased: bool = False) -> int:
+    """
+    Same upsert as upsert_state_fn for many partitions in one statement (one connection, one round trip).
+    states: [{"partition_date", "status", "expected_count", "actual_count", "period_name"}, ...]
+    """
+    if not states:
+        return 0
+
+    columns = {key: [] for key in ("partition_date", "status", "expected_count", "actual_count",
+                                   "completeness_ratio", "period_name", "is_acceptable")}
+    for state in states:
+        completeness_ratio, is_acceptable = _completeness(state.get("expected_count"), state.get("actual_count"))
+        columns["partition_date"].append(state["partition_date"].date())
+        columns["status"].append(state["status"])
+        columns["expected_count"].append(state.get("expected_count"))
+        columns["actual_count"].append(state.get("actual_count"))
+        columns["completeness_ratio"].append(completeness_ratio)
+        columns["period_name"].append(state.get("period_name"))
+        columns["is_acceptable"].append(is_acceptable)
+
+    query = """
+            INSERT INTO processing_state (
+                processing_level, partition_date,
+                status, expected_count, actual_count,
+                completeness_ratio, period_name, is_acceptable,
+                updated_at, error_type, error_message,
+                lease_owner, lease_expires_at
+            )
+            SELECT
+                %s, t.partition_date,
+                t.status, t.expected_count, t.actual_count,
+                t.completeness_ratio, t.period_name, t.is_acceptable,
+                NOW(), NULL, NULL,
+                NULL, NULL
+            FROM unnest(
+                %s::date[], %s::text[], %s::int[], %s::int[],
+                %s::float8[], %s::text[], %s::boolean[]
+            ) AS t(partition_date, status, expected_count, actual_count,
+                   completeness_ratio, period_name, is_acceptable)
+        """ + _UPSERT_STATE_CONFLICT + (_SKIP_LEASED if skip_leased else "")
+
+    with get_pg_pool().connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(query, [processing_level, *columns.values()])
+            written = cur.rowcount
+    return written
 
 
 # ── universal reconcile ───────────────────────────────────────────────────────
 
+# bulk - one listing per base dir + one upsert statement | per_partition - HEAD + upsert per partition
+RECONCILE_MODE = config("RECONCILE_MODE", default="bulk")
+
+
 def reconcile_processing_state(
         pipeline_name: str,
         start_date,
@@ -225,7 +317,7 @@ def reconcile_processing_state(
       success → already processed, skip
       pending → not yet processed, get_pending_work will pick up
 
-    Never overwrites 'abandoned' rows.
+    Never overwrites 'abandoned' rows, nor partitions another worker holds a live lease on.
     """
     logger = get_logger()
     cfg = PIPELINE_CONFIG[pipeline_name]
@@ -236,7 +328,8 @@ def reconcile_processing_state(
     azure_map, postgres_map = {}, {}
 
     if "azure" in cfg["source_check"] and fs_client:
-        azure_map = _find_existing_blobs(
+        find_existing_blobs = _find_existing_blobs_listed if RECONCILE_MODE == "bulk" else _find_existing_blobs
+        azure_map = find_existing_blobs(
             expected_dates,
             fs_client,
             cfg["azure_path_env"],
@@ -250,6 +343,7 @@ def reconcile_processing_state(
             cfg["postgres_date_col"],
         )
 
+    states = []
     for d in expected_dates:
         expected_count = cfg.get("expected_count") or (
             d.days_in_month if cfg["grain"] == "month" else None
@@ -266,20 +360,25 @@ def reconcile_processing_state(
 
         period_name = GRAIN_LABEL_MAP.get(cfg["grain"], lambda d: None)(d)
 
-        upsert_state_fn(
-            processing_level=pipeline_name,
-            partition_date=d,
-            period_name=period_name,
-            status=status,
-            expected_count=expected_count,
-            actual_count=actual_count,
-        )
+        states.append({
+            "partition_date": d,
+            "period_name": period_name,
+            "status": status,
+            "expected_count": expected_count,
+            "actual_count": actual_count,
+        })
+
+    if RECONCILE_MODE == "bulk":
+        upsert_states_bulk(pipeline_name, states, skip_leased=True)
+    else:
+        for state in states:
+            upsert_state_fn(processing_level=pipeline_name, **state, skip_leased=True)
 
     logger.info(f"[reconcile] {pipeline_name}: done")
 
 
 def enough_months_quarter(year, quarter):
-    engine = create_engine(config("DB_CONN_RAW"))
+    engine = get_sqlalchemy_engine()
     query = """SELECT partition_date
                 FROM processing_state
                 WHERE processing_level = 'gold_monthly'
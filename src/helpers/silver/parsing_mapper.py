@@ -1,3 +1,7 @@
+from src.workers.silver.columnar_parsing_workers import columns_open_meteo_daily, columns_foreca_daily, \
+    columns_accuweather_daily, columns_weatherapi_daily, columns_openweathermap_3h, columns_tomorrowio_daily, \
+    columns_weatherbit_daily, columns_meteoblue_basic_day, columns_open_meteo_typed, columns_meteoblue_typed, \
+    columns_openweathermap_typed, columns_weatherapi_typed
 from src.workers.silver.parsing_workers import parse_open_meteo_daily, parse_foreca_daily, \
     parse_accuweather_daily, parse_weatherapi_daily, parse_openweathermap_3h, parse_tomorrowio_daily, \
     parse_weatherbit_daily, parse_meteoblue_basic_day
@@ -12,3 +16,23 @@ api_data_parsers = {
     "openweathermap": parse_openweathermap_3h,      # OpenWeatherMap 3-hour forecast
     "weatherapi": parse_weatherapi_daily,           # WeatherAPI.com daily
 }
+
+# Columnar parsers: payload -> {column: values}, used by parse_records_columnar
+api_columnar_parsers = {
+    "open_meteo": columns_open_meteo_daily,
+    "foreca": columns_foreca_daily,
+    "accuweather": columns_accuweather_daily,
+    "meteoblue": columns_meteoblue_basic_day,
+    "weatherbit": columns_weatherbit_daily,
+    "tomorrow": columns_tomorrowio_daily,
+    "openweathermap": columns_openweathermap_3h,
+    "weatherapi": columns_weatherapi_daily,
+}
+
+# Same, for payloads decoded into msgspec Structs (BRONZE_TYPED_PAYLOADS)
+api_typed_columnar_parsers = {
+    "open_meteo": columns_open_meteo_typed,
+    "meteoblue": columns_meteoblue_typed,
+    "openweathermap": columns_openweathermap_typed,
+    "weatherapi": columns_weatherapi_typed,
+}
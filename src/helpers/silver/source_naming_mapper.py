@@ -10,4 +10,5 @@ canonical_api_map = {
     "openweathermap_api": "openweathermap",
     "tomorrow_api": "tomorrow",
     "weatherapi_api": "weatherapi",
+    "weatherbit_api": "weatherbit",
 }
\ No newline at end of file
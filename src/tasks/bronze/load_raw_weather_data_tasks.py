@@ -3,8 +3,9 @@ from prefect import task
 
 from src.helpers.observability_helpers.decorators import measure_task_duration
 from src.helpers.observability_helpers.pushgateway_utils import push_task_metrics
-from src.workers.bronze.load_raw_data_from_weather_APIs_to_Azure_workers import upload_json
-from src.workers.bronze.load_raw_data_from_weather_APIs_to_local_postgres_workers import load_raw_api_data_to_postgres
+from src.workers.bronze.load_raw_data_from_weather_APIs_to_Azure_workers import upload_json, upload_bronze_bundle
+from src.workers.bronze.load_raw_data_from_weather_APIs_to_local_postgres_workers import \
+    load_raw_api_data_batch_to_postgres
 from src.helpers.logging_helpers.combine_loggers_helper import get_logger
 
 
@@ -32,20 +33,48 @@ def load_raw_api_data_to_azure_blob(fs_client, base_dir, folder_name, file_name,
                 )
 
 
+@task
+@measure_task_duration(flow_name="bronze_flow", task_name="load_bronze_bundle_to_azure", on_complete=push_task_metrics)
+def load_raw_api_data_bundle_to_azure_blob(fs_client, base_dir, date_str, hour_str, records):
+    logger = get_logger()
+    logger.info("Start task loading raw data bundle to Azure blob",
+                extra={"flow_run_id": runtime.flow_run.id,
+                       "task_run_id": runtime.task_run.id,
+                       "base_dir": base_dir,
+                       "date": date_str,
+                       "hour": hour_str,
+                       "records": len(records)
+                       }
+                )
+
+    result = upload_bronze_bundle(fs_client, base_dir, date_str, hour_str, records)
+
+    logger.info("Completed task loading raw data bundle to Azure blob",
+                extra={"flow_run_id": runtime.flow_run.id,
+                       "task_run_id": runtime.task_run.id,
+                       "path": result["path"],
+                       "uploaded": result["uploaded"]
+                       }
+                )
+    return result
+
+
 @task
 @measure_task_duration(flow_name="bronze_flow", task_name="load_bronze_to_postgres", on_complete=push_task_metrics)
-def load_raw_api_data_to_postgres_local(data, label, now):
+def load_raw_api_data_batch_to_postgres_local(records, now, debug=False):
     logger = get_logger()
-    logger.info("Start task loading raw data to Postgres local",
+    logger.info("Start task loading raw data batch to Postgres local",
                 extra={"flow_run_id": runtime.flow_run.id,
                        "task_run_id": runtime.task_run.id,
-                       "label": label
+                       "records": len(records)
                        }
                 )
-    load_raw_api_data_to_postgres(data, label, now)
-    logger.info("Completed task loading raw data to Postgres local",
+    statuses = load_raw_api_data_batch_to_postgres(records, now, debug=debug)
+    logger.info("Completed task loading raw data batch to Postgres local",
                 extra={"flow_run_id": runtime.flow_run.id,
                        "task_run_id": runtime.task_run.id,
-                       "label": label
+                       "inserted": sum(1 for s in statuses if s["status"] == "inserted"),
+                       "skipped": sum(1 for s in statuses if s["status"] == "skipped")
                        }
                 )
+    return statuses
@@ -1,11 +1,12 @@
 import pandas as pd
 import pendulum
 import prefect
-from decouple import config
+import psycopg
 from prefect import task
-from sqlalchemy import create_engine, engine
+from sqlalchemy import engine
 from sqlalchemy.exc import SQLAlchemyError, DBAPIError, OperationalError
 
+from src.clients.postgres_client import get_sqlalchemy_engine
 from src.clients.datalake_client import fs_client
 from src.helpers.gold.extract import get_last_processed_timestamp
 from src.helpers.logging_helpers.combine_loggers_helper import get_logger
@@ -14,6 +15,8 @@ from src.helpers.observability_helpers.pipeline_config import PIPELINE_CONFIG, G
 from src.helpers.observability_helpers.pushgateway_utils import push_task_metrics
 from src.workers.gold.extract_gold_data import get_hourly_blobs_for_day, get_hourly_data_postgres, \
     get_daily_blobs_for_week, get_daily_data_postgres, get_monthly_blob_for_year, get_monthly_record_for_year
+from src.workers.gold.rollup_accumulators import load_rollup_accumulator
+from src.workers.gold.rollup_engine import read_rollup_states
 
 
 @task(name="Get hourly day data from azure")
@@ -106,7 +109,7 @@ def get_hourly_gold_postgres(pipeline_name, forecast_day):
         return []
 
     result = []
-    engine = create_engine(config("DB_CONN_RAW"))
+    engine = get_sqlalchemy_engine()
 
     while current_ts <= target_ts:
 
@@ -263,7 +266,7 @@ def get_monthly_gold_postgres(month: pendulum.DateTime,) -> pd.DataFrame:
     logger = get_logger()
     start_time = pendulum.now("UTC")
     logger.info(f"Fetching month: {pendulum.now()}")
-    engine = create_engine(config("DB_CONN_RAW"))
+    engine = get_sqlalchemy_engine()
     month_df = get_monthly_record_for_year(month, engine)
 
     logger.info(f"Monthly row fetched {month} row ")
@@ -273,3 +276,34 @@ def get_monthly_gold_postgres(month: pendulum.DateTime,) -> pd.DataFrame:
                 f". Duration: {duration:.2f}s")
 
     return month_df
+
+
+@task(name="get gold rollup accumulator", task_run_name="Get accumulator | {grain} | {period_start}")
+@measure_task_duration(flow_name="gold_flow", task_name="get_gold_rollup_accumulator", on_complete=push_task_metrics)
+def get_gold_rollup_accumulator(grain: str, period_start: pendulum.DateTime):
+    """(state, folded days) of the period, None when there is none or Postgres is unavailable."""
+    logger = get_logger()
+    try:
+        accumulated = load_rollup_accumulator(grain, period_start)
+    except psycopg.Error as e:
+        logger.warning(f"Rollup accumulator {grain} | {period_start.to_date_string()} unavailable | error={e}")
+        return None
+
+    if accumulated is None:
+        logger.info(f"No rollup accumulator for {grain} | {period_start.to_date_string()}")
+        return None
+
+    logger.info(f"Rollup accumulator {grain} | {period_start.to_date_string()}",
+                extra={"days_folded": len(accumulated[1]), "places": len(accumulated[0])})
+    return accumulated
+
+
+@task(name="get gold rollup states", task_run_name="Get rollup states | {grain}")
+@measure_task_duration(flow_name="gold_flow", task_name="get_gold_rollup_states", on_complete=push_task_metrics)
+def get_gold_rollup_states(grain: str, period_starts: list[pendulum.DateTime]):
+    """({period_start: stored state}, periods without a state) - only the latter need their summaries downloaded."""
+    logger = get_logger()
+    stored, stateless = read_rollup_states(fs_client, grain, period_starts)
+    logger.info(f"Rollup states {grain}: {len(stored)}/{len(period_starts)} stored",
+                extra={"stateless": [ts.to_date_string() for ts in stateless]})
+    return stored, stateless
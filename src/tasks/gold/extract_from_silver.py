@@ -1,24 +1,28 @@
-from sqlite3 import OperationalError
-
 import pendulum
 import prefect
-from decouple import config
-from fabric.decorators import task
-from sqlalchemy import create_engine
-from sqlalchemy.exc import DBAPIError, SQLAlchemyError
+from prefect import task
+from sqlalchemy.exc import DBAPIError, OperationalError, SQLAlchemyError
 
+from src.clients.postgres_client import get_sqlalchemy_engine
 from src.clients.datalake_client import fs_client
 from src.helpers.gold.extract import get_last_processed_timestamp
 from src.helpers.logging_helpers.combine_loggers_helper import get_logger
 from src.helpers.observability_helpers.decorators import measure_task_duration
 from src.helpers.observability_helpers.pushgateway_utils import push_task_metrics
-from src.workers.gold.extract_silver_data import fetch_silver_parquet_blob, fetch_silver_data_postgres
+from src.helpers.master.layer_handoff import silver_hour_key
+from src.workers.gold.extract_silver_data import fetch_silver_parquet_blob, fetch_silver_data_postgres, \
+    silver_frame_from_memory, GOLD_SILVER_PUSHDOWN, GOLD_SILVER_COLUMNS, GOLD_SILVER_DATE_WINDOW_DAYS
 
 
 @task(name="Get silver data from Azure Parquet Incremental", retries=3, retry_delay_seconds=60)
 @measure_task_duration(flow_name="gold_daily_dataset_forecast", task_name="get_silver_parquet_azure", on_complete=push_task_metrics)
-def get_silver_parquet_azure(pipeline_name, forecast_day, max_hour):
+def get_silver_parquet_azure(pipeline_name, forecast_day, max_hour, held_hours: dict | None = None):
+    """
+    Silver hours after the last processed one up to forecast_day max_hour, as (hour, df) pairs.
+    held_hours ({"YYYY-MM-DD HH": df}, pipelined orchestrator run) are taken from memory instead of ADLS.
+    """
     logger = get_logger()
+    held_hours = held_hours or {}
     start_time = pendulum.now("UTC")
 
     last_processed_ts = get_last_processed_timestamp(pipeline_name)
@@ -52,13 +56,26 @@ def get_silver_parquet_azure(pipeline_name, forecast_day, max_hour):
         logger.info(f"Processing Silver {year}-{month}-{day} {hour}:00")
 
         try:
-            df = fetch_silver_parquet_blob(
-                year=year,
-                month=month,
-                day=day,
-                hour=hour,
-                fs_client=fs_client
-            )
+            pushdown = {}
+            if GOLD_SILVER_PUSHDOWN:
+                pushdown = {
+                    "columns": GOLD_SILVER_COLUMNS,
+                    "date_from": current_ts.date(),
+                    "date_to": current_ts.date().add(days=GOLD_SILVER_DATE_WINDOW_DAYS),
+                }
+            held_df = held_hours.get(silver_hour_key(current_ts.date(), current_ts.hour))
+            if held_df is not None:
+                logger.info(f"Silver {year}-{month}-{day} {hour} handed over in memory, skipping download")
+                df = silver_frame_from_memory(held_df, **pushdown)
+            else:
+                df = fetch_silver_parquet_blob(
+                    year=year,
+                    month=month,
+                    day=day,
+                    hour=hour,
+                    fs_client=fs_client,
+                    **pushdown
+                )
 
             if not df.empty:
                 result.append((current_ts, df))
@@ -93,7 +110,7 @@ def get_silver_data_postgres(forecast_day, max_hour):
                     "flow_run_id": prefect.runtime.flow_run.id,
                     "task_run_id": prefect.runtime.task_run.id
                 })
-    engine = create_engine(config("DB_CONN_RAW"))
+    engine = get_sqlalchemy_engine()
     silver_df = None
     try:
         silver_df = fetch_silver_data_postgres(forecast_day.format('YYYY-MM-DD'), max_hour.hour, engine)
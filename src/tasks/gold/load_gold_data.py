@@ -1,10 +1,10 @@
 import pandas as pd
 import pendulum
-from decouple import config
 from prefect import runtime
 from prefect import task
-from sqlalchemy import create_engine
 
+from src.clients.postgres_client import get_sqlalchemy_engine
+from src.clients.datalake_client import fs_client
 from src.helpers.logging_helpers.combine_loggers_helper import get_logger
 from src.helpers.observability_helpers.decorators import measure_task_duration
 from src.helpers.observability_helpers.pushgateway_utils import push_task_metrics
@@ -15,6 +15,8 @@ from src.workers.gold.load_gold_data import load_gold_data_to_azure_worker, load
     load_monthly_summ_data_to_azure_worker, load_gold_monthly_summ_data_to_postgres_worker, \
     load_yearly_summ_data_to_azure_worker, load_gold_yearly_summ_data_to_postgres_worker, \
     load_seasonal_summ_data_to_azure_worker, load_gold_seasonally_summ_data_to_postgres_worker
+from src.workers.gold.rollup_accumulators import fold_daily_state, close_rollup_accumulator
+from src.workers.gold.rollup_engine import upload_rollup_state
 
 
 @task(name="Load gold daily data to Azure blob", retries=3, retry_delay_seconds=300)
@@ -45,7 +47,7 @@ def load_gold_daily_data_to_postgres(gold_result: list):
                        "task_run_id": runtime.task_run.id,
                        }
                 )
-    engine = create_engine(config("DB_CONN_RAW"))
+    engine = get_sqlalchemy_engine()
     load_gold_daily_data_to_postgres_worker(gold_result, engine)
     logger.info("Completed task loading gold daily data to Postgres local",
                 extra={"flow_run_id": runtime.flow_run.id,
@@ -82,7 +84,7 @@ def load_gold_five_day_data_to_postgres(fd_gold_result: list):
                        "task_run_id": runtime.task_run.id,
                        }
                 )
-    engine = create_engine(config("DB_CONN_RAW"))
+    engine = get_sqlalchemy_engine()
     load_five_day_data_to_postgres_worker(fd_gold_result, engine)
     logger.info("Completed task loading gold five day data to Postgres local",
                 extra={"flow_run_id": runtime.flow_run.id,
@@ -119,7 +121,7 @@ def load_gold_daily_summ_data_to_postgres(gold_result: list[tuple[pendulum.DateT
                        "task_run_id": runtime.task_run.id,
                        }
                 )
-    engine = create_engine(config("DB_CONN_RAW"))
+    engine = get_sqlalchemy_engine()
     load_gold_daily_summ_data_to_postgres_worker(gold_result, engine)
     logger.info("Completed task loading gold daily summarized data to Postgres local",
                 extra={"flow_run_id": runtime.flow_run.id,
@@ -155,7 +157,7 @@ def load_gold_weekly_summ_data_to_postgres(pipeline_name, all_weeks_summ: list[p
                        "task_run_id": runtime.task_run.id,
                        }
                 )
-    engine = create_engine(config("DB_CONN_RAW"))
+    engine = get_sqlalchemy_engine()
     load_gold_weekly_summ_data_to_postgres_worker(engine, all_weeks_summ)
 
     logger.info("Completed task loading gold weekly data to Postgres local",
@@ -194,7 +196,7 @@ def load_gold_monthly_summ_data_to_postgres(pipeline_name, month_start, all_mont
                        "task_run_id": runtime.task_run.id,
                        }
                 )
-    engine = create_engine(config("DB_CONN_RAW"))
+    engine = get_sqlalchemy_engine()
     load_gold_monthly_summ_data_to_postgres_worker(engine, all_months_summ)
 
     logger.info("Completed task loading gold monthly data to Postgres local",
@@ -233,7 +235,7 @@ def load_gold_yearly_summ_data_to_postgres(PIPELINE_NAME, yearly_summ: pd.DataFr
                        "task_run_id": runtime.task_run.id,
                        }
                 )
-    engine = create_engine(config("DB_CONN_RAW"))
+    engine = get_sqlalchemy_engine()
     load_gold_yearly_summ_data_to_postgres_worker(engine, yearly_summ)
 
     logger.info("Completed task loading gold yearly data to Postgres local",
@@ -272,7 +274,7 @@ def load_gold_seasonally_summ_data_to_postgres(pipeline_name, df, season_label):
                        "task_run_id": runtime.task_run.id,
                        }
                 )
-    engine = create_engine(config("DB_CONN_RAW"))
+    engine = get_sqlalchemy_engine()
     load_gold_seasonally_summ_data_to_postgres_worker(engine, df)
 
     logger.info("Completed task loading gold seasonally data to Postgres local",
@@ -282,5 +284,43 @@ def load_gold_seasonally_summ_data_to_postgres(pipeline_name, df, season_label):
                 )
 
 
+@task(name="Load gold rollup state to Azure blob", retries=3, retry_delay_seconds=30,
+      task_run_name="Load rollup state | {grain} | {period_start}")
+@measure_task_duration(flow_name="gold_flow", task_name="load_gold_rollup_state_to_azure", on_complete=push_task_metrics)
+def load_gold_rollup_state_to_azure(grain: str, period_start: pendulum.DateTime, state: pd.DataFrame, label: str = None):
+    logger = get_logger()
+    result = upload_rollup_state(fs_client, grain, period_start, state, label)
+    logger.info(f"Rollup state {grain} | {period_start} | {result['reason']}",
+                extra={"flow_run_id": runtime.flow_run.id,
+                       "task_run_id": runtime.task_run.id,
+                       "path": result["path"],
+                       }
+                )
+    return result
+
+
+@task(name="Fold daily rollup states into Postgres accumulators", retries=3, retry_delay_seconds=30)
+@measure_task_duration(flow_name="gold_daily_summ_flow", task_name="fold_gold_rollup_states_to_postgres", on_complete=push_task_metrics)
+def fold_gold_rollup_states_to_postgres(daily_states: list[tuple[pendulum.DateTime, pd.DataFrame]]) -> dict:
+    logger = get_logger()
+    totals = {"folded": 0, "skipped": 0}
+    for ts, state in daily_states:
+        result = fold_daily_state(ts, state)
+        totals["folded"] += result["folded"]
+        totals["skipped"] += result["skipped"]
+
+    logger.info("Folded daily rollup states into accumulators",
+                extra={"flow_run_id": runtime.flow_run.id,
+                       "task_run_id": runtime.task_run.id,
+                       "days": len(daily_states),
+                       **totals,
+                       }
+                )
+    return totals
 
 
+@task(name="Close gold rollup accumulator", retries=3, retry_delay_seconds=30,
+      task_run_name="Close accumulator | {grain} | {period_start}")
+@measure_task_duration(flow_name="gold_flow", task_name="close_gold_rollup_accumulator", on_complete=push_task_metrics)
+def close_gold_rollup_accumulator(grain: str, period_start: pendulum.DateTime) -> int:
+    return close_rollup_accumulator(grain, period_start)
@@ -1,15 +1,15 @@
-from venv import logger
-
 import pandas as pd
 import pendulum
 from prefect import task
-from sqlalchemy_utils.types import password
 
 from src.helpers.logging_helpers.combine_loggers_helper import get_logger
 from src.helpers.observability_helpers.decorators import measure_task_duration
 from src.helpers.observability_helpers.pushgateway_utils import push_task_metrics
 from src.workers.gold.transform_gold_data import get_daily_summ_data_worker, get_weekly_summ_data_worker, \
-    get_monthly_summ_data_worker, aggregate_months_to_year, aggregate_months_to_season
+    get_monthly_summ_data_worker, aggregate_months_to_year, aggregate_months_to_season, \
+    get_weekly_summ_from_states_worker, get_monthly_summ_from_states_worker, aggregate_month_states_to_year, \
+    aggregate_month_states_to_season
+from src.workers.gold.rollup_engine import build_rollup_state, collect_rollup_states
 
 
 @task(name="Transform gold data to daily")
@@ -84,3 +84,92 @@ def get_seasonally_summ_data(season, year, data) -> pd.DataFrame:
     logger.info(f"End task aggregate monthly to seasonally data for {season}_{year}")
 
     return aggregated_season
+
+
+# ── rollup engine ─────────────────────────────────────────────────────────────
+
+@task(name="Build daily rollup states")
+@measure_task_duration(flow_name="gold_daily_summ_flow", task_name="build_daily_rollup_states", on_complete=push_task_metrics)
+def build_daily_rollup_states(gold_results: list[tuple[pendulum.DateTime, pd.DataFrame]]) -> list[
+    tuple[pendulum.DateTime, pd.DataFrame]]:
+    """Partial states of each day, from the hourly gold rows (base observations of every higher grain)."""
+    logger = get_logger()
+    daily_states = [(ts, build_rollup_state(df)) for ts, df in gold_results if not df.empty]
+    logger.info("Built daily rollup states", extra={"days": len(daily_states)})
+    return daily_states
+
+
+def _saved_state(grain: str, state: pd.DataFrame, exact: bool) -> pd.DataFrame | None:
+    """The merged state when it is exact, None when it came from summary rows (it must not be saved)."""
+    if not exact:
+        get_logger().warning(f"{grain} state merged from summary rows, not saved as a rollup state")
+        return None
+    return state
+
+
+@task(name="Merge daily rollup states to weekly")
+@measure_task_duration(flow_name="gold_weekly_summ_flow", task_name="get_weekly_summ_from_states", on_complete=push_task_metrics)
+def get_weekly_summ_from_states(week_start: pendulum.DateTime, stored_states: dict,
+                                days: list[tuple[pendulum.DateTime, pd.DataFrame]]) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """days: summaries of the days without a stored state. The state is None when it isn't exact."""
+    logger = get_logger()
+    logger.info(f"Merging daily rollup states for week {week_start.to_date_string()}")
+    day_states, exact = collect_rollup_states(stored_states, days)
+    weekly_summ, weekly_state = get_weekly_summ_from_states_worker(week_start, day_states)
+    return weekly_summ, _saved_state("weekly", weekly_state, exact)
+
+
+@task(name="Merge daily rollup states to monthly",
+      task_run_name="Merge monthly states | {month_start}")
+@measure_task_duration(flow_name="gold_monthly_summ_flow", task_name="get_monthly_summ_from_states", on_complete=push_task_metrics)
+def get_monthly_summ_from_states(month_start: pendulum.DateTime, stored_states: dict,
+                                 days: list[tuple[pendulum.DateTime, pd.DataFrame]],
+                                 max_missing_ratio: float) -> tuple[pd.DataFrame, pd.DataFrame]:
+    logger = get_logger()
+    logger.info(f"Merging daily rollup states for month {month_start.to_date_string()}")
+    day_states, exact = collect_rollup_states(stored_states, days)
+    monthly_summ, monthly_state = get_monthly_summ_from_states_worker(month_start, day_states, max_missing_ratio)
+    return monthly_summ, _saved_state("monthly", monthly_state, exact)
+
+
+@task(name="Merge monthly rollup states to yearly",
+      task_run_name="Merge yearly states | {year}")
+@measure_task_duration(flow_name="gold_monthly_to_yearly_flow", task_name="aggregate_gold_month_states", on_complete=push_task_metrics)
+def aggregate_gold_month_states(stored_states, all_months_dfs, expected_months, max_missing_ratio, year) -> tuple[
+    pd.DataFrame, pd.DataFrame]:
+    logger = get_logger()
+    logger.info(f"Merging monthly rollup states for {year}")
+    month_states, exact = collect_rollup_states(stored_states, all_months_dfs)
+    yearly_summ, yearly_state = aggregate_month_states_to_year(month_states, expected_months, max_missing_ratio, year)
+    return yearly_summ, _saved_state("yearly", yearly_state, exact)
+
+
+@task(name="Merge monthly rollup states to seasonally",
+      task_run_name="Merge seasonal states | {season}_{year}")
+@measure_task_duration(flow_name="gold_seasonal_flow", task_name="get_seasonally_summ_from_states", on_complete=push_task_metrics)
+def get_seasonally_summ_from_states(season, year, stored_states, data) -> tuple[pd.DataFrame, pd.DataFrame]:
+    logger = get_logger()
+    logger.info(f"Merging monthly rollup states for {season}_{year}")
+    month_states, exact = collect_rollup_states(stored_states, data)
+    period_start = min([*stored_states, *(month for month, _ in data)], default=None)
+    season_summ, season_state = aggregate_month_states_to_season(season, year, period_start, month_states)
+    return season_summ, _saved_state("seasonal", season_state, exact)
+
+
+@task(name="Finalize weekly rollup accumulator")
+@measure_task_duration(flow_name="gold_weekly_summ_flow", task_name="get_weekly_summ_from_accumulator", on_complete=push_task_metrics)
+def get_weekly_summ_from_accumulator(week_start: pendulum.DateTime,
+                                     state: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    logger = get_logger()
+    logger.info(f"Finalizing weekly accumulator for week {week_start.to_date_string()}")
+    return get_weekly_summ_from_states_worker(week_start, [state])
+
+
+@task(name="Finalize monthly rollup accumulator",
+      task_run_name="Finalize monthly accumulator | {month_start}")
+@measure_task_duration(flow_name="gold_monthly_summ_flow", task_name="get_monthly_summ_from_accumulator", on_complete=push_task_metrics)
+def get_monthly_summ_from_accumulator(month_start: pendulum.DateTime, state: pd.DataFrame,
+                                      max_missing_ratio: float) -> tuple[pd.DataFrame, pd.DataFrame]:
+    logger = get_logger()
+    logger.info(f"Finalizing monthly accumulator for month {month_start.to_date_string()}")
+    return get_monthly_summ_from_states_worker(month_start, [state], max_missing_ratio)
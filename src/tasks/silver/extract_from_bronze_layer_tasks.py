@@ -1,18 +1,19 @@
 import pendulum
-from decouple import config
+from azure.core.exceptions import ResourceNotFoundError
 from prefect import task, runtime
-from sqlalchemy import create_engine
 
+from src.clients.postgres_client import get_sqlalchemy_engine
 from src.helpers.observability_helpers.decorators import measure_task_duration
 from src.helpers.observability_helpers.pushgateway_utils import push_task_metrics
 from src.helpers.logging_helpers.combine_loggers_helper import get_logger
+from src.helpers.bronze.bronze_layout import BRONZE_LAYOUT, writes_bundle
 from src.workers.silver.extract_bronze_data_for_transformation import extract_bronze_data_from_postgres_worker, \
-    download_json_from_adls_worker
+    download_json_from_adls_worker, download_bronze_bundle_from_adls_worker
 
 
 @task
 @measure_task_duration(flow_name="silver_flow", task_name="get_bronze_from_azure", on_complete=push_task_metrics)
-def extract_bronze_data_from_azure_blob_task(azure_fs_client, base_dir, date, hour):
+def extract_bronze_data_from_azure_blob_task(azure_fs_client, base_dir, date, hour, layout=BRONZE_LAYOUT):
     logger = get_logger()
     task_start = pendulum.now("UTC")
 
@@ -23,12 +24,22 @@ def extract_bronze_data_from_azure_blob_task(azure_fs_client, base_dir, date, ho
             "flow_run_id": runtime.flow_run.id,
             "task_run_id": runtime.task_run.id,
             "date": date,
-            "hour": hour
+            "hour": hour,
+            "layout": layout
         }
     )
 
-    # Extract data
-    raw_records = download_json_from_adls_worker(azure_fs_client, base_dir, date, hour)
+    # Extract data - hourly bundle when the layout writes one, per-file JSONs otherwise
+    if writes_bundle(layout):
+        try:
+            raw_records = download_bronze_bundle_from_adls_worker(azure_fs_client, base_dir, date, hour)
+        except ResourceNotFoundError:
+            if layout != "both":
+                raise
+            logger.warning("Bronze bundle not found, reading per-file JSONs | date=%s | hour=%s", date, hour)
+            raw_records = download_json_from_adls_worker(azure_fs_client, base_dir, date, hour)
+    else:
+        raw_records = download_json_from_adls_worker(azure_fs_client, base_dir, date, hour)
 
     # Compute row count safely
     rows_count = len(raw_records) if raw_records else 0
@@ -91,7 +102,7 @@ def extract_bronze_data_from_postgres(date, hour):
                 )
 
     # Create engine inside task to avoid Prefect caching issues
-    engine = create_engine(config("DB_CONN_RAW"))
+    engine = get_sqlalchemy_engine()
 
     raw_records = extract_bronze_data_from_postgres_worker(engine, date, hour)
 
@@ -2,13 +2,23 @@ import math
 
 import pandas as pd
 
+from src.helpers.lazy_imports import lazy_callable
 from src.helpers.silver.transformation import split_date
-from src.validation.scraped_data.accuweather_input_data_validation import validate_input_accuweather_data
-from src.validation.scraped_data.accuweather_output_data_validation import validate_output_accuweather_data
-from src.validation.scraped_data.meteoblue_input_data_validation import validate_meteoblue_input_data
-from src.validation.scraped_data.meteoblue_output_data_validation import validate_meteoblue_output_data
-from src.validation.scraped_data.sinoptik_input_data_validation import validate_input_sinoptik_data
-from src.validation.scraped_data.sinoptik_output_data_validation import validate_output_sinoptik_data
+
+# pandera (~0.4s to import) is loaded by the first validation, not when the flow module is imported
+_SCHEMAS = "src.validation.scraped_data"
+validate_input_accuweather_data = lazy_callable(f"{_SCHEMAS}.accuweather_input_data_validation",
+                                                "validate_input_accuweather_data")
+validate_output_accuweather_data = lazy_callable(f"{_SCHEMAS}.accuweather_output_data_validation",
+                                                 "validate_output_accuweather_data")
+validate_meteoblue_input_data = lazy_callable(f"{_SCHEMAS}.meteoblue_input_data_validation",
+                                              "validate_meteoblue_input_data")
+validate_meteoblue_output_data = lazy_callable(f"{_SCHEMAS}.meteoblue_output_data_validation",
+                                               "validate_meteoblue_output_data")
+validate_input_sinoptik_data = lazy_callable(f"{_SCHEMAS}.sinoptik_input_data_validation",
+                                             "validate_input_sinoptik_data")
+validate_output_sinoptik_data = lazy_callable(f"{_SCHEMAS}.sinoptik_output_data_validation",
+                                              "validate_output_sinoptik_data")
 
 
 def accuweather_transformation(df: pd.DataFrame):
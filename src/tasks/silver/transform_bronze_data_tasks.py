@@ -3,8 +3,10 @@ from prefect import task
 
 from src.helpers.logging_helpers.combine_loggers_helper import get_logger
 from src.helpers.observability_helpers.decorators import measure_task_duration
-from src.helpers.observability_helpers.pushgateway_utils import push_task_metrics
-from src.workers.silver.transform_bronze_data import clean_silver_df, normalize_and_combine, parse_records_from_api
+from src.helpers.observability_helpers.pushgateway_utils import push_task_metrics, push_cleaning_metrics
+from src.workers.silver.compiled_cleaning_workers import clean_silver_df_compiled
+from src.workers.silver.transform_bronze_data import clean_silver_df, normalize_and_combine, parse_records_from_api, \
+    SILVER_CLEAN_ENGINE
 
 
 @task
@@ -32,12 +34,16 @@ def parse_api_records(bronze_records: dict):
 
 @task
 @measure_task_duration(flow_name="silver_flow", task_name="clean_silver", on_complete=push_task_metrics)
-def clean_silver(df: pd.DataFrame):
+def clean_silver(df: pd.DataFrame, engine: str = SILVER_CLEAN_ENGINE):
     logger = get_logger()
     logger.info(
         "Task clean silver df started ...",
     )
-    cleaned_df = clean_silver_df(df)
+    if engine == "compiled":
+        cleaned_df, report = clean_silver_df_compiled(df)
+        push_cleaning_metrics("silver_flow", report)
+    else:
+        cleaned_df = clean_silver_df(df)
     logger.info(
         "Task clean silver df completed",
     )
@@ -0,0 +1,73 @@
+import pytest
+from azure.core.exceptions import ResourceNotFoundError
+
+import src.clients.datalake_client as datalake_client
+from src.benchmarks.fixture_server import FIXTURE_PROVIDERS, fixture_server, load_fixtures
+from src.benchmarks.local_datalake import LocalFileSystemClient, local_datalake
+from src.benchmarks.pipeline_benchmark import bench_locations
+from src.clients.http_client import HTTP_PROVIDERS, get_http_client
+from src.helpers.bronze.json_codec import decode_payload
+from src.helpers.silver.parsing_mapper import api_data_parsers
+from src.workers.bronze.load_raw_data_from_weather_APIs_to_Azure_workers import upload_bronze_bundle
+from src.workers.silver.extract_bronze_data_for_transformation import download_bronze_bundle_from_adls_worker
+from src.workers.silver.transform_bronze_data import parse_records_columnar
+
+
+def test_local_datalake_round_trips_a_bronze_bundle(tmp_path):
+    lake = LocalFileSystemClient(tmp_path)
+    results = [{"api_name": "open_meteo", "label": "Bansko", "data": {"daily": {"time": ["2026-01-05"]}}}]
+
+    assert upload_bronze_bundle(lake, "raw", "2026-01-05", "07", results)["uploaded"]
+    assert not upload_bronze_bundle(lake, "raw", "2026-01-05", "07", results)["uploaded"]
+
+    records = download_bronze_bundle_from_adls_worker(lake, "raw", "2026-01-05", "07")
+    assert [(r["source"], r["place_name"], r["ingest_hour"]) for r in records] == [("open_meteo", "Bansko", 7)]
+
+    paths = [p.name for p in lake.get_paths(path="raw") if not p.is_directory]
+    assert paths == ["raw/bundles/2026-01-05/07.parquet"]
+    assert lake.get_file_client(paths[0]).get_file_properties().etag
+    with pytest.raises(ResourceNotFoundError):
+        download_bronze_bundle_from_adls_worker(lake, "raw", "2026-01-05", "08")
+
+
+def test_appended_data_is_visible_after_flush(tmp_path):
+    file_client = LocalFileSystemClient(tmp_path).get_file_client("silver/2026/01/05/07.parquet")
+    file_client.create_file()
+    file_client.append_data(data=b"abc", offset=0, length=3)
+
+    assert file_client.download_file().readall() == b""
+    file_client.flush_data(3)
+    assert file_client.download_file().readall() == b"abc"
+
+
+def test_local_datalake_replaces_the_process_fs_client():
+    with local_datalake() as lake:
+        assert datalake_client.fs_client.account_name == lake.account_name
+    assert datalake_client._client is not lake
+
+
+def test_fixture_server_answers_forecasts_and_geocoding():
+    location = bench_locations(1)[0]
+    real_base_url = HTTP_PROVIDERS["accuweather"]["base_url"]
+
+    with fixture_server([location]) as server:
+        forecast = get_http_client("open_meteo").get("/v1/forecast", params={"latitude": 1, "longitude": 2})
+        search = get_http_client("accuweather").get("/locations/v1/cities/search", params={"q": location["name"]})
+
+        assert forecast.content == load_fixtures()["open_meteo"]
+        assert search.json()[0]["Key"]
+        assert server.requests == 2
+
+    assert HTTP_PROVIDERS["accuweather"]["base_url"] == real_base_url
+
+
+def test_fixtures_cover_every_parser():
+    fixtures = load_fixtures()
+    records = [
+        {"source": provider, "place_name": "Bansko", "ingest_date": "2026-01-05", "ingest_hour": 7,
+         "payload": decode_payload(provider, fixtures[provider])}
+        for provider in FIXTURE_PROVIDERS
+    ]
+
+    assert set(FIXTURE_PROVIDERS) == set(api_data_parsers)
+    assert set(parse_records_columnar(records)["api_name"]) == set(FIXTURE_PROVIDERS)
@@ -0,0 +1,132 @@
+from datetime import date
+
+import pendulum
+import psycopg
+import pytest
+
+import src.helpers.observability_helpers.find_process_state as find_process_state
+import src.helpers.observability_helpers.state_helpers as state_helpers
+from src.benchmarks.local_postgres import disposable_database
+from src.helpers.observability_helpers.find_process_state import default_lease_owner
+
+ARGS = dict(processing_level="gold_weekly", statuses=["pending", "failed"],
+            error_types=["missing_partitions", None], max_retries=3)
+
+
+@pytest.fixture(scope="module")
+def database():
+    """Scratch database with the sql/tables schema, skipped when there is no Postgres to create it on."""
+    try:
+        with disposable_database() as db:
+            yield db
+    except RuntimeError as e:
+        pytest.skip(str(e))
+
+
+@pytest.fixture
+def processing_state(database):
+    """(insert, read): insert (partition_date, status, retry_count, error_type, lease) rows, read them back."""
+    database.truncate()
+
+    def insert(*rows):
+        with psycopg.connect(database.dsn, autocommit=True) as conn:
+            for partition_date, status, retry_count, error_type, lease in rows:
+                conn.execute(
+                    """
+                    INSERT INTO processing_state
+                        (processing_level, partition_date, status, retry_count, error_type, lease_owner,
+                         lease_expires_at)
+                    VALUES ('gold_weekly', %s, %s, %s, %s, %s, NOW() + %s::interval)
+                    """,
+                    (partition_date, status, retry_count, error_type, "worker-0" if lease else None, lease))
+
+    def read():
+        with psycopg.connect(database.dsn) as conn:
+            rows = conn.execute(
+                """
+                SELECT partition_date, status, retry_count, lease_owner, lease_expires_at > NOW()
+                FROM processing_state
+                ORDER BY partition_date
+                """).fetchall()
+        return {row[0]: row[1:] for row in rows}
+
+    return insert, read
+
+
+def _dates(claimed):
+    return [d.to_date_string() for d in claimed]
+
+
+def test_claim_leases_pending_and_expired_rows(monkeypatch, processing_state):
+    insert, read = processing_state
+    insert((date(2026, 1, 5), "pending", 0, None, None),
+           (date(2026, 1, 12), "failed", 1, "missing_partitions", None),
+           (date(2026, 1, 19), "processing", 0, None, "-5 minutes"),  # worker died, lease expired
+           (date(2026, 1, 26), "processing", 0, None, "10 minutes"),  # still leased
+           (date(2026, 2, 2), "pending", 3, None, None),  # out of retries
+           (date(2026, 2, 9), "success", 0, None, None))
+    monkeypatch.setattr(find_process_state, "WORK_CLAIM_MODE", "claim")
+
+    claimed = find_process_state.claim_pending_work(**ARGS, lease_seconds=600, owner="worker-1")
+
+    assert _dates(claimed) == ["2026-01-05", "2026-01-12", "2026-01-19"]
+    rows = read()
+    assert rows[date(2026, 1, 5)] == ("processing", 0, "worker-1", True)
+    assert rows[date(2026, 1, 12)] == ("processing", 1, "worker-1", True)
+    assert rows[date(2026, 1, 19)] == ("processing", 1, "worker-1", True)  # reclaiming counts as a retry
+    assert rows[date(2026, 1, 26)] == ("processing", 0, "worker-0", True)
+    assert rows[date(2026, 2, 2)][:3] == ("pending", 3, None)
+    assert rows[date(2026, 2, 9)][:3] == ("success", 0, None)
+
+    # everything claimable is leased now, a second worker gets nothing
+    assert find_process_state.claim_pending_work(**ARGS, owner="worker-2") == []
+
+
+def test_claim_limit_leaves_the_rest_for_other_workers(monkeypatch, processing_state):
+    insert, read = processing_state
+    insert(*[(date(2026, 1, day), "pending", 0, None, None) for day in (5, 12, 19)])
+    monkeypatch.setattr(find_process_state, "WORK_CLAIM_MODE", "claim")
+
+    first = find_process_state.claim_pending_work(**ARGS, limit=2, owner="worker-1")
+    second = find_process_state.claim_pending_work(**ARGS, limit=2, owner="worker-2")
+
+    assert _dates(first) == ["2026-01-05", "2026-01-12"]
+    assert _dates(second) == ["2026-01-19"]
+    assert [row[2] for row in read().values()] == ["worker-1", "worker-1", "worker-2"]
+
+
+def test_starting_a_claimed_partition_renews_its_lease(monkeypatch, database, processing_state):
+    insert, read = processing_state
+    insert((date(2026, 1, 5), "pending", 0, None, None),
+           (date(2026, 1, 26), "processing", 0, None, "10 minutes"))  # another worker's lease
+    monkeypatch.setattr(find_process_state, "WORK_CLAIM_MODE", "claim")
+    monkeypatch.setattr(state_helpers, "WORK_LEASE_SECONDS", 7200)
+
+    find_process_state.claim_pending_work(**ARGS, lease_seconds=1)
+    # the partition waited in the run's pool for longer than the claim lease, then starts
+    with psycopg.connect(database.dsn, autocommit=True) as conn:
+        conn.execute("UPDATE processing_state SET lease_expires_at = NOW() - interval '1 minute'")
+    for day in (5, 26):
+        state_helpers.upsert_state_fn(processing_level="gold_weekly", partition_date=pendulum.datetime(2026, 1, day),
+                                      status="processing", expected_count=7)
+
+    rows = read()
+    assert rows[date(2026, 1, 5)] == ("processing", 0, default_lease_owner(), True)
+    assert rows[date(2026, 1, 26)] == ("processing", 0, "worker-0", False)  # not ours, not renewed
+    assert _dates(find_process_state.claim_pending_work(**ARGS, owner="worker-2")) == ["2026-01-26"]
+
+    state_helpers.upsert_state_fn(processing_level="gold_weekly", partition_date=pendulum.datetime(2026, 1, 5),
+                                  status="success", expected_count=7, actual_count=7)
+    assert read()[date(2026, 1, 5)] == ("success", 0, None, None)  # the lease ends with the partition
+
+
+def test_select_mode_returns_pending_rows_without_a_lease(monkeypatch, processing_state):
+    insert, read = processing_state
+    insert((date(2026, 1, 5), "pending", 0, None, None),
+           (date(2026, 1, 19), "processing", 0, None, "-5 minutes"))
+    monkeypatch.setattr(find_process_state, "WORK_CLAIM_MODE", "select")
+
+    claimed = find_process_state.claim_pending_work(**ARGS, owner="worker-1")
+
+    assert _dates(claimed) == ["2026-01-05"]
+    assert read()[date(2026, 1, 5)] == ("pending", 0, None, None)
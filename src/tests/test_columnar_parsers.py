@@ -0,0 +1,111 @@
+import msgspec
+import pandas as pd
+
+from src.helpers.bronze.json_codec import decode_payload, dumps
+from src.workers.silver.transform_bronze_data import parse_records_from_api, parse_records_columnar
+from src.workers.silver.columnar_parsing_workers import SILVER_COLUMNS
+
+# --- Тестови payload-и (съкратени отговори от всяко API) ---
+PAYLOADS = {
+    "open_meteo": {"daily": {
+        "time": ["2026-01-05", "2026-01-06", "2026-01-07"],
+        "temperature_2m_max": [1.5, 2.0, -0.5], "temperature_2m_min": [-6.1, -5.0, -8.2],
+        "precipitation_sum": [0.0, 3.2, 1.1], "rain_sum": [0.0, 0.4],
+        "windspeed_10m_max": [12.0, 20.5, 8.8], "cloudcover_mean": [40, 95, 60], "weathercode": [3, 71, 73],
+    }},
+    "meteoblue": {"metadata": {"utc_timeoffset": 2.0}, "data_day": {
+        "time": ["2026-01-05", "2026-01-06"],
+        "temperature_max": [0.4, 1.1], "temperature_min": [-7.0, -6.3],
+        "temperature_mean": [-3.1, -2.4], "precipitation_sum": [0.2],
+    }},
+    "accuweather": {"DailyForecasts": [
+        {"Date": "2026-01-05T07:00:00+02:00",
+         "Temperature": {"Minimum": {"Value": -7.2}, "Maximum": {"Value": 0.6}},
+         "Day": {"PrecipitationProbability": 25, "IconPhrase": "Cloudy", "Icon": 7}},
+        {"Date": "2026-01-06T01:00:00+02:00",
+         "Temperature": {"Minimum": {"Value": -5.0}, "Maximum": {"Value": 1.9}},
+         "Day": {"PrecipitationProbability": 70, "IconPhrase": "Snow", "Icon": 22}},
+    ]},
+    "tomorrow": {"timelines": {"daily": [
+        {"time": "2026-01-04T22:00:00Z", "values": {
+            "temperatureMax": 0.9, "temperatureMin": -6.6, "temperatureAvg": -2.8, "rainAccumulationSum": 0,
+            "snowAccumulationSum": 4.1, "precipitationProbabilityAvg": 55, "humidityAvg": 88,
+            "windSpeedAvg": 3.4, "windDirectionAvg": 210, "cloudCoverAvg": 77, "weatherCodeMax": 5100,
+            "sunriseTime": "2026-01-05T05:52:00Z", "sunsetTime": "2026-01-05T15:11:00Z"}},
+    ]}},
+    "openweathermap": {"city": {"timezone": 7200}, "list": [
+        {"dt_txt": "2026-01-05 00:00:00", "main": {"temp": -4.2, "temp_min": -4.9, "temp_max": -4.0, "humidity": 91},
+         "weather": [{"id": 600, "description": "light snow", "icon": "13n"}],
+         "wind": {"speed": 2.1, "deg": 190}, "clouds": {"all": 100}, "pop": 0.4},
+        {"dt_txt": "2026-01-05 03:00:00", "main": {"temp": -5.0, "temp_min": -5.1, "temp_max": -4.8, "humidity": 93},
+         "weather": [], "wind": {"speed": 1.7}, "clouds": {"all": 85}},
+    ]},
+    "weatherapi": {"location": {"tz_id": "Europe/Sofia"}, "forecast": {"forecastday": [
+        {"date": "2026-01-05",
+         "day": {"maxtemp_c": 0.3, "mintemp_c": -7.7, "avgtemp_c": -3.5, "totalprecip_mm": 1.2,
+                 "daily_chance_of_rain": 10, "maxwind_kph": 14.4,
+                 "condition": {"text": "Light snow", "icon": "//cdn/326.png", "code": 1213}},
+         "astro": {"sunrise": "07:52 AM", "sunset": "05:11 PM"}},
+    ]}},
+    "foreca": {"tz": "Europe/Sofia", "forecast": [
+        {"date": "2026-01-05", "maxTemp": 1, "minTemp": -7, "precipAccum": 0.5, "precipProb": 30,
+         "maxWindSpeed": 4, "windDir": 200, "cloudiness": 80, "symbolPhrase": "overcast", "symbol": "d400",
+         "sunrise": "07:51:00", "sunset": "17:12:00"},
+    ]},
+    "weatherbit": {"timezone": "Europe/Sofia", "data": [
+        {"datetime": "2026-01-05", "max_temp": 0.1, "min_temp": -8.0, "precip": 2.0, "snow": 20, "pop": 60,
+         "rh": 85, "wind_spd": 2.5, "clouds": 90, "weather": {"description": "Snow", "icon": "s02d"}},
+    ]},
+}
+
+
+def _bronze_records(source_suffix=""):
+    return [
+        {"source": f"{api_name}{source_suffix}", "place_name": "Bansko",
+         "ingest_date": "2026-01-05", "ingest_hour": 7, "payload": payload}
+        for api_name, payload in PAYLOADS.items()
+    ]
+
+
+def test_columnar_engine_matches_row_parsers():
+    rows_df = parse_records_from_api(_bronze_records(), engine="rows")
+    columnar_df = parse_records_from_api(_bronze_records(), engine="columnar")
+
+    # row parser for tomorrow adds an extra forecast_date column, silver only keeps SILVER_COLUMNS
+    rows_df = rows_df[SILVER_COLUMNS]
+
+    assert list(columnar_df.columns) == SILVER_COLUMNS
+    assert len(columnar_df) == len(rows_df)
+    for col in SILVER_COLUMNS:
+        left = rows_df[col].astype(object).where(rows_df[col].notna(), None).tolist()
+        right = columnar_df[col].astype(object).where(columnar_df[col].notna(), None).tolist()
+        assert left == right, col
+
+
+def test_columnar_engine_accepts_postgres_source_names():
+    df = parse_records_columnar(_bronze_records(source_suffix="_api"))
+
+    assert not df.empty
+    assert set(df["api_name"]) == set(PAYLOADS)
+
+
+def test_columnar_engine_skips_empty_payloads():
+    records = [{"source": "open_meteo", "place_name": "Bansko", "ingest_date": "2026-01-05",
+                "ingest_hour": 7, "payload": {}}]
+
+    assert parse_records_columnar(records).empty
+    assert isinstance(parse_records_columnar([]), pd.DataFrame)
+
+
+def test_typed_payloads_match_dict_payloads():
+    records = [
+        {**record, "payload": decode_payload(record["source"], dumps(record["payload"]), typed=True)}
+        for record in _bronze_records()
+    ]
+    typed_df = parse_records_columnar(records)
+    dict_df = parse_records_columnar(_bronze_records())
+
+    assert any(isinstance(r["payload"], msgspec.Struct) for r in records)
+    pd.testing.assert_frame_equal(typed_df, dict_df)
+    pd.testing.assert_frame_equal(parse_records_from_api(records, engine="rows"),
+                                  parse_records_from_api(_bronze_records(), engine="rows"))
@@ -0,0 +1,49 @@
+import pandas as pd
+
+from src.tests.test_columnar_parsers import _bronze_records
+from src.workers.silver.compiled_cleaning_workers import clean_silver_df_compiled
+from src.workers.silver.transform_bronze_data import clean_silver_df, parse_records_from_api
+
+
+def _silver_df():
+    df = parse_records_from_api(_bronze_records(), engine="columnar")
+    # out of range, garbage and empty values
+    df.loc[0, "temp_max"] = 95.0
+    df.loc[1, "humidity"] = -3
+    df["wind_deg"] = df["wind_deg"].astype(object)
+    df.loc[2, "wind_deg"] = "n/a"
+    return df
+
+
+def _comparable(df):
+    return df.drop(columns=["batch_id"]).astype(object).where(df.drop(columns=["batch_id"]).notna(), None)
+
+
+def test_compiled_clean_matches_legacy_clean():
+    legacy = clean_silver_df(_silver_df())
+    compiled, _ = clean_silver_df_compiled(_silver_df())
+
+    assert list(compiled.columns) == list(legacy.columns)
+    assert str(compiled["forecast_hour_utc"].dtype) == "Int64"
+    for col in compiled.columns.drop("batch_id"):
+        if col in ("temp_max", "humidity", "wind_deg"):
+            assert compiled[col].astype(float).tolist() == legacy[col].astype(float).tolist(), col
+        else:
+            assert _comparable(compiled)[col].tolist() == _comparable(legacy)[col].tolist(), col
+
+
+def test_compiled_clean_reports_counts():
+    df = _silver_df()
+    _, report = clean_silver_df_compiled(df)
+
+    assert report["temp_max"]["clipped"] == 1
+    assert report["humidity"]["clipped"] == 1
+    assert report["wind_deg"]["coerced"] == 1
+    assert report["snow"]["filled"] == int(df["snow"].isna().sum())
+
+
+def test_compiled_clean_empty_dataframe():
+    df, report = clean_silver_df_compiled(pd.DataFrame())
+
+    assert df.empty
+    assert report == {}
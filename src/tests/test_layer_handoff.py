@@ -0,0 +1,128 @@
+import contextvars
+import threading
+from datetime import timedelta
+
+import pandas as pd
+import pendulum
+import pytest
+
+from src.helpers.master.layer_handoff import after_persisted, bronze_records_from_results, current_handoff, \
+    persist, pipelined_run, silver_hour_key
+from src.tests.test_silver_pushdown import DAY, _fetch, _silver_hour, fs_client  # noqa: F401 (fixture)
+from src.workers.gold.extract_silver_data import GOLD_SILVER_COLUMNS, silver_frame_from_memory
+from src.workers.gold.transform_silver_data import get_df_data
+
+_flow_run = contextvars.ContextVar("flow_run", default=None)
+
+
+def test_persist_writes_inline_outside_a_pipelined_run():
+    writes = []
+
+    persist("silver_to_azure", lambda df: writes.append((df, threading.current_thread().name)), "df")
+
+    assert current_handoff() is None
+    assert writes == [("df", threading.current_thread().name)]
+
+
+def test_writes_run_in_the_background_and_are_awaited():
+    release = threading.Event()
+    writes = []
+
+    def slow_write(name):
+        release.wait(5)
+        writes.append((name, _flow_run.get(), threading.current_thread().name))
+
+    _flow_run.set("run-1")
+    with pipelined_run(enabled=True) as handoff:
+        persist("bronze_to_azure", slow_write, "bronze")
+        handoff.put("bronze_records", [{"source": "weatherapi"}])
+        # the next layer goes on while the write is still running
+        assert writes == []
+        assert handoff.take("bronze_records") == [{"source": "weatherapi"}]
+        assert handoff.take("bronze_records") is None
+        release.set()
+
+    assert writes[0][:2] == ("bronze", "run-1")
+    assert writes[0][2].startswith("handoff-write")
+    assert current_handoff() is None
+
+
+def test_failed_background_write_fails_the_run():
+    def failing_write():
+        raise ConnectionError("adls down")
+
+    with pytest.raises(RuntimeError, match="silver_to_azure"):
+        with pipelined_run(enabled=True):
+            persist("silver_to_azure", failing_write)
+
+
+def test_layer_error_wins_over_write_errors():
+    with pytest.raises(ValueError, match="gold"):
+        with pipelined_run(enabled=True):
+            persist("silver_to_azure", lambda: 1 / 0)
+            raise ValueError("gold")
+
+
+def test_outcome_is_reported_once_the_writes_are_durable():
+    release = threading.Event()
+    outcomes = []
+
+    def failing_write():
+        release.wait(5)
+        raise ConnectionError("postgres down")
+
+    with pytest.raises(RuntimeError):
+        with pipelined_run(enabled=True):
+            persist("silver_to_azure", release.wait, 5)
+            persist("silver_to_postgres", failing_write)
+            persist("bronze_to_azure", lambda: None)
+            after_persisted(["silver_to_azure", "silver_to_postgres"], outcomes.append)
+            assert outcomes == []  # queued, not durable yet
+            release.set()
+
+    assert outcomes == [["silver_to_postgres"]]
+
+    after_persisted(["silver_to_azure"], outcomes.append)  # inline writes are already durable
+    assert outcomes[-1] == []
+
+
+def test_disabled_handoff_keeps_inline_writes():
+    writes = []
+    with pipelined_run(enabled=False) as handoff:
+        persist("bronze_to_postgres", writes.append, "rows")
+        assert handoff is None and writes == ["rows"]
+
+
+def test_bronze_records_have_the_shape_silver_downloads():
+    results = [{"api_name": "weatherapi", "label": "Bansko", "api": None, "data": {"forecast": [1, 2]}, "error": None}]
+
+    assert bronze_records_from_results(results, "2026-01-05", "07") == [{
+        "source": "weatherapi",
+        "place_name": "Bansko",
+        "ingest_date": "2026-01-05",
+        "ingest_hour": 7,
+        "payload": {"forecast": [1, 2]},
+    }]
+
+
+def test_silver_hour_key():
+    assert silver_hour_key("2026-01-05", 7) == silver_hour_key(pendulum.datetime(2026, 1, 5).date(), "07") \
+        == "2026-01-05 07"
+
+
+def test_in_memory_silver_hour_matches_the_pushdown_read(fs_client):  # noqa: F811
+    pushdown = {"columns": GOLD_SILVER_COLUMNS, "date_from": DAY, "date_to": DAY + timedelta(days=5)}
+    from_file = _fetch(fs_client, **pushdown)
+    held = _silver_hour()
+
+    in_memory = silver_frame_from_memory(held, **pushdown)
+
+    assert list(in_memory.columns) == GOLD_SILVER_COLUMNS
+    # same rows and dtypes, the file is only sorted by forecast date
+    pd.testing.assert_frame_equal(in_memory.sort_values(GOLD_SILVER_COLUMNS).reset_index(drop=True),
+                                  from_file.sort_values(GOLD_SILVER_COLUMNS).reset_index(drop=True))
+
+    ts = pendulum.datetime(2026, 1, 5, 10)
+    assert get_df_data([(ts, in_memory)], ts)[0][1].equals(get_df_data([(ts, from_file)], ts)[0][1])
+    # gold works on its own copy, the frame the background writers hold is untouched
+    assert held.equals(_silver_hour())
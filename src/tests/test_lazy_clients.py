@@ -0,0 +1,49 @@
+import subprocess
+import sys
+
+import src.clients.datalake_client as datalake_client
+import src.helpers.observability_helpers.metrics_buffer as metrics_buffer
+
+
+class _FakeFsClient:
+    account_name = "etl"
+
+    def get_file_client(self, path):
+        return path
+
+
+def test_flow_import_builds_no_clients():
+    code = ("import sys; import src.clients.datalake_client, src.tasks.silver.load_silver_data; "
+            "import src.clients.datalake_client as d; "
+            "print(d._client is None, 'azure.identity' in sys.modules)")
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    assert out.split()[-2:] == ["True", "False"]
+
+
+def test_fs_client_is_built_on_first_use_and_cached(monkeypatch):
+    for name in ("TENANT_ID", "CLIENT_ID", "CLIENT_SECRET", "ACCOUNT_URL", "FILE_SYSTEM"):
+        monkeypatch.setenv(name, f"test-{name.lower()}")
+    built = []
+    monkeypatch.setattr(datalake_client, "_client", None)
+    monkeypatch.setattr(datalake_client, "get_datalake_client", lambda **kw: built.append(kw) or _FakeFsClient())
+
+    fs_client = datalake_client.fs_client
+    assert built == []
+    assert fs_client.account_name == "etl"
+    assert fs_client.get_file_client("silver/x.parquet") == "silver/x.parquet"
+    assert len(built) == 1 and built[0]["file_system"] == "test-file_system"
+
+    # a forked child builds its own client
+    monkeypatch.setattr(datalake_client, "_owner_pid", -1)
+    assert datalake_client.get_fs_client() is not None
+    assert len(built) == 2
+
+
+def test_metrics_buffer_is_per_process(monkeypatch):
+    monkeypatch.setattr(metrics_buffer, "_buffer", None)
+    first = metrics_buffer.get_metrics_buffer()
+    assert metrics_buffer.get_metrics_buffer() is first
+
+    monkeypatch.setattr(metrics_buffer, "_owner_pid", -1)
+    assert metrics_buffer.get_metrics_buffer() is not first
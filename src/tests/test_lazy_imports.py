@@ -0,0 +1,69 @@
+import subprocess
+import sys
+
+import pandas as pd
+
+from scripts.benchmark_startup import deployment_entrypoints, parse_importtime
+from src.helpers.lazy_imports import lazy_callable
+
+
+def test_lazy_module_runs_on_first_use():
+    code = ("import sys; from src.helpers.lazy_imports import lazy_module; "
+            "m = lazy_module('json.tool'); before = 'json.tool' in sys.modules; m.main; "
+            "import json.tool as real; print(before, 'json.tool' in sys.modules, m.main is real.main)")
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    assert out.split() == ["False", "True", "True"]
+
+
+def test_first_parquet_reads_from_threads_see_the_whole_module(tmp_path):
+    # fresh interpreter: pyarrow.parquet is not imported yet, every thread races the first access
+    code = f"""
+import io, sys, threading
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import src.clients.parquet_cache
+import src.workers.gold.extract_silver_data as extract_silver_data
+assert "pyarrow.parquet" not in sys.modules
+path = {str(tmp_path / "part.parquet")!r}
+barrier = threading.Barrier(8)
+
+def read(i):
+    barrier.wait()
+    if i % 2:
+        return len(extract_silver_data.pq.read_table(path))
+    return len(pd.read_parquet(path))
+
+with ThreadPoolExecutor(8) as pool:
+    futures = [pool.submit(read, i) for i in range(8)]
+print([f.result() for f in futures])
+"""
+    pd.DataFrame({"temp": [1.0, 2.0, 3.0]}).to_parquet(tmp_path / "part.parquet")
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    assert out.split("\n")[-2] == str([3] * 8)
+
+
+def test_lazy_callable_imports_on_first_call():
+    dumps = lazy_callable("json", "dumps")
+
+    assert dumps.__name__ == "dumps"
+    assert dumps({"a": 1}) == '{"a": 1}'
+
+
+def test_scraped_validation_doesnt_import_pandera():
+    code = ("import sys; import src.tasks.silver.scraped_weather_data_transformation_tasks; "
+            "print('pandera' in sys.modules)")
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    assert out.split()[-1] == "False"
+
+
+def test_benchmark_reads_entrypoints_and_importtime():
+    entrypoints = deployment_entrypoints()
+    assert entrypoints["Orchestrator-Deployment"] == "src/flows/master/orchestrator_flow.py:orchestrator_flow"
+
+    stderr = ("import time: self [us] | cumulative | imported package\n"
+              "import time:       696 |      25463 |   pyarrow\n"
+              "import time:       153 |      10082 |     pyarrow.parquet\n")
+    assert parse_importtime(stderr) == [("pyarrow", 696, 25463), ("pyarrow.parquet", 153, 10082)]
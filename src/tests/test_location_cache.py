@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+import src.helpers.bronze.location_cache as location_cache
+from src.core.exceptions import LocationNotFoundError
+
+
+@pytest.fixture
+def store(monkeypatch):
+    """bronze_location_cache as a dict: lookup_key -> (result, is_negative)."""
+    rows = {}
+    monkeypatch.setattr(location_cache, "LOCATION_CACHE_ENABLED", True)
+    monkeypatch.setattr(location_cache, "_memory", {})
+    monkeypatch.setattr(location_cache, "_read_store",
+                        lambda provider, key: (True, rows[key][0], None) if key in rows else (False, None, None))
+    monkeypatch.setattr(location_cache, "_write_store",
+                        lambda provider, key, result, is_negative, expires_at: rows.update({key: (result, is_negative)}))
+    return rows
+
+
+def _geocoder(responses):
+    calls = []
+
+    @location_cache.cached_location("test")
+    def geocode(place_name):
+        calls.append(place_name)
+        data = json.loads(responses.pop(0))
+        if not data:
+            raise LocationNotFoundError(f"No location found for {place_name}")
+        return data[0]["lat"], data[0]["lon"]
+
+    return geocode, calls
+
+
+def test_a_response_without_results_is_cached_as_not_found(store):
+    geocode, calls = _geocoder(["[]"])
+
+    assert geocode("Nowhere") is None
+    assert geocode("Nowhere") is None
+    assert calls == ["Nowhere"]
+    assert list(store.values()) == [(None, True)]
+
+
+def test_a_garbled_response_is_not_cached(store):
+    geocode, calls = _geocoder(["<html>502 Bad Gateway</html>", '[{"lat": 56.95, "lon": 24.1}]'])
+
+    with pytest.raises(ValueError):
+        geocode("Riga")
+    assert store == {}
+
+    assert geocode("Riga") == (56.95, 24.1)
+    assert calls == ["Riga", "Riga"]
+    assert list(store.values()) == [((56.95, 24.1), False)]
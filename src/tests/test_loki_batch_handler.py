@@ -0,0 +1,64 @@
+import logging
+import queue
+from types import SimpleNamespace
+
+import orjson
+
+from src.helpers.logging_helpers.json_log_formatter import JSONFormatter
+from src.helpers.logging_helpers.loki_batch_handler import BatchingLokiHandler, LokiQueueHandler
+
+
+class _FakeSession:
+    def __init__(self):
+        self.payloads = []
+
+    def post(self, url, data, headers, timeout):
+        self.payloads.append(orjson.loads(data))
+        return SimpleNamespace(status_code=204)
+
+    def close(self):
+        pass
+
+
+def _handler(max_queue_size=1000, batch_size=500):
+    target = BatchingLokiHandler("http://loki:3100/loki/api/v1/push", {"app": "etl-weather"},
+                                 batch_size=batch_size, flush_interval=3600)
+    target.emitter._session = _FakeSession()
+    handler = LokiQueueHandler(queue.Queue(maxsize=max_queue_size), target)
+    handler.setFormatter(JSONFormatter())
+    logger = logging.getLogger(f"test_loki_{id(handler)}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    return logger, handler, target.emitter._session
+
+
+def test_records_are_batched_into_one_push():
+    logger, handler, session = _handler()
+    for i in range(200):
+        logger.info("row %s loaded", i, extra={"place_name": "Bansko"})
+    logger.warning("done")
+    handler.close()
+
+    assert len(session.payloads) == 1
+    streams = session.payloads[0]["streams"]
+    assert {s["stream"]["severity"] for s in streams} == {"info", "warning"}
+    info = next(s for s in streams if s["stream"]["severity"] == "info")
+    assert len(info["values"]) == 200
+    first = orjson.loads(info["values"][0][1])
+    assert first["message"] == "row 0 loaded" and first["place_name"] == "Bansko"
+
+
+def test_full_queue_drops_instead_of_blocking():
+    logger, handler, session = _handler(max_queue_size=10)
+    handler.listener.stop()  # nothing drains the queue
+    for i in range(100):
+        logger.info("row %s", i)
+
+    assert handler.queue.qsize() == 10
+    assert handler.target.dropped == 90
+
+    handler.target.flush()
+    messages = [orjson.loads(line)["message"] if line.startswith("{") else line
+                for s in session.payloads[0]["streams"] for _, line in s["values"]]
+    assert messages == ["Dropped 90 log record(s) under backpressure"]
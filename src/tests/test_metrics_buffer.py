@@ -0,0 +1,69 @@
+from prometheus_client import Histogram
+
+import src.helpers.observability_helpers.metrics_buffer as metrics_buffer
+import src.helpers.observability_helpers.pushgateway_utils as pushgateway_utils
+from src.helpers.observability_helpers.metrics_buffer import MetricsBuffer
+from src.helpers.observability_helpers.pushgateway_utils import push_processing_state_metrics
+
+
+def _observe(buffer, job, value):
+    buffer.record("gateway:9091", job, Histogram, "api_call_duration_seconds", "API call duration",
+                  ["api_name"], lambda m: m.labels("weatherapi").observe(value))
+
+
+def test_observations_are_pushed_once_per_job(monkeypatch):
+    pushes = []
+    monkeypatch.setattr(metrics_buffer, "push_to_gateway",
+                        lambda url, job, registry: pushes.append((job, registry.get_sample_value(
+                            "api_call_duration_seconds_count", {"api_name": "weatherapi"}))))
+    buffer = MetricsBuffer(flush_interval=3600)
+
+    for i in range(50):
+        _observe(buffer, "weather_pipeline", i / 10)
+    _observe(buffer, "gold_flow_task", 1.0)
+    assert pushes == []  # nothing on the call path
+
+    assert buffer.flush() == 2
+    assert sorted(pushes) == [("gold_flow_task", 1.0), ("weather_pipeline", 50.0)]
+    assert buffer.flush() == 0  # nothing changed since
+
+
+def test_failed_push_is_retried_on_next_flush(monkeypatch):
+    attempts = []
+
+    def flaky_push(url, job, registry):
+        attempts.append(job)
+        if len(attempts) == 1:
+            raise OSError("gateway down")
+
+    monkeypatch.setattr(metrics_buffer, "push_to_gateway", flaky_push)
+    buffer = MetricsBuffer(flush_interval=3600)
+    _observe(buffer, "weather_pipeline", 0.2)
+
+    assert buffer.flush() == 0
+    assert buffer.flush() == 1
+    assert attempts == ["weather_pipeline", "weather_pipeline"]
+
+
+def test_snapshot_replaces_the_previous_one(monkeypatch):
+    pushed = {}
+    monkeypatch.setattr(metrics_buffer, "push_to_gateway", lambda url, job, registry: pushed.update({job: registry}))
+    monkeypatch.setattr(pushgateway_utils, "get_metrics_buffer", lambda: buffer)
+    buffer = MetricsBuffer(flush_interval=3600)
+
+    def row(level, error_type):
+        return {"processing_level": level, "status": "failed", "completeness_ratio": 0.5, "retry_count": 1,
+                "is_acceptable": False, "error_type": error_type}
+
+    for _ in range(3):
+        push_processing_state_metrics("orchestrator_flow", [row("silver", "timeout"), row("gold", "timeout")],
+                                      pushgateway_url="gateway:9091")
+    push_processing_state_metrics("orchestrator_flow", [row("silver", "timeout")], pushgateway_url="gateway:9091")
+    buffer.flush()
+
+    registry = pushed["orchestrator_flow_processing_state"]
+    errors = {"flow_name": "orchestrator_flow", "error_type": "timeout"}
+    assert registry.get_sample_value("etl_processing_errors_total", {**errors, "processing_level": "silver"}) == 1.0
+    assert registry.get_sample_value("etl_processing_errors_total", {**errors, "processing_level": "gold"}) is None
+    assert registry.get_sample_value("etl_is_acceptable",
+                                     {"flow_name": "orchestrator_flow", "processing_level": "gold"}) is None
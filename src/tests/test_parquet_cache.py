@@ -0,0 +1,97 @@
+import os
+from io import BytesIO
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+import src.clients.parquet_cache as parquet_cache
+
+
+class _FakeFsClient:
+    """Blobs in a dict, counts downloads."""
+
+    def __init__(self):
+        self.blobs = {}
+        self.downloads = 0
+
+    def put(self, path, df, etag):
+        buffer = BytesIO()
+        df.to_parquet(buffer, index=False)
+        self.blobs[path] = (buffer.getvalue(), etag)
+
+    def get_file_client(self, path):
+        def download_file():
+            self.downloads += 1
+            content, etag = self.blobs[path]
+            return SimpleNamespace(readall=lambda: content, properties=SimpleNamespace(etag=etag))
+
+        return SimpleNamespace(download_file=download_file,
+                               get_file_properties=lambda: SimpleNamespace(etag=self.blobs[path][1]))
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(parquet_cache, "PARQUET_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(parquet_cache, "PARQUET_CACHE_ENABLED", True)
+    monkeypatch.setattr(parquet_cache, "_cached_bytes", None)
+    return tmp_path
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_warm_read_does_not_download(cache_dir, monkeypatch, mmap):
+    monkeypatch.setattr(parquet_cache, "PARQUET_CACHE_MMAP", mmap)
+    fs_client = _FakeFsClient()
+    df = pd.DataFrame({"place_name": ["Bansko", "Borovets"], "temp_avg": [1.5, -2.0]})
+    fs_client.put("gold/2026/01/05.parquet", df, etag="0x1")
+
+    first = parquet_cache.read_parquet_blob(fs_client, "gold/2026/01/05.parquet")
+    second = parquet_cache.read_parquet_blob(fs_client, "gold/2026/01/05.parquet")
+
+    pd.testing.assert_frame_equal(first, df)
+    pd.testing.assert_frame_equal(second, df)
+    assert fs_client.downloads == 1
+
+
+def test_new_etag_is_a_miss(cache_dir):
+    fs_client = _FakeFsClient()
+    fs_client.put("gold/2026/01/05.parquet", pd.DataFrame({"temp_avg": [1.0]}), etag="0x1")
+    parquet_cache.read_parquet_blob(fs_client, "gold/2026/01/05.parquet")
+
+    fs_client.put("gold/2026/01/05.parquet", pd.DataFrame({"temp_avg": [2.0]}), etag="0x2")
+    df = parquet_cache.read_parquet_blob(fs_client, "gold/2026/01/05.parquet")
+
+    assert df["temp_avg"].tolist() == [2.0]
+    assert fs_client.downloads == 2
+
+
+def test_least_recently_used_entries_are_evicted(cache_dir, monkeypatch):
+    fs_client = _FakeFsClient()
+    paths = [f"silver/2026/01/05/{hour}.parquet" for hour in range(4)]
+    for path in paths:
+        fs_client.put(path, pd.DataFrame({"temp_avg": [float(i) for i in range(50)]}), etag="0x1")
+    entry_size = len(fs_client.blobs[paths[0]][0])
+    monkeypatch.setattr(parquet_cache, "PARQUET_CACHE_MAX_BYTES", entry_size * 2)
+
+    for i, path in enumerate(paths[:2]):
+        parquet_cache.read_blob_bytes(fs_client, path)
+        os.utime(parquet_cache._entry_path(path, "0x1"), (i, i))
+    parquet_cache.read_blob_bytes(fs_client, paths[0])  # hit: hour 0 becomes the most recent
+    parquet_cache.read_blob_bytes(fs_client, paths[2])  # over budget: hour 1 goes
+
+    cached = {path for path in paths if os.path.exists(parquet_cache._entry_path(path, "0x1"))}
+    assert cached == {paths[0], paths[2]}
+
+
+def test_blob_replaced_before_the_download_is_cached_under_its_own_etag(cache_dir):
+    fs_client = _FakeFsClient()
+    fs_client.put("gold/2026/01/05.parquet", pd.DataFrame({"temp_avg": [2.0]}), etag="0x2")
+
+    # the etag was read before the blob was overwritten
+    stale = parquet_cache.read_parquet_blob(fs_client, "gold/2026/01/05.parquet", etag="0x1")
+    current = parquet_cache.read_parquet_blob(fs_client, "gold/2026/01/05.parquet", etag="0x2")
+    parquet_cache.read_parquet_blob(fs_client, "gold/2026/01/05.parquet", etag="0x1")
+
+    assert stale["temp_avg"].tolist() == current["temp_avg"].tolist() == [2.0]
+    # 0x2 was served from the cache, the new bytes were never filed under 0x1
+    assert fs_client.downloads == 2
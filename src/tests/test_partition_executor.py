@@ -0,0 +1,48 @@
+import contextvars
+import threading
+
+import pytest
+
+from src.helpers.gold.partition_executor import partition_workers, run_partitions
+
+_flow_run = contextvars.ContextVar("flow_run", default=None)
+
+
+def test_results_keep_partition_order_and_run_concurrently():
+    started = threading.Barrier(4, timeout=5)
+
+    def process(week):
+        started.wait()  # only passes when all four weeks are in flight at once
+        return week * 10
+
+    assert run_partitions(process, [4, 3, 2, 1], max_workers=4) == [40, 30, 20, 10]
+
+
+def test_partitions_see_the_callers_context():
+    _flow_run.set("run-1")
+    seen = run_partitions(lambda _: (_flow_run.get(), threading.current_thread().name), range(3),
+                          max_workers=3, thread_name_prefix="gold-weekly")
+
+    assert {run for run, _ in seen} == {"run-1"}
+    assert all(name.startswith("gold-weekly") for _, name in seen)
+
+
+def test_failing_partition_does_not_stop_the_others():
+    done = []
+
+    def process(month):
+        if month == 2:
+            raise RuntimeError("boom")
+        done.append(month)
+        return month
+
+    with pytest.raises(RuntimeError, match="boom"):
+        run_partitions(process, [1, 2, 3, 4], max_workers=2)
+    assert sorted(done) == [1, 3, 4]
+
+
+def test_worker_count_is_bounded():
+    assert partition_workers(52, max_workers=4) == 4
+    assert partition_workers(2, max_workers=8) == 2
+    assert partition_workers(0, max_workers=8) == 1
+    assert 1 <= partition_workers(52, max_workers=0) <= 52
@@ -0,0 +1,55 @@
+from types import SimpleNamespace
+
+import pendulum
+from azure.core.exceptions import ResourceNotFoundError
+
+import src.helpers.observability_helpers.state_helpers as state_helpers
+
+BASE = "MyLakehouse/Meteo/gold/daily-summ-forecast"
+
+
+class _ListingFsClient:
+    """get_paths over a fixed set of files, HEAD requests count as calls too."""
+
+    def __init__(self, files):
+        self.files = set(files)
+        self.calls = 0
+
+    def get_paths(self, path, recursive=True):
+        self.calls += 1
+        if not any(f.startswith(path) for f in self.files):
+            raise ResourceNotFoundError("missing prefix")
+        return [SimpleNamespace(name=f, is_directory=False) for f in self.files if f.startswith(path)]
+
+    def get_file_client(self, path):
+        def get_file_properties():
+            self.calls += 1
+            if path not in self.files:
+                raise ResourceNotFoundError(path)
+            return SimpleNamespace(etag="0x1")
+
+        return SimpleNamespace(get_file_properties=get_file_properties)
+
+
+def test_listing_matches_head_per_partition(monkeypatch):
+    monkeypatch.setattr(state_helpers, "config", lambda key: BASE)
+    days = [pendulum.datetime(2026, 1, 1).add(days=i) for i in range(40)]
+    fs_client = _ListingFsClient([f"{BASE}/2026/01/{d:02d}.parquet" for d in (1, 2, 5, 31)] +
+                                 [f"{BASE}/2026/02/03.parquet"])
+
+    listed = state_helpers._find_existing_blobs_listed(days, fs_client, "BASE_DIR_DAILY_SUMM_GOLD")
+    assert fs_client.calls == 1
+
+    per_partition = state_helpers._find_existing_blobs(days, fs_client, "BASE_DIR_DAILY_SUMM_GOLD")
+    assert listed == per_partition
+    assert [d.to_date_string() for d, s in listed.items() if s == "success"] == \
+           ["2026-01-01", "2026-01-02", "2026-01-05", "2026-01-31", "2026-02-03"]
+
+
+def test_missing_base_dir_means_all_missing(monkeypatch):
+    monkeypatch.setattr(state_helpers, "config", lambda key: BASE)
+    days = [pendulum.datetime(2026, 1, 1).add(days=i) for i in range(3)]
+
+    listed = state_helpers._find_existing_blobs_listed(days, _ListingFsClient([]), "BASE_DIR_DAILY_SUMM_GOLD")
+
+    assert set(listed.values()) == {"missing"}
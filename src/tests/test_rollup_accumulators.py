@@ -0,0 +1,31 @@
+import pandas as pd
+import pendulum
+
+from src.tests.test_rollup_engine import WEEK_START, _week
+from src.workers.gold.rollup_accumulators import accumulator_periods
+from src.workers.gold.rollup_engine import build_rollup_state, merge_rollup_states
+from src.workers.gold.transform_gold_data import get_weekly_summ_from_states_worker
+
+
+def test_accumulator_periods_of_a_day():
+    periods = {grain: (start.to_date_string(), label)
+               for grain, start, label in accumulator_periods(pendulum.datetime(2026, 1, 7))}
+
+    assert periods["weekly"] == ("2026-01-05", "week_2_2026")
+    assert periods["monthly"] == ("2026-01-01", "january_2026")
+    assert periods["seasonal"] == ("2025-12-01", "winter_2026")
+    assert periods["yearly"] == ("2026-01-01", "2026")
+
+
+def test_week_closed_from_accumulated_state_matches_daily_states():
+    day_states = [build_rollup_state(df) for _, df in _week()]
+    # what the accumulator row holds after the days were folded one at a time
+    accumulated = day_states[0]
+    for state in day_states[1:]:
+        accumulated = merge_rollup_states([accumulated, state])
+
+    from_days, _ = get_weekly_summ_from_states_worker(WEEK_START, day_states)
+    from_accumulator, _ = get_weekly_summ_from_states_worker(WEEK_START, [accumulated])
+
+    pd.testing.assert_frame_equal(from_days.drop(columns="generated_at"),
+                                  from_accumulator.drop(columns="generated_at"))
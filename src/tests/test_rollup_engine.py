@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+import pendulum
+
+from src.benchmarks.local_datalake import LocalFileSystemClient
+from src.workers.gold.rollup_engine import build_rollup_state, merge_rollup_states, finalize_rollup_state, \
+    ROLLUP_MEASURES, SUMMARY_COLUMNS, collect_rollup_states, read_rollup_states, upload_rollup_state
+from src.workers.gold.transform_gold_data import get_daily_summ_data_worker, get_weekly_summ_data_worker, \
+    get_weekly_summ_from_states_worker
+
+WEEK_START = pendulum.datetime(2026, 1, 5)
+
+
+def _hourly_gold_day(day: pendulum.DateTime, hours: int, seed: int) -> pd.DataFrame:
+    """Hourly gold rows of one day for two places, like get_df_data produces."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for place in ("Bansko", "Borovets"):
+        for hour in range(hours):
+            row = {"place_name": place, "forecast_date_utc": day.date(), "ingest_date": day.date(), "ingest_hour": hour}
+            for measure in ROLLUP_MEASURES:
+                low, high = sorted(rng.uniform(-10, 30, 2))
+                row[f"{measure}_min"] = low
+                row[f"{measure}_max"] = high
+                row[f"{measure}_avg"] = (low + high) / 2
+            rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def _week(hours_per_day=(24, 3, 24, 12, 1)):
+    return [(WEEK_START.add(days=i), _hourly_gold_day(WEEK_START.add(days=i), hours, seed=i))
+            for i, hours in enumerate(hours_per_day)]
+
+
+def test_weekly_average_is_exact_over_hourly_rows():
+    hourly_days = _week()
+    day_states = [build_rollup_state(df) for _, df in hourly_days]
+
+    weekly_df, state = get_weekly_summ_from_states_worker(WEEK_START, day_states)
+
+    all_rows = pd.concat([df for _, df in hourly_days], ignore_index=True)
+    expected = all_rows.groupby("place_name")["temp_avg"].mean().round(2)
+    assert weekly_df.set_index("place_name")["temp_avg"].to_dict() == expected.to_dict()
+    assert state["partitions"].tolist() == [5, 5]
+
+
+def test_min_max_match_groupby_engine():
+    hourly_days = _week()
+    daily_summ = get_daily_summ_data_worker(hourly_days)
+
+    groupby_df = get_weekly_summ_data_worker(WEEK_START, daily_summ).set_index("place_name")
+    states_df, _ = get_weekly_summ_from_states_worker(WEEK_START, [build_rollup_state(df) for _, df in daily_summ])
+    states_df = states_df.set_index("place_name")
+
+    # from summary rows (one observation per day) the states engine reproduces the groupby engine exactly
+    for col in SUMMARY_COLUMNS:
+        assert states_df[col].tolist() == groupby_df[col].tolist(), col
+
+
+def test_merge_is_associative():
+    day_states = [build_rollup_state(df) for _, df in _week()]
+
+    all_at_once = merge_rollup_states(day_states)
+    in_steps = merge_rollup_states([merge_rollup_states(day_states[:2]), merge_rollup_states(day_states[2:])])
+
+    pd.testing.assert_frame_equal(finalize_rollup_state(all_at_once), finalize_rollup_state(in_steps))
+    pd.testing.assert_frame_equal(all_at_once, in_steps)
+
+
+def test_stored_and_summary_children_are_not_mixed():
+    hourly_days = _week(hours_per_day=(24, 3, 24, 12))
+    daily_summ = get_daily_summ_data_worker(hourly_days)
+    stored = {ts: build_rollup_state(df) for ts, df in hourly_days[:2]}  # the other days only have a summary
+
+    states, exact = collect_rollup_states(stored, daily_summ[2:])
+    weekly_df = finalize_rollup_state(merge_rollup_states(states)).set_index("place_name")
+
+    # every day counts once, like the groupby engine - not 24 hourly rows against one summary row
+    expected = get_weekly_summ_data_worker(WEEK_START, daily_summ).set_index("place_name")
+    assert not exact
+    assert merge_rollup_states(states)["temp_count"].tolist() == [4, 4]
+    pd.testing.assert_series_equal(weekly_df["temp_avg"], expected["temp_avg"])
+
+
+def test_stored_children_are_exact():
+    hourly_days = _week(hours_per_day=(24, 3))
+    stored = {ts: build_rollup_state(df) for ts, df in hourly_days}
+
+    states, exact = collect_rollup_states(stored, [])
+
+    assert exact
+    assert merge_rollup_states(states)["temp_count"].tolist() == [27, 27]
+
+
+def test_summaries_are_only_needed_for_children_without_a_state(tmp_path):
+    lake = LocalFileSystemClient(tmp_path)
+    (day_0, hours_0), (day_1, _) = _week(hours_per_day=(24, 3))
+    upload_rollup_state(lake, "daily", day_0, build_rollup_state(hours_0))
+
+    stored, stateless = read_rollup_states(lake, "daily", [day_0, day_1])
+
+    assert list(stored) == [day_0] and stateless == [day_1]
+    assert stored[day_0]["temp_count"].tolist() == [24, 24]
@@ -0,0 +1,85 @@
+from datetime import date, timedelta
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import pendulum
+import pyarrow.parquet as pq
+import pytest
+
+import src.clients.parquet_cache as parquet_cache
+import src.workers.silver.load_transformed_data_to_azure as silver_writer
+from src.tests.test_parquet_cache import _FakeFsClient
+from src.workers.gold.extract_silver_data import fetch_silver_parquet_blob, GOLD_SILVER_COLUMNS
+from src.workers.gold.transform_silver_data import get_df_data
+
+SILVER_PATH = "silver/2026/01/05/10.parquet"
+DAY = date(2026, 1, 5)
+
+
+def _silver_hour(days=10, rows_per_day=100) -> pd.DataFrame:
+    """Silver hour file content: forecasts for the next `days` days, rows in API (not date) order."""
+    rng = np.random.default_rng(7)
+    n = days * rows_per_day
+    df = pd.DataFrame({
+        "api_name": rng.choice(["openweathermap", "weatherapi"], n),
+        "place_name": rng.choice(["Bansko", "Borovets"], n),
+        "ingest_date": DAY,
+        "ingest_hour": 10,
+        "forecast_date_utc": [DAY + timedelta(days=i % days) for i in range(n)],
+        "forecast_hour_utc": rng.integers(0, 24, n),
+        "weather_description": "clear sky",
+    })
+    for col in ["temp_max", "temp_min", "temp_avg", "wind_speed", "rain", "snow", "clouds", "humidity"]:
+        df[col] = rng.uniform(0, 30, n).round(2)
+    return df
+
+
+@pytest.fixture
+def fs_client(monkeypatch):
+    monkeypatch.setattr(parquet_cache, "PARQUET_CACHE_ENABLED", False)
+    monkeypatch.setattr(silver_writer, "SILVER_PARQUET_ROW_GROUP_SIZE", 100)
+    monkeypatch.setattr("src.workers.gold.extract_silver_data.config", lambda key: "silver")
+    client = _FakeFsClient()
+    client.blobs[SILVER_PATH] = (silver_writer.silver_parquet_bytes(_silver_hour()), "0x1")
+    return client
+
+
+def _fetch(fs_client, **pushdown):
+    return fetch_silver_parquet_blob("2026", "01", "05", "10", fs_client, **pushdown)
+
+
+def test_sorted_writer_makes_row_groups_selective(fs_client):
+    metadata = pq.ParquetFile(BytesIO(fs_client.blobs[SILVER_PATH][0])).metadata
+    date_col = metadata.schema.to_arrow_schema().get_field_index("forecast_date_utc")
+
+    ranges = [(metadata.row_group(i).column(date_col).statistics.min,
+               metadata.row_group(i).column(date_col).statistics.max) for i in range(metadata.num_row_groups)]
+    # each row group holds a single forecast day, so a day-range filter skips all the others
+    assert metadata.num_row_groups == 10
+    assert all(low == high for low, high in ranges)
+
+
+def test_pushdown_read_matches_full_read(fs_client):
+    full = _fetch(fs_client)
+    pushed = _fetch(fs_client, columns=GOLD_SILVER_COLUMNS, date_from=DAY, date_to=DAY + timedelta(days=5))
+
+    assert list(pushed.columns) == GOLD_SILVER_COLUMNS
+    assert len(pushed) == 600
+    expected = full[full["forecast_date_utc"].between(DAY, DAY + timedelta(days=5))][GOLD_SILVER_COLUMNS]
+    pd.testing.assert_frame_equal(pushed.reset_index(drop=True), expected.reset_index(drop=True))
+
+    ts = pendulum.datetime(2026, 1, 5, 10)
+    assert get_df_data([(ts, pushed)], ts)[0][1].equals(get_df_data([(ts, full)], ts)[0][1])
+
+
+def test_pushdown_falls_back_to_full_read(fs_client):
+    old_file = _silver_hour().drop(columns=["clouds"])  # written before the column existed
+    old_file["forecast_date_utc"] = old_file["forecast_date_utc"].astype(str)
+    buffer = BytesIO()
+    old_file.to_parquet(buffer)
+    fs_client.blobs[SILVER_PATH] = (buffer.getvalue(), "0x2")
+
+    df = _fetch(fs_client, columns=GOLD_SILVER_COLUMNS, date_from=DAY, date_to=DAY + timedelta(days=5))
+
+    assert len(df) == len(old_file)
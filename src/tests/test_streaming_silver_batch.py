@@ -0,0 +1,57 @@
+import asyncio
+
+import pandas as pd
+
+import src.workers.bronze.async_extraction_engine as engine
+from src.tests.test_columnar_parsers import PAYLOADS, _bronze_records
+from src.workers.silver.streaming_silver_batch import StreamingSilverBatch
+from src.workers.silver.transform_bronze_data import parse_records_columnar
+
+
+def _result(api_name, payload=None, error=None):
+    return {"api_name": api_name, "label": "Bansko", "api": None, "data": payload, "error": error}
+
+
+def test_streamed_batch_matches_the_hour_parse():
+    batch = StreamingSilverBatch("2026-01-05", "07")
+    positions = list(enumerate(PAYLOADS.items()))
+
+    # responses arrive in completion order, a failed call is skipped
+    for position, (api_name, payload) in reversed(positions):
+        batch.add(position, _result(api_name, payload))
+    batch.add(len(positions), _result("weatherapi", error="timeout"))
+
+    pd.testing.assert_frame_equal(batch.finish(), parse_records_columnar(_bronze_records()))
+
+
+def test_empty_batch_is_an_empty_frame():
+    batch = StreamingSilverBatch("2026-01-05", "07")
+    batch.add(0, _result("open_meteo", error="timeout"))
+
+    assert batch.finish().empty
+
+
+def test_engine_reports_each_result_as_it_completes(monkeypatch):
+    delays = {"Bansko": 0.2, "Borovets": 0.0, "Pamporovo": 0.1}
+
+    async def fake_worker(client, place):
+        await asyncio.sleep(delays[place])
+        return {"place": place}
+
+    async def fake_call(worker, client, *args, name=None):
+        return await worker(client, *args)
+
+    monkeypatch.setattr(engine, "api_workers", {"open_meteo": ("fake_api", fake_worker)})
+    monkeypatch.setattr(engine, "call_api_with_logging_async", fake_call)
+    reported = []
+
+    def on_result(position, result):
+        if result["label"] == "Pamporovo":
+            raise ValueError("callback bug")  # doesn't lose the result
+        reported.append((position, result["label"]))
+
+    locations = {"open_meteo": [(place, place) for place in delays]}
+    results = asyncio.run(engine.extract_all_api_data(locations, on_result=on_result))
+
+    assert reported == [(1, "Borovets"), (0, "Bansko")]
+    assert [r["data"]["place"] for r in results] == ["Bansko", "Borovets", "Pamporovo"]
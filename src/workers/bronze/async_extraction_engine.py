@@ -0,0 +1,103 @@
+import asyncio
+
+import httpx
+from decouple import config
+from requests import RequestException
+
+from src.clients.http_client import get_async_http_client, aclose_async_http_clients
+from src.helpers.bronze.extract_tasks_mapper import api_workers
+from src.helpers.bronze.task_exception_logger import call_api_with_logging_async
+from src.helpers.logging_helpers.combine_loggers_helper import get_logger
+
+MAX_CONCURRENCY = config("BRONZE_MAX_CONCURRENCY", default=16, cast=int)
+PER_API_CONCURRENCY = config("BRONZE_PER_API_CONCURRENCY", default=4, cast=int)
+API_RETRIES = config("BRONZE_API_RETRIES", default=3, cast=int)
+API_RETRY_DELAY_SECONDS = config("BRONZE_API_RETRY_DELAY_SECONDS", default=20, cast=int)
+
+
+async def _fetch_one(api_name, label, payload, global_limit, api_limit, retries, retry_delay_seconds):
+    """
+    Fetch one (API, location) pair under the global and per-API limits.
+
+    Retryable errors are retried here (the old per-pair Prefect task retries), the slot is released
+    while waiting so other requests keep going. Never raises - failures come back with "error" set.
+    """
+    logger = get_logger()
+    api, worker = api_workers[api_name]
+    call_args = (payload,) if isinstance(payload, str) else payload
+    result = {"api_name": api_name, "label": label, "api": api, "data": None, "error": None}
+    client = get_async_http_client(api_name)  # pooled per provider host, connections are reused across pairs
+
+    attempt = 0
+    while True:
+        try:
+            async with global_limit, api_limit:
+                result["data"] = await call_api_with_logging_async(worker, client, *call_args, name=label)
+            return result
+        except (httpx.HTTPError, RequestException) as e:
+            if attempt >= retries:
+                result["error"] = str(e) or type(e).__name__
+                return result
+        except Exception as e:
+            result["error"] = str(e) or type(e).__name__
+            return result
+
+        attempt += 1
+        logger.info(
+            "Retrying api=%s | target=%s | attempt=%s/%s in %ss",
+            api_name, label, attempt, retries, retry_delay_seconds,
+        )
+        await asyncio.sleep(retry_delay_seconds)
+
+
+async def _reported(position, job, on_result):
+    result = await job
+    try:
+        on_result(position, result)
+    except Exception as e:
+        # the callback is an optimisation, the result is still returned
+        get_logger().warning(f"on_result failed for {result['api_name']} - {result['label']} | error={e}")
+    return result
+
+
+async def extract_all_api_data(api_locations: dict,
+                               max_concurrency: int = MAX_CONCURRENCY,
+                               per_api_concurrency: dict[str, int] | None = None,
+                               retries: int = API_RETRIES,
+                               retry_delay_seconds: int = API_RETRY_DELAY_SECONDS,
+                               on_result=None) -> list[dict]:
+    """
+    Fire every (API, location) request from api_locations at once and wait for all of them.
+
+    max_concurrency caps in-flight requests overall, per_api_concurrency caps them per API
+    (APIs not in the dict get BRONZE_PER_API_CONCURRENCY). Results keep the api_locations order:
+    [{"api_name", "label", "api", "data", "error"}, ...]
+
+    on_result(position, result) is called as each request completes (position in that order),
+    on the event loop - it must hand the result over, not process it.
+    """
+    logger = get_logger()
+    per_api_concurrency = per_api_concurrency or {}
+
+    global_limit = asyncio.Semaphore(max_concurrency)
+    api_limits = {
+        api_name: asyncio.Semaphore(per_api_concurrency.get(api_name, PER_API_CONCURRENCY))
+        for api_name in api_locations
+    }
+
+    jobs = [
+        _fetch_one(api_name, label, payload, global_limit, api_limits[api_name], retries, retry_delay_seconds)
+        for api_name, locations in api_locations.items()
+        for label, payload in locations
+    ]
+    if on_result is not None:
+        jobs = [_reported(position, job, on_result) for position, job in enumerate(jobs)]
+    logger.info(f"Starting {len(jobs)} API requests | max_concurrency={max_concurrency}")
+    try:
+        results = await asyncio.gather(*jobs)
+    finally:
+        await aclose_async_http_clients()
+
+    failed = sum(1 for r in results if r["error"])
+    logger.info(f"Finished {len(results)} API requests | succeeded={len(results) - failed} | failed={failed}")
+    return results
@@ -1,34 +1,46 @@
-import requests
+import asyncio
+
+import httpx
 from decouple import config
 
+from src.helpers.bronze.get_accuweather_location_id import get_accuweather_location_id_from_place_name
+from src.helpers.bronze.get_foreca_location_id import get_foreca_location_id_from_place_name
 from src.helpers.bronze.get_meteoblue_location import get_lat_lon_from_place_name
 from src.helpers.bronze.get_openweathermap_location import get_owm_lat_lon_from_place_name_iso_country_code
+from src.helpers.bronze.json_codec import loads
 from src.helpers.logging_helpers.combine_loggers_helper import get_logger
 
+# Workers are coroutines driven by the async extraction engine, each gets the pooled client of its provider
+# from src.clients.http_client.
+# Location lookups are still blocking, so they run in a worker thread to keep the event loop free.
 
 
-
-def extract_data_from_foreca_api(location_id: int):
+async def extract_data_from_foreca_api(client: httpx.AsyncClient, place_name: str):
     logger = get_logger()
-    url = f"https://pfa.foreca.com/api/v1/forecast/daily/{location_id}?lang=en&token={config("FORECA_API_KEY")}"
-    response = requests.get(url)
-    return response.json()
+    location_id = await asyncio.to_thread(get_foreca_location_id_from_place_name, place_name)
+    url = f"/api/v1/forecast/daily/{location_id}"
+    params = {"lang": "en", "token": config("FORECA_API_KEY")}
+    response = await client.get(url, params=params)
+    return loads(response.content)
 
 
-def extract_data_from_accuweather_api(location_key: int):
+async def extract_data_from_accuweather_api(client: httpx.AsyncClient, place_name: str):
     logger = get_logger()
-    url = f"https://dataservice.accuweather.com/forecasts/v1/daily/5day/{location_key}?metric=true"
+    location_key = await asyncio.to_thread(get_accuweather_location_id_from_place_name, place_name)
+    url = f"/forecasts/v1/daily/5day/{location_key}"
+    params = {"metric": "true"}
     headers = {"Authorization": f"Bearer {config('ACCUWEATHER_API_KEY')}"}
-    response = requests.get(url, headers=headers)
-    return response.json()
+    response = await client.get(url, params=params, headers=headers)
+    return loads(response.content)
 
 
-def get_from_meteoblue_api(place_name, country):
+async def get_from_meteoblue_api(client: httpx.AsyncClient, place_name, country):
     logger = get_logger()
-    lat, lon = get_lat_lon_from_place_name(place_name, country)
-    url = f"https://my.meteoblue.com/packages/basic-day?lat={lat}&lon={lon}&forecast_days=5&apikey={config('METEOBLUE_API_KEY')}"
-    response = requests.get(url)
-    return response.json()
+    lat, lon = await asyncio.to_thread(get_lat_lon_from_place_name, place_name, country)
+    url = "/packages/basic-day"
+    params = {"lat": lat, "lon": lon, "forecast_days": 5, "apikey": config("METEOBLUE_API_KEY")}
+    response = await client.get(url, params=params)
+    return loads(response.content)
 
 
 # def extract_from_weatherbit_api(postal_code, iso_country_code):
@@ -65,36 +77,39 @@ def get_from_meteoblue_api(place_name, country):
 #         return None
 
 
-def extract_data_from_tomorrow_api(place_name):
+async def extract_data_from_tomorrow_api(client: httpx.AsyncClient, place_name):
     logger = get_logger()
-    url = f"https://api.tomorrow.io/v4/weather/forecast?location={place_name}&timesteps=1d&units=metric&apikey={config('TOMMOROW_API_KEY')}"
-
-    headers = {
-        "accept": "application/json",
-        "accept-encoding": "deflate, gzip, br"
-    }
-
-    response = requests.get(url, headers=headers)
-    return response.json()
+    url = "/v4/weather/forecast"
+    params = {"location": place_name, "timesteps": "1d", "units": "metric", "apikey": config("TOMMOROW_API_KEY")}
+    response = await client.get(url, params=params)  # accept-encoding (gzip, br) is set by the pooled client
+    return loads(response.content)
 
 
-def extract_data_from_openweathermap_api(place_name, iso_country_code):
+async def extract_data_from_openweathermap_api(client: httpx.AsyncClient, place_name, iso_country_code):
     logger = get_logger()
-    lat, lon = get_owm_lat_lon_from_place_name_iso_country_code(place_name, iso_country_code)
-    url = f"https://api.openweathermap.org/data/2.5/forecast?lat={lat}&lon={lon}&exclude=current,minutely,daily,alerts&units=metric&lang=en&appid={config('OPENWEATHERMAP_API_KEY')}"
-    response = requests.get(url)
-    return response.json()
+    lat, lon = await asyncio.to_thread(get_owm_lat_lon_from_place_name_iso_country_code, place_name, iso_country_code)
+    url = "/data/2.5/forecast"
+    params = {"lat": lat, "lon": lon, "exclude": "current,minutely,daily,alerts", "units": "metric", "lang": "en",
+              "appid": config("OPENWEATHERMAP_API_KEY")}
+    response = await client.get(url, params=params)
+    return loads(response.content)
 
 
-def extract_data_from_weatherapi_api(lat, lon):
+async def extract_data_from_weatherapi_api(client: httpx.AsyncClient, lat, lon):
     logger = get_logger()
-    url = f"http://api.weatherapi.com/v1/forecast.json?key={config('WEATHERAPI_API_KEY')}&q={lat},{lon}&days=7&aqi=no&alerts=no&pollen=no&tides=no"
-    response = requests.get(url)
-    return response.json()
+    url = "/v1/forecast.json"
+    params = {"key": config("WEATHERAPI_API_KEY"), "q": f"{lat},{lon}", "days": 7, "aqi": "no", "alerts": "no",
+              "pollen": "no", "tides": "no"}
+    response = await client.get(url, params=params)
+    return loads(response.content)
 
 
-def extract_data_from_open_meteo_api(lat, lon):
+async def extract_data_from_open_meteo_api(client: httpx.AsyncClient, lat, lon):
     logger = get_logger()
-    url = f"https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}&daily=temperature_2m_max,temperature_2m_min,precipitation_sum,rain_sum,windspeed_10m_max,cloudcover_mean,weathercode&forecast_days=7&timezone=UTC"
-    response = requests.get(url)
-    return response.json()
+    url = "/v1/forecast"
+    params = {"latitude": lat, "longitude": lon,
+              "daily": "temperature_2m_max,temperature_2m_min,precipitation_sum,rain_sum,windspeed_10m_max,"
+                       "cloudcover_mean,weathercode",
+              "forecast_days": 7, "timezone": "UTC"}
+    response = await client.get(url, params=params)
+    return loads(response.content)
@@ -1,10 +1,14 @@
 import io
-import json
 
+import pyarrow as pa
 from azure.core.exceptions import ResourceExistsError
 
+from src.helpers.bronze.bronze_layout import bronze_bundle_dir
+from src.helpers.bronze.json_codec import dumps, dumps_str
+from src.helpers.lazy_imports import lazy_module
 from src.helpers.logging_helpers.combine_loggers_helper import get_logger
 
+pq = lazy_module("pyarrow.parquet")  # only the bundle layout writes Parquet
 
 
 def upload_json(fs_client, base_dir, folder_name, file_name, data):
@@ -46,7 +50,7 @@ def upload_json(fs_client, base_dir, folder_name, file_name, data):
         }
 
     # 4️⃣ Upload file
-    json_bytes = json.dumps(data).encode("utf-8")
+    json_bytes = dumps(data)
     json_stream = io.BytesIO(json_bytes)
 
     file_client.create_file()
@@ -70,3 +74,63 @@ def upload_json(fs_client, base_dir, folder_name, file_name, data):
         "path": f"{directory_path}/{file_name}",
         "reason": "created"
     }
+
+
+def build_bronze_bundle(date_str, hour_str, records) -> bytes:
+    """
+    One zstd Parquet for the whole ingest hour: source/place_name/ingest_date/ingest_hour metadata
+    plus the raw provider JSON in the payload column.
+    records: [{"api_name": "accuweather", "label": "Bansko", "data": {...}}, ...]
+    """
+    table = pa.table({
+        "source": pa.array([r["api_name"] for r in records], pa.string()),
+        "place_name": pa.array([r["label"] for r in records], pa.string()),
+        "ingest_date": pa.array([date_str] * len(records), pa.string()),
+        "ingest_hour": pa.array([int(hour_str)] * len(records), pa.int16()),
+        "payload": pa.array([dumps_str(r["data"]) for r in records], pa.large_string()),
+    })
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer, compression="zstd")
+    return buffer.getvalue()
+
+
+def upload_bronze_bundle(fs_client, base_dir, date_str, hour_str, records):
+    """
+    Upload all payloads of one ingest hour as a single object.
+    Skips upload if the bundle already exists, same as upload_json.
+    """
+    logger = get_logger()
+    directory_path = bronze_bundle_dir(base_dir, date_str)
+    file_name = f"{hour_str}.parquet"
+    directory_client = fs_client.get_directory_client(directory_path)
+
+    try:
+        directory_client.create_directory()
+    except ResourceExistsError:
+        logger.debug("Directory %s already exists", directory_path, extra={"adls_directory_path": directory_path})
+
+    file_client = directory_client.get_file_client(file_name)
+    if file_client.exists():
+        logger.info("Upload to Azure skipped: bundle %s already exists", file_name,
+                    extra={"path": f"{directory_path}/{file_name}", "reason": "already_exists", "uploaded": False})
+        return {"uploaded": False, "path": f"{directory_path}/{file_name}", "reason": "already_exists"}
+
+    bundle_bytes = build_bronze_bundle(date_str, hour_str, records)
+    file_client.create_file()
+    file_client.append_data(data=bundle_bytes, offset=0, length=len(bundle_bytes))
+    file_client.flush_data(len(bundle_bytes))
+
+    logger.info(
+        "Upload completed: Azure bronze bundle, file=%s, folder=%s, records=%s",
+        file_name,
+        directory_path,
+        len(records),
+        extra={
+            "storage": "azure_blob",
+            "path": f"{directory_path}/{file_name}",
+            "result": "created",
+            "uploaded": True,
+            "records": len(records),
+        }
+    )
+    return {"uploaded": True, "path": f"{directory_path}/{file_name}", "reason": "created"}
@@ -1,8 +1,5 @@
-from datetime import datetime, timezone
-
-import psycopg
-from decouple import config
-from psycopg.types.json import Json
+from src.clients.postgres_client import get_pg_pool
+from src.helpers.bronze.json_codec import dumps_str
 from src.helpers.logging_helpers.combine_loggers_helper import get_logger
 
 
@@ -126,123 +123,88 @@ from src.helpers.logging_helpers.combine_loggers_helper import get_logger
 
 
 
-def load_raw_api_data_to_postgres(data, label, now):
+def _log_db_diagnostics(cur, ingest_date, ingest_hour, stage: str):
+    """Debug only - connection info and current hour row count, one round trip each."""
     logger = get_logger()
+    cur.execute("""
+        SELECT
+            txid_current(),
+            pg_backend_pid(),
+            current_database(),
+            current_schema(),
+            current_user,
+            current_setting('search_path'),
+            inet_server_addr(),
+            inet_server_port()
+    """)
+    logger.info(f"DB INFO ({stage}): {cur.fetchone()}")
+
+    cur.execute("""
+        SELECT COUNT(*)
+        FROM raw_json_weather_api_data
+        WHERE ingest_date=%s
+          AND ingest_hour=%s
+    """, (ingest_date, ingest_hour))
+    logger.info(f"Current hour rows ({stage}) = {cur.fetchone()[0]}")
+
+
+def load_raw_api_data_batch_to_postgres(records: list[dict], now, debug: bool = False) -> list[dict]:
+    """
+    Load every payload of one bronze run in a single transaction with one multi-row insert.
+
+    records: [{"api": "accuweather_api", "label": "Bansko", "data": {...}}, ...]
+    Returns per record status: [{"source", "place_name", "status": "inserted" | "skipped"}, ...]
+    "skipped" means the (source, place_name, ingest_date, ingest_hour) row was already there.
+    """
+    logger = get_logger()
+    if not records:
+        logger.info("No bronze payloads to load to Postgres")
+        return []
 
-    # username = config("DB_USER")
-    # password = config("DB_PASSWORD")
-    # host = config("DB_HOST")
-    # port = config("DB_PORT")
-    # database = config("DB_NAME_FOR_RAW_WEATHER_API_DATA")
-
-    connection_string = config("DB_CONN_RAW")
+    ingest_date = now.date()
+    ingest_hour = now.hour
 
-    source = data["api"]
-    place_name = label
-    data_to_insert = data["data"]
+    sources = [r["api"] for r in records]
+    place_names = [r["label"] for r in records]
+    payloads = [dumps_str(r["data"]) for r in records]
 
-    ingest_date = now
-    ingest_hour = ingest_date.hour
-    logger.info(connection_string.split("@")[1])
     try:
-        with psycopg.connect(connection_string) as conn:
+        with get_pg_pool().connection() as conn:
             with conn.cursor() as cur:
+                if debug:
+                    _log_db_diagnostics(cur, ingest_date, ingest_hour, "before insert")
 
-                # ----- DB INFO -----
-                cur.execute("""
-                    SELECT
-                        txid_current(),
-                        pg_backend_pid(),
-                        current_database(),
-                        current_schema(),
-                        current_user,
-                        current_setting('search_path'),
-                        inet_server_addr(),
-                        inet_server_port()
-                """)
-                logger.info(f"DB INFO: {cur.fetchone()}")
-
-                logger.info(
-                    f"INSERT VALUES -> "
-                    f"source={source}, "
-                    f"place={place_name}, "
-                    f"ingest_date={ingest_date}, "
-                    f"ingest_hour={ingest_hour}"
-                )
-
-                # ----- Exact match -----
-                cur.execute("""
-                    SELECT COUNT(*)
-                    FROM raw_json_weather_api_data
-                    WHERE source=%s
-                      AND place_name=%s
-                      AND ingest_date=%s
-                      AND ingest_hour=%s
-                """, (
-                    source,
-                    place_name,
-                    ingest_date,
-                    ingest_hour
-                ))
-
-                logger.info(f"Exact match before insert = {cur.fetchone()[0]}")
-
-                # ----- Current hour -----
-                cur.execute("""
-                    SELECT COUNT(*)
-                    FROM raw_json_weather_api_data
-                    WHERE source=%s
-                      AND place_name=%s
-                      AND ingest_hour=%s
-                """, (
-                    source,
-                    place_name,
-                    ingest_hour
-                ))
-
-                logger.info(f"Current hour rows = {cur.fetchone()[0]}")
-
-                # ----- Insert -----
                 cur.execute("""
                     INSERT INTO raw_json_weather_api_data
                     (source, place_name, payload, ingest_date, ingest_hour)
-                    VALUES (%s,%s,%s,%s,%s)
+                    SELECT t.source, t.place_name, t.payload::jsonb, %s::date, %s::int
+                    FROM unnest(%s::text[], %s::text[], %s::text[]) AS t(source, place_name, payload)
                     ON CONFLICT (source, place_name, ingest_date, ingest_hour)
                     DO NOTHING
-                """, (
-                    source,
-                    place_name,
-                    Json(data_to_insert),
-                    ingest_date,
-                    ingest_hour
-                ))
-
-                logger.info(f"ROWCOUNT = {cur.rowcount}")
+                    RETURNING source, place_name
+                """, (ingest_date, ingest_hour, sources, place_names, payloads))
+                inserted = set(cur.fetchall())
 
-                inserted_rows = cur.rowcount
-
-                # ----- After insert -----
-                cur.execute("""
-                    SELECT COUNT(*)
-                    FROM raw_json_weather_api_data
-                    WHERE source=%s
-                      AND place_name=%s
-                      AND ingest_hour=%s
-                """, (
-                    source,
-                    place_name,
-                    ingest_hour
-                ))
-
-                logger.info(f"After insert rows = {cur.fetchone()[0]}")
-
-        if inserted_rows == 0:
-            logger.warning("INSERT SKIPPED")
-        else:
-            logger.info("INSERT SUCCESS")
-
-        return inserted_rows
+                if debug:
+                    _log_db_diagnostics(cur, ingest_date, ingest_hour, "after insert")
 
     except Exception:
-        logger.exception("Postgres insert failed")
-        raise
\ No newline at end of file
+        logger.exception("Postgres batch insert failed")
+        raise
+
+    statuses = [
+        {
+            "source": source,
+            "place_name": place_name,
+            "status": "inserted" if (source, place_name) in inserted else "skipped",
+        }
+        for source, place_name in zip(sources, place_names)
+    ]
+    skipped = [s for s in statuses if s["status"] == "skipped"]
+    logger.info(
+        f"Bronze batch loaded to Postgres | records={len(records)} | "
+        f"inserted={len(records) - len(skipped)} | skipped={len(skipped)}"
+    )
+    for s in skipped:
+        logger.warning(f"INSERT SKIPPED | source={s['source']} | place={s['place_name']}")
+    return statuses
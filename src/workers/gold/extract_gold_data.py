@@ -1,10 +1,9 @@
-from io import BytesIO
-
 import pandas as pd
 import pendulum
 from azure.core.exceptions import ResourceNotFoundError
 from decouple import config
 
+from src.clients.parquet_cache import read_parquet_blob
 from src.helpers.logging_helpers.combine_loggers_helper import get_logger
 
 
@@ -24,18 +23,17 @@ def get_hourly_blobs_for_day(year, month, day, fs_client) -> pd.DataFrame:
         raise RuntimeError(
             f"Partition exists but contains no files: {day_path}"
         )
-    files = [path.name for path in paths if not path.is_directory and path.name.endswith(".parquet")]
-    files = sorted(files)
+    files = [path for path in paths if not path.is_directory and path.name.endswith(".parquet")]
+    files = sorted(files, key=lambda path: path.name)
 
     dfs = []
     for file in files:
         try:  # just safety check if file is deleted between listing and fetching
-            file_client = fs_client.get_file_client(file)
-            downloaded_bytes = file_client.download_file().readall()
+            # etag from the listing, a cached hour costs no request at all
+            curr_df = read_parquet_blob(fs_client, file.name, etag=file.etag)
         except ResourceNotFoundError:
-            raise FileNotFoundError(f"Parquet file not found: {file}")
+            raise FileNotFoundError(f"Parquet file not found: {file.name}")
 
-        curr_df = pd.read_parquet(BytesIO(downloaded_bytes))
         dfs.append(curr_df)
 
     df = pd.concat(dfs, ignore_index=True)
@@ -77,9 +75,7 @@ def get_daily_blobs_for_week(week_dates: list[pendulum.DateTime], fs_client, ) -
         day = current_ts.format("DD")
         file_path = f"{config('BASE_DIR_DAILY_SUMM_GOLD')}/{year}/{month}/{day}.parquet"
         try:
-            file_client = fs_client.get_file_client(file_path)
-            downloaded_bytes = file_client.download_file().readall()
-            df = pd.read_parquet(BytesIO(downloaded_bytes))
+            df = read_parquet_blob(fs_client, file_path)
 
             if df.empty:
                 logger.warning(f"Empty parquet for {year}-{month}-{day}, treating as missing")
@@ -152,9 +148,7 @@ def get_monthly_blob_for_year(month, fs_client) -> pd.DataFrame:
     file_path = f"{config('BASE_DIR_MONTHLY_SUMM_GOLD')}/{year}/{path_month}.parquet"
 
     try:
-        file_client = fs_client.get_file_client(file_path)
-        downloaded_bytes = file_client.download_file().readall()
-        df = pd.read_parquet(BytesIO(downloaded_bytes))
+        df = read_parquet_blob(fs_client, file_path)
 
         if df.empty:
             logger.warning(f"Empty parquet for {year}-{month}, treating as missing")
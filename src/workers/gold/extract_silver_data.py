@@ -1,21 +1,55 @@
 import uuid
-from io import BytesIO
+from datetime import date
 
 import pandas as pd
+import pyarrow as pa
 from decouple import config
 
+from src.clients.parquet_cache import read_parquet_blob
+from src.helpers.lazy_imports import lazy_module
+from src.helpers.logging_helpers.combine_loggers_helper import get_logger
 
-def fetch_silver_parquet_blob(year, month, day, hour, fs_client):
-    dir_path = f"{config('BASE_DIR_SILVER')}/{year}/{month}/{day}"
-    file_client = fs_client.get_directory_client(dir_path).get_file_client(f"{hour}.parquet")
+
+# only silver_frame_from_memory (pipelined orchestrator run) needs them
+ds = lazy_module("pyarrow.dataset")
+pq = lazy_module("pyarrow.parquet")
+
+# read only what get_df_data / get_fdf_data aggregate instead of the whole silver hour
+GOLD_SILVER_PUSHDOWN = config("GOLD_SILVER_PUSHDOWN", default=True, cast=bool)
+GOLD_SILVER_COLUMNS = [
+    "place_name", "forecast_date_utc", "ingest_date", "ingest_hour",
+    "temp_max", "temp_min", "temp_avg", "wind_speed", "rain", "snow", "clouds", "humidity",
+]
+# forecast days gold needs from an hour: the day itself (daily) up to day + 5 (five day forecast)
+GOLD_SILVER_DATE_WINDOW_DAYS = 5
+
+
+def silver_date_filters(date_from: date, date_to: date) -> list[tuple]:
+    return [("forecast_date_utc", ">=", date_from), ("forecast_date_utc", "<=", date_to)]
+
+
+def fetch_silver_parquet_blob(year, month, day, hour, fs_client, columns: list[str] = None,
+                              date_from: date = None, date_to: date = None):
+    """
+    Silver hour file as a dataframe. With columns and/or a forecast date range only those columns
+    and the row groups that can hold those dates are read. Files written before the silver writer
+    sorted by forecast date (or with other column types) fall back to a full read.
+    """
+    logger = get_logger()
+    file_path = f"{config('BASE_DIR_SILVER')}/{year}/{month}/{day}/{hour}.parquet"
+    filters = silver_date_filters(date_from, date_to) if date_from and date_to else None
 
     try:
-        downloaded_bytes = file_client.download_file().readall()
+        try:
+            df = read_parquet_blob(fs_client, file_path, columns=columns, filters=filters)
+        except (pa.ArrowException, KeyError, TypeError) as e:
+            if columns is None and filters is None:
+                raise
+            logger.warning(f"Pushdown read failed for silver {year}-{month}-{day}-{hour}, full read | error={e}")
+            df = read_parquet_blob(fs_client, file_path)
     except FileNotFoundError:
         raise FileNotFoundError(f"Parquet file not found: {year}-{month}-{day}-{hour}")
 
-    df = pd.read_parquet(BytesIO(downloaded_bytes))
-
     # sanitize UUIDs
     import uuid
     for col in df.columns:
@@ -25,6 +59,27 @@ def fetch_silver_parquet_blob(year, month, day, hour, fs_client):
     return df
 
 
+def silver_frame_from_memory(df: pd.DataFrame, columns: list[str] = None,
+                             date_from: date = None, date_to: date = None) -> pd.DataFrame:
+    """
+    Silver hour handed over by the silver flow in the same run, with the projection/filter
+    fetch_silver_parquet_blob would push down to the file. Goes through Arrow like the Parquet
+    read, so gold gets the same columns and dtypes (and its own copy of the data).
+    """
+    logger = get_logger()
+    filters = silver_date_filters(date_from, date_to) if date_from and date_to else None
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    try:
+        if columns is not None or filters is not None:
+            table = ds.dataset(table).to_table(
+                columns=columns,
+                filter=pq.filters_to_expression(filters) if filters else None,
+            )
+    except (pa.ArrowException, KeyError, TypeError) as e:
+        logger.warning(f"Pushdown on in-memory silver hour failed, using all of it | error={e}")
+    return table.to_pandas()
+
+
 def fetch_silver_data_postgres(date, hour_int, engine, chunksize=100_000):
     """
     Fetch silver data from Postgres in chunks, sanitize UUIDs.
@@ -0,0 +1,169 @@
+import math
+
+import pandas as pd
+import pendulum
+from decouple import config
+
+from src.clients.postgres_client import get_pg_pool
+from src.helpers.logging_helpers.combine_loggers_helper import get_logger
+from src.helpers.observability_helpers.pipeline_config import GRAIN_LABEL_MAP
+from src.workers.gold.rollup_engine import ROLLUP_KEYS, ROLLUP_MEASURES
+
+"""
+Incremental gold rollups: open week/month/season/year accumulators in Postgres (gold_rollup_accumulator).
+
+When a daily partition lands, its rollup state is folded into the accumulator row of every period
+the day belongs to (sums/counts added, min of mins, max of maxes, partitions + 1), one upsert of
+all periods and places. folded_dates records the folded days, so folding the same day twice is a no-op.
+
+Closing a period is reading its rows back as a merged state (load_rollup_accumulator) and finalizing
+them like any other state, instead of re-reading and regrouping all daily partitions. The view
+gold_rollup_current exposes the running averages of the open periods between two closes.
+"""
+
+# fold daily states into the Postgres accumulators and close weekly/monthly periods from them
+GOLD_ROLLUP_ACCUMULATORS = config("GOLD_ROLLUP_ACCUMULATORS", default=True, cast=bool)
+
+ACCUMULATOR_TABLE = "gold_rollup_accumulator"
+ACCUMULATOR_STATE_COLUMNS = [f"{measure}_{stat}" for measure in ROLLUP_MEASURES for stat in ("sum", "count", "min", "max")]
+
+
+def _fold_set_clause(column: str) -> str:
+    if column.endswith("_min"):
+        return f"{column} = LEAST(acc.{column}, EXCLUDED.{column})"
+    if column.endswith("_max"):
+        return f"{column} = GREATEST(acc.{column}, EXCLUDED.{column})"
+    return f"{column} = acc.{column} + EXCLUDED.{column}"
+
+
+def _state_array_type(column: str) -> str:
+    return "bigint[]" if column.endswith("_count") else "float8[]"
+
+
+# one statement per day: every (period, place) row arrives as one array element, like the bronze batch insert.
+# LEAST/GREATEST ignore NULLs, so a day without a measure keeps the running min/max
+_FOLD_SQL = f"""
+    INSERT INTO {ACCUMULATOR_TABLE} AS acc (
+        grain, period_start, period_label, place_name, partitions,
+        {", ".join(ACCUMULATOR_STATE_COLUMNS)},
+        folded_dates, is_closed, updated_at
+    )
+    SELECT t.grain, t.period_start, t.period_label, t.place_name, 1,
+           {", ".join(f"t.{col}" for col in ACCUMULATOR_STATE_COLUMNS)},
+           ARRAY[%s::date], FALSE, NOW()
+    FROM unnest(
+        %s::text[], %s::date[], %s::text[], %s::text[],
+        {", ".join(f"%s::{_state_array_type(col)}" for col in ACCUMULATOR_STATE_COLUMNS)}
+    ) AS t(grain, period_start, period_label, place_name, {", ".join(ACCUMULATOR_STATE_COLUMNS)})
+    ON CONFLICT (grain, period_start, place_name) DO UPDATE SET
+        partitions = acc.partitions + EXCLUDED.partitions,
+        {", ".join(_fold_set_clause(col) for col in ACCUMULATOR_STATE_COLUMNS)},
+        folded_dates = acc.folded_dates || EXCLUDED.folded_dates,
+        is_closed = FALSE,
+        updated_at = NOW()
+    WHERE NOT (EXCLUDED.folded_dates <@ acc.folded_dates)
+    RETURNING grain, place_name
+"""
+
+_LOAD_SQL = f"""
+    SELECT place_name, partitions, {", ".join(ACCUMULATOR_STATE_COLUMNS)}, folded_dates
+    FROM {ACCUMULATOR_TABLE}
+    WHERE grain = %s AND period_start = %s
+    ORDER BY place_name
+"""
+
+_CLOSE_SQL = f"""
+    UPDATE {ACCUMULATOR_TABLE}
+    SET is_closed = TRUE, updated_at = NOW()
+    WHERE grain = %s AND period_start = %s
+"""
+
+
+def accumulator_periods(day: pendulum.DateTime) -> list[tuple[str, pendulum.DateTime, str]]:
+    """(grain, period_start, period_label) of every period a day is folded into."""
+    week_start = day.start_of("week")
+    month_start = day.start_of("month")
+    season_start = month_start.subtract(months=day.month % 3)  # Dec -> Dec, Jan -> Dec, Feb -> Dec, Mar -> Mar ...
+    year_start = day.start_of("year")
+    return [
+        ("weekly", week_start, GRAIN_LABEL_MAP["week"](week_start)),
+        ("monthly", month_start, GRAIN_LABEL_MAP["month"](month_start)),
+        ("seasonal", season_start, GRAIN_LABEL_MAP["season"](season_start)),
+        ("yearly", year_start, str(year_start.year)),
+    ]
+
+
+def _state_value(column: str, value):
+    if column.endswith("_count"):
+        return int(value)
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        # no observation: 0 for a sum, NULL for min/max
+        return 0.0 if column.endswith("_sum") else None
+    return float(value)
+
+
+def fold_daily_state(day: pendulum.DateTime, state: pd.DataFrame, pool=None) -> dict:
+    """
+    Fold the rollup state of one day into its weekly/monthly/seasonal/yearly accumulators.
+    Returns {"folded": rows updated or inserted, "skipped": rows that already had the day}.
+    """
+    if state is None or state.empty:
+        return {"folded": 0, "skipped": 0}
+
+    pool = pool or get_pg_pool()
+
+    place_rows = [
+        (row["place_name"], [_state_value(col, row[col]) for col in ACCUMULATOR_STATE_COLUMNS])
+        for row in state[ROLLUP_KEYS + ACCUMULATOR_STATE_COLUMNS].to_dict("records")
+    ]
+    rows = [(grain, period_start.date(), label, place_name, values)
+            for grain, period_start, label in accumulator_periods(day)
+            for place_name, values in place_rows]
+
+    grains, period_starts, labels, place_names, values = zip(*rows)
+    state_columns = [list(column) for column in zip(*values)]
+
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(_FOLD_SQL, (day.date(), list(grains), list(period_starts), list(labels), list(place_names),
+                                    *state_columns))
+            folded = len(cur.fetchall())
+
+    return {"folded": folded, "skipped": len(rows) - folded}
+
+
+def load_rollup_accumulator(grain: str, period_start: pendulum.DateTime, pool=None):
+    """
+    Accumulated state of a period, same columns as merge_rollup_states, and the sorted folded days.
+    Returns None when nothing has been folded into the period yet.
+    """
+    pool = pool or get_pg_pool()
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(_LOAD_SQL, (grain, period_start.date()))
+            rows = cur.fetchall()
+
+    if not rows:
+        return None
+
+    columns = ROLLUP_KEYS + ["partitions"] + ACCUMULATOR_STATE_COLUMNS
+    state = pd.DataFrame([row[:-1] for row in rows], columns=columns)
+    state[ACCUMULATOR_STATE_COLUMNS] = state[ACCUMULATOR_STATE_COLUMNS].astype(float)
+    state[[col for col in ACCUMULATOR_STATE_COLUMNS if col.endswith("_count")]] = \
+        state[[col for col in ACCUMULATOR_STATE_COLUMNS if col.endswith("_count")]].astype("int64")
+
+    folded_days = sorted({d for row in rows for d in row[-1]})
+    return state, folded_days
+
+
+def close_rollup_accumulator(grain: str, period_start: pendulum.DateTime, pool=None) -> int:
+    """Mark the period as finalized. A day folded in later reopens it."""
+    logger = get_logger()
+    pool = pool or get_pg_pool()
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(_CLOSE_SQL, (grain, period_start.date()))
+            closed = cur.rowcount
+
+    logger.info(f"Closed {grain} accumulator {period_start.to_date_string()}", extra={"rows": closed})
+    return closed
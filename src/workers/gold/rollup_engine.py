@@ -0,0 +1,144 @@
+from io import BytesIO
+
+import pandas as pd
+import pendulum
+from azure.core.exceptions import ResourceNotFoundError
+from decouple import config
+
+from src.clients.parquet_cache import read_parquet_blob
+from src.helpers.gold.load import upload_parquet_bytes
+from src.helpers.logging_helpers.combine_loggers_helper import get_logger
+
+"""
+Rollup engine for the gold summaries (daily -> weekly / monthly, monthly -> yearly / seasonal).
+
+Every gold summary partition gets a small state file with mergeable partial aggregates per place:
+    <measure>_sum, <measure>_count, <measure>_min, <measure>_max  +  partitions (merged child partitions)
+Higher grains merge the states of their children (sum the sums/counts, min of mins, max of maxes) and
+finalize them into the usual <measure>_max/_min/_avg columns. <measure>_avg = sum / count, so a weekly or
+yearly average is the exact average over the base observations, not a mean of daily/monthly means.
+
+Daily states are built from the hourly gold rows of the day. Stored states are read first, summaries are
+only downloaded for the children without one; such a child counts as a single observation, so its
+parent is merged from summary rows only and its state is not saved (collect_rollup_states).
+
+States live under BASE_DIR_GOLD_STATE/<grain>/ with the same partition layout as the gold summaries,
+so the listings of the gold folders only ever see gold files.
+"""
+
+BASE_DIR_GOLD_STATE = config("BASE_DIR_GOLD_STATE", default="MyLakehouse/Meteo/gold/rollup-state")
+# "states" - weekly/monthly/yearly/seasonal from merged states (default), "groupby" - concat + groupby of summaries
+GOLD_ROLLUP_ENGINE = config("GOLD_ROLLUP_ENGINE", default="states")
+
+ROLLUP_KEYS = ["place_name"]
+ROLLUP_MEASURES = ["temp", "wind_speed", "rain", "snow", "cloud_cover", "humidity"]
+
+# column order of the summary frames the groupby workers produce
+SUMMARY_COLUMNS = [f"{measure}_{stat}" for measure in ROLLUP_MEASURES for stat in ("max", "min", "avg")]
+
+
+def rollup_state_path_parts(grain: str, period_start: pendulum.DateTime, label: str = None) -> list[str]:
+    """Path of a state file under BASE_DIR_GOLD_STATE, mirrors the gold summary layout of the grain."""
+    year = period_start.format("YYYY")
+    file_names = {
+        "daily": lambda: [period_start.format("MM"), f"{period_start.format('DD')}.parquet"],
+        "weekly": lambda: [f"W{period_start.week_of_year:02d}.parquet"],
+        "monthly": lambda: [f"{period_start.format('MM')}.parquet"],
+        "yearly": lambda: [f"{year}.parquet"],
+        "seasonal": lambda: [f"{label}.parquet"],
+    }
+    return [grain, year, *file_names[grain]()]
+
+
+def build_rollup_state(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Partial state per place from rows that carry <measure>_max/_min/_avg columns
+    (hourly gold rows, or summary rows of any grain).
+    """
+    aggregations = {}
+    for measure in ROLLUP_MEASURES:
+        aggregations[f"{measure}_sum"] = (f"{measure}_avg", "sum")
+        aggregations[f"{measure}_count"] = (f"{measure}_avg", "count")
+        aggregations[f"{measure}_min"] = (f"{measure}_min", "min")
+        aggregations[f"{measure}_max"] = (f"{measure}_max", "max")
+
+    state = df.groupby(ROLLUP_KEYS).agg(**aggregations).reset_index()
+    state["partitions"] = 1
+    return state
+
+
+def merge_rollup_states(states: list[pd.DataFrame]) -> pd.DataFrame:
+    """Merge partial states of several partitions into one state per place."""
+    combined = pd.concat([s for s in states if s is not None and not s.empty], ignore_index=True)
+
+    aggregations = {"partitions": "sum"}
+    for measure in ROLLUP_MEASURES:
+        aggregations[f"{measure}_sum"] = "sum"
+        aggregations[f"{measure}_count"] = "sum"
+        aggregations[f"{measure}_min"] = "min"
+        aggregations[f"{measure}_max"] = "max"
+
+    return combined.groupby(ROLLUP_KEYS).agg(aggregations).reset_index()
+
+
+def finalize_rollup_state(state: pd.DataFrame) -> pd.DataFrame:
+    """State -> place_name + <measure>_max/_min/_avg, same columns as the groupby workers."""
+    summary = state[ROLLUP_KEYS].copy()
+    for measure in ROLLUP_MEASURES:
+        count = state[f"{measure}_count"]
+        summary[f"{measure}_max"] = state[f"{measure}_max"]
+        summary[f"{measure}_min"] = state[f"{measure}_min"]
+        summary[f"{measure}_avg"] = state[f"{measure}_sum"].where(count > 0) / count.where(count > 0)
+    return summary[ROLLUP_KEYS + SUMMARY_COLUMNS].round(2)
+
+
+def upload_rollup_state(fs_client, grain: str, period_start: pendulum.DateTime, state: pd.DataFrame,
+                        label: str = None) -> dict:
+    parquet_buffer = BytesIO()
+    state.to_parquet(parquet_buffer, engine="pyarrow", compression="snappy", index=False)
+    return upload_parquet_bytes(fs_client, BASE_DIR_GOLD_STATE, rollup_state_path_parts(grain, period_start, label),
+                                parquet_buffer.getvalue())
+
+
+def download_rollup_state(fs_client, grain: str, period_start: pendulum.DateTime, label: str = None) -> pd.DataFrame:
+    """Raises ResourceNotFoundError when the partition has no state."""
+    file_path = "/".join([BASE_DIR_GOLD_STATE] + rollup_state_path_parts(grain, period_start, label))
+    return read_parquet_blob(fs_client, file_path)
+
+
+def read_rollup_states(fs_client, grain: str,
+                       period_starts: list[pendulum.DateTime]) -> tuple[dict[pendulum.DateTime, pd.DataFrame],
+                                                                        list[pendulum.DateTime]]:
+    """Stored states of the child partitions that have one, and the children without (their summaries are needed)."""
+    stored = {}
+    stateless = []
+    for ts in period_starts:
+        try:
+            stored[ts] = download_rollup_state(fs_client, grain, ts)
+        except ResourceNotFoundError:
+            stateless.append(ts)
+    return stored, stateless
+
+
+def summary_row_state(state: pd.DataFrame) -> pd.DataFrame:
+    """A stored state reduced to what the child's summary partition holds: one observation per place."""
+    return build_rollup_state(finalize_rollup_state(state))
+
+
+def collect_rollup_states(stored: dict[pendulum.DateTime, pd.DataFrame],
+                          summaries: list[tuple[pendulum.DateTime, pd.DataFrame]]) -> tuple[list[pd.DataFrame], bool]:
+    """
+    States of all children and whether they are exact. Children without a stored state (older data,
+    Postgres fallback) only have a summary, counted once per place, so when there is any the stored states
+    are reduced to their summary row as well - mixing the two would weigh children by different units.
+    The result is then the groupby engine's, and a state merged from it must not be saved: the next
+    grain up would take it for an exact one.
+    """
+    summaries = [(ts, df) for ts, df in summaries if df is not None and not df.empty]
+    if not summaries:
+        return list(stored.values()), True
+
+    get_logger().info(f"No stored rollup state for: {[ts.to_date_string() for ts, _ in summaries]}, "
+                      f"all children merged as summary rows")
+    return [summary_row_state(state) for state in stored.values()] + [build_rollup_state(df) for _, df in summaries], \
+        False
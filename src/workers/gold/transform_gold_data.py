@@ -3,6 +3,7 @@ import pendulum
 
 from src.core.exceptions import InsufficientMonthsError
 from src.helpers.observability_helpers.pipeline_config import QUARTER_START_MONTH
+from src.workers.gold.rollup_engine import merge_rollup_states, finalize_rollup_state
 
 
 def get_daily_summ_data_worker(gold_results: list[tuple[pendulum.DateTime, pd.DataFrame]]) -> list[
@@ -204,3 +205,90 @@ def aggregate_months_to_season(season, year, data) -> pd.DataFrame:
 
     return seasonally_summ_df
 
+
+# ── rollup engine: same outputs from merged partial states (see rollup_engine.py) ──
+
+def _merge_day_states(day_states: list[pd.DataFrame]) -> tuple[pd.DataFrame | None, int]:
+    """Merged state and the number of days in it (a state read from an accumulator already holds many)."""
+    if not day_states:
+        return None, 0
+    state = merge_rollup_states(day_states)
+    return state, int(state["partitions"].max()) if not state.empty else 0
+
+
+def get_weekly_summ_from_states_worker(week_start, day_states: list[pd.DataFrame]) -> tuple[pd.DataFrame, pd.DataFrame]:
+    state, days = _merge_day_states(day_states)
+    if days < 4:
+        raise ValueError(f"Not enough data for week {week_start}, only {days} days")
+
+    weekly_summ_df = finalize_rollup_state(state)
+    weekly_summ_df["week_number"] = week_start.week_of_year
+    weekly_summ_df["year"] = week_start.year
+    weekly_summ_df["week_start"] = week_start
+    weekly_summ_df["generated_at"] = pendulum.now("UTC")
+
+    return weekly_summ_df, state
+
+
+def get_monthly_summ_from_states_worker(month_start,
+                                        day_states: list[pd.DataFrame],
+                                        max_missing_ratio: float) -> tuple[pd.DataFrame, pd.DataFrame]:
+    min_required = month_start.days_in_month - round(month_start.days_in_month * max_missing_ratio)
+    state, days = _merge_day_states(day_states)
+
+    if days < min_required:
+        raise ValueError(
+            f"Insufficient data for {month_start.format('MMMM YYYY')}: "
+            f"{days}/{month_start.days_in_month} days available, "
+            f"minimum required: {min_required}"
+        )
+
+    monthly_summ_df = finalize_rollup_state(state)
+    monthly_summ_df["month_number"] = month_start.month
+    monthly_summ_df["year"] = month_start.year
+    monthly_summ_df["month_start"] = month_start.date()
+    monthly_summ_df["generated_at"] = pendulum.now("UTC")
+
+    return monthly_summ_df, state
+
+
+def aggregate_month_states_to_year(month_states: list[pd.DataFrame], expected_months, max_missing_ratio,
+                                   year) -> tuple[pd.DataFrame, pd.DataFrame]:
+    min_required = expected_months - round(expected_months * max_missing_ratio)
+
+    if len(month_states) < min_required:
+        raise InsufficientMonthsError(
+            f"Insufficient data for {year}: "
+            f"{len(month_states)}/{expected_months} months available, "
+            f"minimum required: {min_required}"
+        )
+
+    state = merge_rollup_states(month_states)
+    yearly_summ_df = finalize_rollup_state(state)
+    yearly_summ_df["year"] = year
+    yearly_summ_df["period_start"] = pendulum.datetime(year, 1, 1).date()
+    yearly_summ_df["period_type"] = "yearly"
+    yearly_summ_df["updated_at"] = pendulum.now("UTC")
+
+    return yearly_summ_df, state
+
+
+def aggregate_month_states_to_season(season, year, period_start,
+                                     month_states: list[pd.DataFrame]) -> tuple[pd.DataFrame, pd.DataFrame]:
+    min_required = 3
+
+    if len(month_states) < min_required:
+        raise InsufficientMonthsError(
+            f"Insufficient data for {season}: "
+            f"{len(month_states)}/{min_required} months available, "
+            f"minimum required: {min_required}"
+        )
+
+    state = merge_rollup_states(month_states)
+    seasonally_summ_df = finalize_rollup_state(state)
+    seasonally_summ_df["year"] = year
+    seasonally_summ_df["period_start"] = period_start
+    seasonally_summ_df["season_name"] = season
+    seasonally_summ_df["generated_at"] = pendulum.now("UTC")
+
+    return seasonally_summ_df, state
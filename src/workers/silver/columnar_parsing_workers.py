@@ -0,0 +1,345 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from src.helpers.bronze.payload_schemas import OpenMeteoPayload, MeteobluePayload, OpenWeatherMapPayload, \
+    WeatherApiPayload
+
+"""
+Columnar parsers: each one turns a provider payload into {column: sequence} for the forecast
+rows of that payload (all sequences the same length), instead of one dict per row.
+Array payloads (Meteoblue, Open-Meteo) are taken as whole vectors, timestamps are converted with
+vectorized pandas tz math. parse_records_columnar in transform_bronze_data stitches the columns of
+every record into one DataFrame.
+
+Output values match the row parsers in parsing_workers.py column by column.
+The *_typed variants read msgspec Structs from payload_schemas (BRONZE_TYPED_PAYLOADS) by attribute.
+"""
+
+SILVER_COLUMNS = [
+    "api_name", "place_name", "ingest_date", "ingest_hour",
+    "original_ts", "forecast_date_utc", "forecast_hour_utc",
+    "temp_max", "temp_min", "temp_avg",
+    "precipitation", "rain", "snow", "precip_prob",
+    "humidity", "wind_speed", "wind_deg", "clouds",
+    "weather_code", "weather_description", "weather_icon",
+    "sunrise", "sunset",
+]
+
+
+def _padded(values: list, n: int) -> list:
+    """values[i] if i < len(values) else None - for provider arrays shorter than the time axis."""
+    values = list(values or [])[:n]
+    return values + [None] * (n - len(values))
+
+
+def _field(items: list[dict], *path):
+    """Pull one (nested) field out of every item, None where missing."""
+    out = []
+    for item in items:
+        value = item
+        for key in path:
+            value = value.get(key) if isinstance(value, dict) else None
+        out.append(value)
+    return out
+
+
+def _iso_with_offset(local: pd.DatetimeIndex) -> list[str]:
+    """Same text as datetime.isoformat() for tz-aware timestamps: 2026-01-05T00:00:00+02:00"""
+    text = pd.Series(local.strftime("%Y-%m-%dT%H:%M:%S%z"))
+    return (text.str[:-2] + ":" + text.str[-2:]).tolist()
+
+
+def _utc_dates_from_local_days(days: list[str], tz_name: str):
+    """Local midnight of each YYYY-MM-DD in tz_name -> (original_ts, UTC date)."""
+    local = pd.DatetimeIndex(pd.to_datetime(days)).tz_localize(tz_name)
+    return _iso_with_offset(local), list(local.tz_convert("UTC").date)
+
+
+def _owm_offset_suffix(offset_sec: int) -> str:
+    sign = "-" if offset_sec < 0 else "+"
+    hours, minutes = divmod(abs(offset_sec) // 60, 60)
+    return f"{sign}{hours:02d}:{minutes:02d}"
+
+
+def columns_foreca_daily(payload: dict) -> Optional[dict]:
+    days = payload.get("forecast", [])
+    if not days:
+        return None
+
+    tz_name = payload.get("tz")
+    dates = _field(days, "date")
+    if tz_name and all(dates):
+        original_ts, forecast_date_utc = _utc_dates_from_local_days(dates, tz_name)
+    else:
+        original_ts, forecast_date_utc = dates, dates
+
+    return {
+        "original_ts": original_ts,
+        "forecast_date_utc": forecast_date_utc,
+        "temp_max": _field(days, "maxTemp"),
+        "temp_min": _field(days, "minTemp"),
+        "precipitation": _field(days, "precipAccum"),
+        "precip_prob": _field(days, "precipProb"),
+        "wind_speed": _field(days, "maxWindSpeed"),
+        "wind_deg": _field(days, "windDir"),
+        "clouds": _field(days, "cloudiness"),
+        "weather_description": _field(days, "symbolPhrase"),
+        "weather_icon": _field(days, "symbol"),
+        "sunrise": _field(days, "sunrise"),
+        "sunset": _field(days, "sunset"),
+    }
+
+
+def columns_accuweather_daily(payload: dict) -> Optional[dict]:
+    days = payload.get("DailyForecasts", [])
+    if not days:
+        return None
+
+    original_ts = _field(days, "Date")
+    return {
+        "original_ts": original_ts,
+        "forecast_date_utc": list(pd.DatetimeIndex(pd.to_datetime(original_ts, utc=True)).date),
+        "temp_max": _field(days, "Temperature", "Maximum", "Value"),
+        "temp_min": _field(days, "Temperature", "Minimum", "Value"),
+        "precip_prob": _field(days, "Day", "PrecipitationProbability"),
+        "weather_description": _field(days, "Day", "IconPhrase"),
+        "weather_icon": _field(days, "Day", "Icon"),
+    }
+
+
+def columns_tomorrowio_daily(payload: dict) -> Optional[dict]:
+    intervals = payload.get("timelines", {}).get("daily", [])
+    if not intervals:
+        return None
+
+    original_ts = _field(intervals, "time")
+    rain = _field(intervals, "values", "rainAccumulationSum")
+    return {
+        "original_ts": original_ts,
+        "forecast_date_utc": list(pd.DatetimeIndex(pd.to_datetime(original_ts, utc=True)).date),
+        "temp_max": _field(intervals, "values", "temperatureMax"),
+        "temp_min": _field(intervals, "values", "temperatureMin"),
+        "temp_avg": _field(intervals, "values", "temperatureAvg"),
+        "precipitation": rain,
+        "rain": rain,
+        "snow": _field(intervals, "values", "snowAccumulationSum"),
+        "precip_prob": _field(intervals, "values", "precipitationProbabilityAvg"),
+        "humidity": _field(intervals, "values", "humidityAvg"),
+        "wind_speed": _field(intervals, "values", "windSpeedAvg"),
+        "wind_deg": _field(intervals, "values", "windDirectionAvg"),
+        "clouds": _field(intervals, "values", "cloudCoverAvg"),
+        "weather_code": _field(intervals, "values", "weatherCodeMax"),
+        "sunrise": _field(intervals, "values", "sunriseTime"),
+        "sunset": _field(intervals, "values", "sunsetTime"),
+    }
+
+
+def columns_meteoblue_basic_day(payload: dict) -> Optional[dict]:
+    day_data = payload.get("data_day", {})
+    times = day_data.get("time", [])
+    if not times:
+        return None
+
+    n = len(times)
+    utc_offset = payload.get("metadata", {}).get("utc_timeoffset", 0)
+    local = pd.DatetimeIndex(pd.to_datetime(times))
+
+    return {
+        "original_ts": list(local.strftime("%Y-%m-%dT%H:%M:%S")),
+        "forecast_date_utc": list((local - pd.Timedelta(hours=utc_offset)).date),
+        "temp_max": _padded(day_data.get("temperature_max"), n),
+        "temp_min": _padded(day_data.get("temperature_min"), n),
+        "temp_avg": _padded(day_data.get("temperature_mean"), n),
+        "precipitation": _padded(day_data.get("precipitation_sum"), n),
+    }
+
+
+def columns_weatherbit_daily(payload: dict) -> Optional[dict]:
+    days = payload.get("data", [])
+    if not days:
+        return None
+
+    original_ts, forecast_date_utc = _utc_dates_from_local_days(_field(days, "datetime"),
+                                                                payload.get("timezone", "UTC"))
+    return {
+        "original_ts": original_ts,
+        "forecast_date_utc": forecast_date_utc,
+        "temp_max": _field(days, "max_temp"),
+        "temp_min": _field(days, "min_temp"),
+        "precipitation": _field(days, "precip"),
+        "snow": _field(days, "snow"),
+        "precip_prob": _field(days, "pop"),
+        "humidity": _field(days, "rh"),
+        "wind_speed": _field(days, "wind_spd"),
+        "clouds": _field(days, "clouds"),
+        "weather_description": _field(days, "weather", "description"),
+        "weather_icon": _field(days, "weather", "icon"),
+    }
+
+
+def columns_openweathermap_3h(payload: dict) -> Optional[dict]:
+    entries = payload.get("list", [])
+    if not entries:
+        return None
+
+    # dt_txt is read as local time of the city offset, same as parse_openweathermap_3h
+    offset_sec = payload.get("city", {}).get("timezone", 0)
+    local = pd.DatetimeIndex(pd.to_datetime(_field(entries, "dt_txt")))
+    utc = local - pd.Timedelta(seconds=offset_sec)
+
+    suffix = _owm_offset_suffix(offset_sec)
+
+    first_weather = [(entry.get("weather") or [{}])[0] for entry in entries]
+    return {
+        "original_ts": [ts + suffix for ts in local.strftime("%Y-%m-%dT%H:%M:%S")],
+        "forecast_date_utc": list(utc.date),
+        "forecast_hour_utc": utc.hour.to_numpy(dtype=np.int64).tolist(),
+        "temp_max": _field(entries, "main", "temp_max"),
+        "temp_min": _field(entries, "main", "temp_min"),
+        "temp_avg": _field(entries, "main", "temp"),
+        "precip_prob": _field(entries, "pop"),
+        "humidity": _field(entries, "main", "humidity"),
+        "wind_speed": _field(entries, "wind", "speed"),
+        "wind_deg": _field(entries, "wind", "deg"),
+        "clouds": _field(entries, "clouds", "all"),
+        "weather_code": _field(first_weather, "id"),
+        "weather_description": _field(first_weather, "description"),
+        "weather_icon": _field(first_weather, "icon"),
+    }
+
+
+def columns_weatherapi_daily(payload: dict) -> Optional[dict]:
+    days = payload.get("forecast", {}).get("forecastday", [])
+    if not days:
+        return None
+
+    original_ts, forecast_date_utc = _utc_dates_from_local_days(_field(days, "date"),
+                                                                payload.get("location", {}).get("tz_id", "UTC"))
+    return {
+        "original_ts": original_ts,
+        "forecast_date_utc": forecast_date_utc,
+        "temp_max": _field(days, "day", "maxtemp_c"),
+        "temp_min": _field(days, "day", "mintemp_c"),
+        "temp_avg": _field(days, "day", "avgtemp_c"),
+        "precipitation": _field(days, "day", "totalprecip_mm"),
+        "precip_prob": _field(days, "day", "daily_chance_of_rain"),
+        "wind_speed": _field(days, "day", "maxwind_kph"),
+        "weather_code": _field(days, "day", "condition", "code"),
+        "weather_description": _field(days, "day", "condition", "text"),
+        "weather_icon": _field(days, "day", "condition", "icon"),
+        "sunrise": _field(days, "astro", "sunrise"),
+        "sunset": _field(days, "astro", "sunset"),
+    }
+
+
+def columns_open_meteo_daily(payload: dict) -> Optional[dict]:
+    daily = payload.get("daily", {})
+    times = daily.get("time", [])
+    if not times:
+        return None
+
+    n = len(times)
+    return {
+        "original_ts": list(times),
+        "forecast_date_utc": list(pd.DatetimeIndex(pd.to_datetime(times)).date),
+        "temp_max": _padded(daily.get("temperature_2m_max"), n),
+        "temp_min": _padded(daily.get("temperature_2m_min"), n),
+        "precipitation": _padded(daily.get("precipitation_sum"), n),
+        "rain": _padded(daily.get("rain_sum"), n),
+        "wind_speed": _padded(daily.get("windspeed_10m_max"), n),
+        "clouds": _padded(daily.get("cloudcover_mean"), n),
+        "weather_code": _padded(daily.get("weathercode"), n),
+    }
+
+
+# ── typed (msgspec) payloads ──────────────────────────────────────────────────
+
+def columns_meteoblue_typed(payload: MeteobluePayload) -> Optional[dict]:
+    day_data = payload.data_day
+    if not day_data.time:
+        return None
+
+    n = len(day_data.time)
+    local = pd.DatetimeIndex(pd.to_datetime(day_data.time))
+
+    return {
+        "original_ts": list(local.strftime("%Y-%m-%dT%H:%M:%S")),
+        "forecast_date_utc": list((local - pd.Timedelta(hours=payload.metadata.utc_timeoffset)).date),
+        "temp_max": _padded(day_data.temperature_max, n),
+        "temp_min": _padded(day_data.temperature_min, n),
+        "temp_avg": _padded(day_data.temperature_mean, n),
+        "precipitation": _padded(day_data.precipitation_sum, n),
+    }
+
+
+def columns_openweathermap_typed(payload: OpenWeatherMapPayload) -> Optional[dict]:
+    entries = payload.entries
+    if not entries:
+        return None
+
+    offset_sec = payload.city.timezone
+    local = pd.DatetimeIndex(pd.to_datetime([e.dt_txt for e in entries]))
+    utc = local - pd.Timedelta(seconds=offset_sec)
+    suffix = _owm_offset_suffix(offset_sec)
+
+    first_weather = [e.weather[0] if e.weather else None for e in entries]
+    return {
+        "original_ts": [ts + suffix for ts in local.strftime("%Y-%m-%dT%H:%M:%S")],
+        "forecast_date_utc": list(utc.date),
+        "forecast_hour_utc": utc.hour.to_numpy(dtype=np.int64).tolist(),
+        "temp_max": [e.main.temp_max for e in entries],
+        "temp_min": [e.main.temp_min for e in entries],
+        "temp_avg": [e.main.temp for e in entries],
+        "precip_prob": [e.pop for e in entries],
+        "humidity": [e.main.humidity for e in entries],
+        "wind_speed": [e.wind.speed for e in entries],
+        "wind_deg": [e.wind.deg for e in entries],
+        "clouds": [e.clouds.all for e in entries],
+        "weather_code": [w.id if w else None for w in first_weather],
+        "weather_description": [w.description if w else None for w in first_weather],
+        "weather_icon": [w.icon if w else None for w in first_weather],
+    }
+
+
+def columns_weatherapi_typed(payload: WeatherApiPayload) -> Optional[dict]:
+    days = payload.forecast.forecastday
+    if not days:
+        return None
+
+    original_ts, forecast_date_utc = _utc_dates_from_local_days([d.date for d in days], payload.location.tz_id)
+    return {
+        "original_ts": original_ts,
+        "forecast_date_utc": forecast_date_utc,
+        "temp_max": [d.day.maxtemp_c for d in days],
+        "temp_min": [d.day.mintemp_c for d in days],
+        "temp_avg": [d.day.avgtemp_c for d in days],
+        "precipitation": [d.day.totalprecip_mm for d in days],
+        "precip_prob": [d.day.daily_chance_of_rain for d in days],
+        "wind_speed": [d.day.maxwind_kph for d in days],
+        "weather_code": [d.day.condition.code for d in days],
+        "weather_description": [d.day.condition.text for d in days],
+        "weather_icon": [d.day.condition.icon for d in days],
+        "sunrise": [d.astro.sunrise for d in days],
+        "sunset": [d.astro.sunset for d in days],
+    }
+
+
+def columns_open_meteo_typed(payload: OpenMeteoPayload) -> Optional[dict]:
+    daily = payload.daily
+    if not daily.time:
+        return None
+
+    n = len(daily.time)
+    return {
+        "original_ts": list(daily.time),
+        "forecast_date_utc": list(pd.DatetimeIndex(pd.to_datetime(daily.time)).date),
+        "temp_max": _padded(daily.temperature_2m_max, n),
+        "temp_min": _padded(daily.temperature_2m_min, n),
+        "precipitation": _padded(daily.precipitation_sum, n),
+        "rain": _padded(daily.rain_sum, n),
+        "wind_speed": _padded(daily.windspeed_10m_max, n),
+        "clouds": _padded(daily.cloudcover_mean, n),
+        "weather_code": _padded(daily.weathercode, n),
+    }
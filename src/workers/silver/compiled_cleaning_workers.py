@@ -0,0 +1,168 @@
+import uuid
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import infer_dtype, is_datetime64_any_dtype, is_float_dtype, is_integer_dtype
+
+from src.helpers.logging_helpers.combine_loggers_helper import get_logger
+
+"""
+Compiled silver cleaning: same result as clean_silver_df in transform_bronze_data, in one pass.
+
+All range rules are applied together on one 2-D float block (one comparison, one np.where) instead of
+to_numeric/where/fillna per column, every column is converted at most once and columns that already
+have the target dtype are left alone. Instead of a log line per column it returns a report
+{column: {"clipped": n, "coerced": n, "filled": n}} that the task pushes as metrics:
+    clipped - numeric value outside its range, replaced by 0
+    coerced - non-empty value that couldn't be converted (-> 0 / NaT)
+    filled  - empty value replaced by 0
+"""
+
+# column -> (min, max); values outside the range become 0, same as clean_silver_df
+CLIPPING_RULES = {
+    "temp_max": (-80, 70),
+    "temp_min": (-80, 70),
+    "temp_avg": (-80, 70),
+    "humidity": (0, 100),
+    "wind_speed": (0, 200),
+    "wind_deg": (0, 360),
+    "clouds": (0, 100),
+    "precip_prob": (0, 100),
+    "precipitation": (0, 1000),
+    "rain": (0, 1000),
+    "snow": (0, 1000)
+}
+
+TIME_COLUMNS = ["sunrise", "sunset"]
+STRING_COLUMNS = ["api_name", "place_name", "weather_main", "weather_description", "weather_icon"]
+
+
+def compile_clipping_rules(columns, rules: dict = CLIPPING_RULES):
+    """Rules of the columns present in the frame -> (column names, lower bounds, upper bounds)."""
+    cols = [col for col in rules if col in columns]
+    lower = np.array([rules[col][0] for col in cols], dtype=np.float64)
+    upper = np.array([rules[col][1] for col in cols], dtype=np.float64)
+    return cols, lower, upper
+
+
+def _as_float(series: pd.Series) -> np.ndarray:
+    if is_float_dtype(series.dtype):
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+    return pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _clip_numeric_block(df: pd.DataFrame, report: dict):
+    cols, lower, upper = compile_clipping_rules(df.columns)
+    if not cols:
+        return
+
+    raw_missing = df[cols].isna().to_numpy()
+    block = np.column_stack([_as_float(df[col]) for col in cols])
+
+    missing = np.isnan(block)
+    in_range = (block >= lower) & (block <= upper)  # False for NaN
+    df[cols] = np.where(in_range, block, 0.0)
+
+    clipped = (~missing & ~in_range).sum(axis=0)
+    coerced = (missing & ~raw_missing).sum(axis=0)
+    filled = raw_missing.sum(axis=0)
+    for i, col in enumerate(cols):
+        report[col] = {"clipped": int(clipped[i]), "coerced": int(coerced[i]), "filled": int(filled[i])}
+
+
+def _clean_forecast_date(df: pd.DataFrame, report: dict):
+    col = "forecast_date_utc"
+    if col not in df.columns:
+        return
+    series = df[col]
+    if is_datetime64_any_dtype(series.dtype) or infer_dtype(series, skipna=True) in ("date", "empty"):
+        return
+
+    converted = pd.to_datetime(series, errors="coerce")
+    report[col] = {"clipped": 0, "coerced": int((converted.isna() & series.notna()).sum()), "filled": 0}
+    df[col] = converted.dt.date
+
+
+def _clean_forecast_hour(df: pd.DataFrame, report: dict):
+    col = "forecast_hour_utc"
+    if col not in df.columns:
+        return
+    series = df[col]
+    raw_missing = series.isna()
+
+    numeric = series if is_integer_dtype(series.dtype) else pd.to_numeric(series, errors="coerce")
+    coerced = int((numeric.isna() & ~raw_missing).sum())
+    # NaN -> 0 keeps the row in the dedup key; float hours are truncated like astype(int)
+    df[col] = numeric.fillna(0).astype(np.int64).astype("Int64")
+    report[col] = {"clipped": 0, "coerced": coerced, "filled": int(raw_missing.sum())}
+
+
+def _clean_time_columns(df: pd.DataFrame, report: dict):
+    for col in TIME_COLUMNS:
+        if col not in df.columns or isinstance(df[col].dtype, pd.DatetimeTZDtype):
+            continue
+        series = df[col]
+        converted = pd.to_datetime(series, errors="coerce")
+        if converted.dt.tz is None:
+            converted = converted.dt.tz_localize("UTC")
+        report[col] = {"clipped": 0, "coerced": int((converted.isna() & series.notna()).sum()), "filled": 0}
+        df[col] = converted
+
+
+def _clean_string_columns(df: pd.DataFrame):
+    for col in STRING_COLUMNS:
+        if col not in df.columns:
+            continue
+        series = df[col]
+        has_missing = series.isna().any()
+        if infer_dtype(series, skipna=True) in ("string", "empty"):
+            if has_missing:
+                df[col] = series.astype(object).where(series.notna(), None)
+            continue
+        df[col] = series.astype(str).astype(object).where(series.notna(), None)
+
+
+def clean_silver_df_compiled(df: pd.DataFrame, debug: bool = False) -> tuple[pd.DataFrame, dict]:
+    """
+    Single-pass version of clean_silver_df.
+    Returns (cleaned dataframe, per-column report).
+    """
+    logger = get_logger()
+    report = {}
+
+    if df is None or df.empty:
+        logger.warning("Clean silver skipped: empty dataframe")
+        return df, report
+
+    before_rows = len(df)
+    df = df.dropna(how="all")
+
+    _clip_numeric_block(df, report)
+    _clean_forecast_date(df, report)
+    _clean_forecast_hour(df, report)
+    _clean_time_columns(df, report)
+    _clean_string_columns(df)
+
+    df["batch_id"] = str(uuid.uuid4())
+    df = df.reset_index(drop=True)
+
+    after_rows = len(df)
+    logger.info(
+        "Silver cleaning and validation completed",
+        extra={
+            "rows_before": before_rows,
+            "rows_after": after_rows,
+            "removed": before_rows - after_rows,
+            "clipped": sum(r["clipped"] for r in report.values()),
+            "coerced": sum(r["coerced"] for r in report.values()),
+            "filled": sum(r["filled"] for r in report.values()),
+        }
+    )
+
+    if debug:
+        logger.debug(
+            "Full dataframe description",
+            extra={"describe": df.describe(include='all').to_dict()}
+        )
+
+    return df, report
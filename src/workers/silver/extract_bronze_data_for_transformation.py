@@ -1,35 +1,105 @@
-import json
+import io
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from azure.core.exceptions import ResourceNotFoundError
+from decouple import config
 from sqlalchemy import text
 from sqlalchemy.exc import OperationalError
 
 from src.helpers.bronze.api_location_mapper import api_locations
+from src.helpers.bronze.bronze_layout import bronze_bundle_dir
+from src.helpers.bronze.json_codec import decode_payload
+from src.helpers.lazy_imports import lazy_module
 from src.helpers.logging_helpers.combine_loggers_helper import get_logger
 
+pq = lazy_module("pyarrow.parquet")  # only the bundle layout reads Parquet
 
-def download_json_from_adls_worker(azure_fs_client, base_dir, date, hour):
+SILVER_DOWNLOAD_MAX_WORKERS = config("SILVER_DOWNLOAD_MAX_WORKERS", default=8, cast=int)
+
+
+def _download_bronze_file(azure_fs_client, base_dir, date, hour, api_name, place_name):
+    dir_path = f"{base_dir}/{date}_{api_name}_{place_name}"
+
+    directory_client = azure_fs_client.get_directory_client(dir_path)
+    file_client = directory_client.get_file_client(f"{hour}.json")
+
+    stream = file_client.download_file()
+    content = stream.readall()
+
+    return {
+        "source": api_name,
+        "place_name": place_name,
+        "ingest_date": date,  # from folder
+        "ingest_hour": int(hour),  # from filename
+        "payload": decode_payload(api_name, content)
+    }
+
+
+def download_json_from_adls_worker(azure_fs_client, base_dir, date, hour, max_workers=SILVER_DOWNLOAD_MAX_WORKERS):
+    """
+    Download and decode every bronze JSON of the hour.
+
+    max_workers > 1: files are fetched by a bounded thread pool and decoded as they arrive.
+    A missing file is logged on its own and skipped, ResourceNotFoundError is raised only when
+    the whole hour is missing (so the caller can fall back to Postgres).
+    max_workers == 1: old sequential mode, the first missing file raises.
+    """
     logger = get_logger()
-    records = []
+    targets = [(api_name, place[0]) for api_name, places in api_locations.items() for place in places]
+
+    if max_workers <= 1:
+        return [_download_bronze_file(azure_fs_client, base_dir, date, hour, api_name, place_name)
+                for api_name, place_name in targets]
+
+    downloaded = {}
+    missing = []
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bronze-download") as pool:
+        futures = {
+            pool.submit(_download_bronze_file, azure_fs_client, base_dir, date, hour, api_name, place_name):
+                (api_name, place_name)
+            for api_name, place_name in targets
+        }
+        for future in as_completed(futures):
+            api_name, place_name = futures[future]
+            try:
+                downloaded[(api_name, place_name)] = future.result()
+            except ResourceNotFoundError:
+                path = f"{base_dir}/{date}_{api_name}_{place_name}/{hour}.json"
+                missing.append(path)
+                logger.warning("Bronze file missing | path=%s", path,
+                               extra={"path": path, "source": api_name, "place_name": place_name})
 
-    for api_name, places in api_locations.items():
-        for place in places:
-            place_name = place[0]
-            dir_path = f"{base_dir}/{date}_{api_name}_{place_name}"
+    if targets and not downloaded:
+        raise ResourceNotFoundError(f"No bronze files found for {date} {hour}")
 
-            directory_client = azure_fs_client.get_directory_client(dir_path)
-            file_client = directory_client.get_file_client(f"{hour}.json")
+    logger.info(f"Downloaded bronze files | found={len(downloaded)} | missing={len(missing)}",
+                extra={"found": len(downloaded), "missing": missing})
+    # keep api_locations order, as_completed gives completion order
+    return [downloaded[target] for target in targets if target in downloaded]
 
-            stream = file_client.download_file()
-            content = stream.readall()
 
-            records.append({
-                "source": api_name,
-                "place_name": place_name,
-                "ingest_date": date,  # from folder
-                "ingest_hour": int(hour),  # from filename
-                "payload": json.loads(content)
-            })
+def download_bronze_bundle_from_adls_worker(azure_fs_client, base_dir, date, hour):
+    """
+    Read the hourly bronze bundle (one request instead of one per api/place).
+    Returns records in the same shape as download_json_from_adls_worker.
+    Raises ResourceNotFoundError when the hour has no bundle.
+    """
+    logger = get_logger()
+    path = f"{bronze_bundle_dir(base_dir, date)}/{hour}.parquet"
+    content = azure_fs_client.get_file_client(path).download_file().readall()
 
+    table = pq.read_table(io.BytesIO(content))
+    records = [
+        {
+            "source": row["source"],
+            "place_name": row["place_name"],
+            "ingest_date": row["ingest_date"],
+            "ingest_hour": int(row["ingest_hour"]),
+            "payload": decode_payload(row["source"], row["payload"]),
+        }
+        for row in table.to_pylist()
+    ]
+    logger.info(f"Read bronze bundle {path} | records={len(records)}")
     return records
 
 
@@ -47,7 +117,7 @@ def extract_bronze_data_from_postgres_worker(engine, date, hour):
                    place_name,
                    ingest_date,
                    ingest_hour,
-                   payload
+                   payload::text AS payload
                FROM raw_json_weather_api_data
                WHERE ingest_date = :date
                  AND ingest_hour = :hour
@@ -55,7 +125,11 @@ def extract_bronze_data_from_postgres_worker(engine, date, hour):
 
         with engine.connect() as conn:
             result = conn.execute(query, {"date": date, "hour": hour})
-            records = [dict(row) for row in result.mappings()]
+            # payload comes back as text and is decoded here, with the bronze codec instead of the driver's json
+            records = [
+                {**row, "payload": decode_payload(row["source"], row["payload"])}
+                for row in result.mappings()
+            ]
 
         return records
 
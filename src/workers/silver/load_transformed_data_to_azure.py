@@ -7,6 +7,22 @@ from src.clients.datalake_client import fs_client
 from src.helpers.silver.silver_azure_uploader import upload_silver_bytes
 
 
+# rows per row group; with the rows sorted by forecast date each group covers a narrow date range,
+# so its min/max statistics let gold readers skip it
+SILVER_PARQUET_ROW_GROUP_SIZE = config("SILVER_PARQUET_ROW_GROUP_SIZE", default=2048, cast=int)
+SILVER_SORT_COLUMNS = ["forecast_date_utc", "place_name", "forecast_hour_utc"]
+
+
+def silver_parquet_bytes(df: pd.DataFrame) -> bytes:
+    sort_columns = [col for col in SILVER_SORT_COLUMNS if col in df.columns]
+    if sort_columns:
+        df = df.sort_values(sort_columns, kind="stable", na_position="last").reset_index(drop=True)
+
+    parquet_buffer = io.BytesIO()
+    df.to_parquet(parquet_buffer, engine="pyarrow", compression="snappy", row_group_size=SILVER_PARQUET_ROW_GROUP_SIZE)
+    return parquet_buffer.getvalue()
+
+
 def load_silver_data_to_azure_worker(df):
     """
     Converts a Pandas DataFrame to Parquet bytes and uploads to Azure using the base uploader.
@@ -20,10 +36,8 @@ def load_silver_data_to_azure_worker(df):
     month_folder_name = f"{month_str}"
     day_folder_name = f"{day_str}"
     file_name = f"{hour_str}.parquet"
-    # Convert to Parquet bytes
-    parquet_buffer = io.BytesIO()
-    df.to_parquet(parquet_buffer, engine="pyarrow", compression="snappy")
-    parquet_bytes = parquet_buffer.getvalue()
+    # Convert to Parquet bytes, sorted by forecast date
+    parquet_bytes = silver_parquet_bytes(df)
 
     # Call base uploader
     return upload_silver_bytes(fs_client, config("BASE_DIR_SILVER"), year_folder_name, month_folder_name, day_folder_name,
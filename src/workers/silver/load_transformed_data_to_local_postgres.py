@@ -1,9 +1,52 @@
+import struct
+
+import numpy as np
 import pandas as pd
+import psycopg
+from decouple import config
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 
+from src.clients.postgres_client import get_pg_pool
 from src.helpers.logging_helpers.combine_loggers_helper import get_logger
 
+# "copy" - copy_silver_data_to_postgres_worker (default), "insert" - batched INSERTs through SQLAlchemy
+SILVER_PG_LOAD_MODE = config("SILVER_PG_LOAD_MODE", default="copy")
+# rows joined into one binary COPY block per copy.write()
+SILVER_COPY_BLOCK_ROWS = config("SILVER_COPY_BLOCK_ROWS", default=10000, cast=int)
+
+# Staging columns for the COPY loader and the Postgres type each one is sent as (binary COPY).
+# original_ts and ingest_date arrive as text from the parsers/bronze folders and are cast on insert,
+# NUMERIC columns are staged as float8 and cast to NUMERIC by the target table.
+SILVER_COPY_COLUMNS = [
+    ("api_name", "text"),
+    ("place_name", "text"),
+    ("ingest_date", "text"),
+    ("ingest_hour", "int4"),
+    ("original_ts", "text"),
+    ("forecast_date_utc", "date"),
+    ("forecast_hour_utc", "int4"),
+    ("temp_max", "float8"),
+    ("temp_min", "float8"),
+    ("temp_avg", "float8"),
+    ("precipitation", "float8"),
+    ("rain", "float8"),
+    ("snow", "float8"),
+    ("precip_prob", "float8"),
+    ("humidity", "float8"),
+    ("wind_speed", "float8"),
+    ("wind_deg", "float8"),
+    ("clouds", "float8"),
+    ("weather_code", "int4"),
+    ("weather_description", "text"),
+    ("weather_icon", "text"),
+    ("sunrise", "timestamptz"),
+    ("sunset", "timestamptz"),
+]
+
+# Casts from the staging types to silver_weather_forecast_data
+_SILVER_COPY_CASTS = {"ingest_date": "::date", "original_ts": "::timestamptz"}
+
 
 def load_silver_data_to_postgres_worker(df: pd.DataFrame, engine):
     """
@@ -92,6 +135,125 @@ def load_silver_data_to_postgres_worker(df: pd.DataFrame, engine):
         logger.exception("Failed to load silver data: %s", e)
         raise
 
+_BINARY_COPY_SIGNATURE = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)  # signature, flags, header extension
+_BINARY_COPY_TRAILER = struct.pack(">h", -1)
+_NULL_FIELD = struct.pack(">i", -1)
+_PG_EPOCH_DAY = np.datetime64("2000-01-01", "D")
+_PG_EPOCH_US = np.datetime64("2000-01-01", "us")
+
+
+def _fixed_width_fields(values: np.ndarray, missing: np.ndarray, dtype: str) -> tuple[np.ndarray, np.ndarray]:
+    width = np.dtype(dtype).itemsize
+    prefix = np.where(missing, _NULL_FIELD, struct.pack(">i", width)).astype(object)
+    payload = np.ascontiguousarray(values.astype(dtype)).view(f"V{width}").astype(object)
+    payload[missing] = b""
+    return prefix, payload
+
+
+def _binary_fields(series: pd.Series, pg_type: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    One DataFrame column -> (length prefix, payload) bytes of every field in binary COPY format,
+    converted once per column. A missing value is a -1 length and no payload.
+    """
+    missing = series.isna().to_numpy()
+    if pg_type == "float8":
+        values = pd.to_numeric(series, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+        return _fixed_width_fields(values, missing, ">f8")
+    if pg_type == "int4":
+        # float hours/codes (from NaN gaps) back to int, same truncation as astype(int)
+        values = pd.to_numeric(series, errors="coerce").astype("Float64").astype("Int64")
+        missing = values.isna().to_numpy()
+        return _fixed_width_fields(values.to_numpy(dtype="int64", na_value=0), missing, ">i4")
+    if pg_type == "date":
+        converted = pd.to_datetime(series, errors="coerce")
+        if converted.dt.tz is not None:
+            converted = converted.dt.tz_localize(None)  # the calendar date in the values' own zone, like .dt.date
+        missing = converted.isna().to_numpy()
+        days = converted.to_numpy(dtype="datetime64[D]", na_value=_PG_EPOCH_DAY) - _PG_EPOCH_DAY
+        return _fixed_width_fields(days.astype("int64"), missing, ">i4")
+    if pg_type == "timestamptz":
+        converted = pd.to_datetime(series, errors="coerce", utc=True).dt.tz_localize(None)
+        missing = converted.isna().to_numpy()
+        micros = converted.to_numpy(dtype="datetime64[us]", na_value=_PG_EPOCH_US) - _PG_EPOCH_US
+        return _fixed_width_fields(micros.astype("int64"), missing, ">i8")
+
+    encoded = np.char.encode(series.astype(str).to_numpy(dtype=object).astype(str), "utf-8")
+    lengths = np.where(missing, -1, np.char.str_len(encoded)).astype(">i4")
+    payload = encoded.astype(object)
+    payload[missing] = b""
+    return lengths.view("V4").astype(object), payload
+
+
+def _binary_copy_rows(df: pd.DataFrame) -> np.ndarray:
+    """Every row as its binary COPY pieces: field count, then length prefix and payload of each column."""
+    rows = np.empty((len(df), 1 + 2 * len(SILVER_COPY_COLUMNS)), dtype=object)
+    rows[:, 0] = struct.pack(">h", len(SILVER_COPY_COLUMNS))
+    for i, (name, pg_type) in enumerate(SILVER_COPY_COLUMNS):
+        if name in df.columns:
+            rows[:, 1 + 2 * i], rows[:, 2 + 2 * i] = _binary_fields(df[name], pg_type)
+        else:
+            rows[:, 1 + 2 * i], rows[:, 2 + 2 * i] = _NULL_FIELD, b""
+    return rows
+
+
+def copy_silver_data_to_postgres_worker(df: pd.DataFrame, pool=None) -> dict:
+    """
+    Bulk loader for silver_weather_forecast_data.
+
+    The DataFrame is streamed with binary COPY FROM STDIN into a temp staging table, then moved with
+    one INSERT ... SELECT ... ON CONFLICT DO NOTHING on the uq_forecast_versioned key, all in one transaction.
+    Columns are converted once per column, no per-row dicts or per-cell sanitizing, and the binary
+    payload is joined and sent SILVER_COPY_BLOCK_ROWS rows at a time.
+
+    Returns {"rows": n, "inserted": n, "skipped": n}, skipped = rows already in the table (or duplicated in df).
+    """
+    logger = get_logger()
+
+    if df is None or df.empty:
+        logger.warning("Silver load skipped: empty dataframe")
+        return {"rows": 0, "inserted": 0, "skipped": 0}
+
+    pool = pool or get_pg_pool()
+    names = [name for name, _ in SILVER_COPY_COLUMNS]
+    rows = _binary_copy_rows(df)
+
+    column_list = ", ".join(names)
+    select_list = ", ".join(f"{name}{_SILVER_COPY_CASTS.get(name, '')}" for name in names)
+    staging_ddl = ", ".join(f"{name} {pg_type}" for name, pg_type in SILVER_COPY_COLUMNS)
+
+    try:
+        with pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(f"CREATE TEMP TABLE silver_forecast_staging ({staging_ddl}) ON COMMIT DROP")
+
+                with cur.copy(f"COPY silver_forecast_staging ({column_list}) FROM STDIN (FORMAT BINARY)") as copy:
+                    # the payload is built here, psycopg only forwards it: no Python call per row
+                    copy.write(_BINARY_COPY_SIGNATURE)
+                    for start in range(0, len(rows), SILVER_COPY_BLOCK_ROWS):
+                        copy.write(b"".join(rows[start:start + SILVER_COPY_BLOCK_ROWS].ravel().tolist()))
+                    copy.write(_BINARY_COPY_TRAILER)
+
+                cur.execute(f"""
+                    INSERT INTO silver_weather_forecast_data ({column_list})
+                    SELECT {select_list}
+                    FROM silver_forecast_staging
+                    ON CONFLICT (api_name, place_name, forecast_date_utc, COALESCE(forecast_hour_utc, 42),
+                                 ingest_date, ingest_hour)
+                    DO NOTHING
+                """)
+                inserted = cur.rowcount
+
+    except psycopg.Error as e:
+        logger.exception("Failed to COPY silver data: %s", e)
+        raise
+
+    result = {"rows": len(df), "inserted": inserted, "skipped": len(df) - inserted}
+    logger.info(
+        "Silver data loaded with COPY | total_inserted=%s | total_skipped=%s | total_rows=%s",
+        result["inserted"], result["skipped"], result["rows"]
+    )
+    return result
+
 # import pandas as pd
 # from prefect import get_run_logger
 # from sqlalchemy import text
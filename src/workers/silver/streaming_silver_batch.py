@@ -0,0 +1,70 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import pandas as pd
+from decouple import config
+
+from src.helpers.logging_helpers.combine_loggers_helper import get_logger
+from src.helpers.master.layer_handoff import bronze_records_from_results
+from src.workers.silver.transform_bronze_data import parse_record_columns, frame_from_record_columns, \
+    SILVER_PARSER_ENGINE
+
+"""
+Bronze -> silver as a stream: every API response is parsed into silver columns as soon as its call
+completes, while the other calls of the hour are still waiting on the network.
+
+    async engine  -> on_result(position, result)  (event loop, only hands the result over)
+    parse thread  -> parse_record_columns(record)  (one thread, parsing doesn't hold up the requests)
+    finish()      -> waits for the last parse, one DataFrame in api_locations order
+
+The frame is the same parse_records_columnar builds from the downloaded records, so silver only
+has to clean and load it: the hour's latency becomes the slowest API call + the final flush.
+Used inside a pipelined orchestrator run (layer_handoff), the columnar parser engine only.
+"""
+
+# parse API responses as they arrive in pipelined orchestrator runs (False - silver parses the whole hour)
+SILVER_STREAMING = config("SILVER_STREAMING", default=True, cast=bool)
+
+
+def streaming_enabled(parser_engine: str = SILVER_PARSER_ENGINE) -> bool:
+    return SILVER_STREAMING and parser_engine == "columnar"
+
+
+class StreamingSilverBatch:
+    """In-progress silver batch of one bronze hour, filled by the extraction engine callback."""
+
+    def __init__(self, date_str: str, hour_str: str):
+        self.date_str = date_str
+        self.hour_str = hour_str
+        self._parts: dict[int, dict | None] = {}
+        self._futures = []
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="silver-stream")
+
+    def add(self, position: int, result: dict):
+        """Engine callback, returns at once: failed calls are skipped, the rest parsed in the background."""
+        if result["error"] or result["data"] is None:
+            return
+        future = self._pool.submit(self._parse, position, result)
+        with self._lock:
+            self._futures.append(future)
+
+    def _parse(self, position: int, result: dict):
+        record = bronze_records_from_results([result], self.date_str, self.hour_str)[0]
+        self._parts[position] = parse_record_columns(record)
+
+    def finish(self) -> pd.DataFrame:
+        """Waits for the outstanding parses, the parsed rows as one DataFrame (raises if a parse failed)."""
+        with self._lock:
+            futures = list(self._futures)
+        wait(futures)
+        self._pool.shutdown()
+        for future in futures:
+            future.result()
+
+        silver_df = frame_from_record_columns(self._parts[position] for position in sorted(self._parts))
+        get_logger().info(f"Streaming silver batch finished | responses={len(self._parts)} | rows={len(silver_df)}")
+        return silver_df
+
+    def close(self):
+        self._pool.shutdown(cancel_futures=True)
@@ -1,9 +1,19 @@
 import uuid
 
+import msgspec
 import pandas as pd
+from decouple import config
 
 from src.helpers.logging_helpers.combine_loggers_helper import get_logger
-from src.helpers.silver.parsing_mapper import api_data_parsers
+from src.helpers.silver.parsing_mapper import api_data_parsers, api_columnar_parsers, api_typed_columnar_parsers
+from src.helpers.silver.source_naming_mapper import canonical_api_map
+from src.workers.silver.columnar_parsing_workers import SILVER_COLUMNS
+from src.workers.silver.compiled_cleaning_workers import CLIPPING_RULES
+
+# "columnar" - parse_records_columnar (default), "rows" - the per-row dict parsers
+SILVER_PARSER_ENGINE = config("SILVER_PARSER_ENGINE", default="columnar")
+# "compiled" - clean_silver_df_compiled (default), "legacy" - clean_silver_df
+SILVER_CLEAN_ENGINE = config("SILVER_CLEAN_ENGINE", default="compiled")
 
 
 def normalize_and_combine(records: list[dict], keep_payload: bool = False) -> pd.DataFrame:
@@ -50,8 +60,71 @@ def normalize_and_combine(records: list[dict], keep_payload: bool = False) -> pd
     return pd.concat(dfs, ignore_index=True) if dfs else pd.DataFrame()
 
 
-def parse_records_from_api(bronze_records):
+def parse_record_columns(record) -> dict[str, list] | None:
+    """
+    Silver columns of one bronze record ({column: values}, SILVER_COLUMNS order), None when the
+    record has no parser or no rows. The streaming batch (streaming_silver_batch) calls it per
+    API response, parse_records_columnar for the whole hour.
+    """
+    if not record:
+        return None
+    # Postgres fallback rows carry "<api>_api" sources, Azure rows the plain api name
+    source = str(record.get("source", "")).strip()
+    api_name = canonical_api_map.get(source, source)
+
+    payload = record.get("payload")
+    parsers = api_typed_columnar_parsers if isinstance(payload, msgspec.Struct) else api_columnar_parsers
+    parser = parsers.get(api_name)
+    if parser is None:
+        get_logger().warning("No parser found for source: %r", source)
+        return None
+
+    parsed = parser(payload) if payload else None
+    if not parsed:
+        return None
+
+    n = len(parsed["original_ts"])
+    meta = {
+        "api_name": api_name,
+        "place_name": record["place_name"],
+        "ingest_date": record["ingest_date"],
+        "ingest_hour": record["ingest_hour"],
+    }
+    return {
+        col: [meta[col]] * n if col in meta else parsed.get(col, [None] * n)
+        for col in SILVER_COLUMNS
+    }
+
+
+def frame_from_record_columns(parts) -> pd.DataFrame:
+    """One silver DataFrame from the parse_record_columns results, built once at the end."""
+    columns = {col: [] for col in SILVER_COLUMNS}
+    total_rows = 0
+
+    for part in parts:
+        if not part:
+            continue
+        for col, values in columns.items():
+            values.extend(part[col])
+        total_rows += len(part["api_name"])
+
+    return pd.DataFrame(columns, columns=SILVER_COLUMNS) if total_rows else pd.DataFrame()
+
+
+def parse_records_columnar(bronze_records) -> pd.DataFrame:
+    """
+    Parse all bronze records of the hour into one silver DataFrame.
+    Every parser fills column sequences, the DataFrame is built once at the end
+    instead of one small frame per record + pd.concat.
+    """
+    return frame_from_record_columns(parse_record_columns(record) for record in bronze_records)
+
+
+def parse_records_from_api(bronze_records, engine: str = SILVER_PARSER_ENGINE):
     logger = get_logger()
+    if engine == "columnar":
+        return parse_records_columnar(bronze_records)
+
     silver_parts = []
 
     for record in bronze_records:
@@ -62,6 +135,10 @@ def parse_records_from_api(bronze_records):
 
         parser = api_data_parsers.get(api_name)
 
+        # row parsers read dicts, typed payloads (BRONZE_TYPED_PAYLOADS) are turned back into one
+        if isinstance(record.get("payload"), msgspec.Struct):
+            record = {**record, "payload": msgspec.to_builtins(record["payload"])}
+
         if parser:
             df_parsed = parser(record)
             if df_parsed is not None and not df_parsed.empty:
@@ -103,21 +180,7 @@ def clean_silver_df(df: pd.DataFrame, debug: bool = False) -> pd.DataFrame:
     ]
 
     # Clip values first, then convert to numeric
-    clipping_rules = {
-        "temp_max": (-80, 70),
-        "temp_min": (-80, 70),
-        "temp_avg": (-80, 70),
-        "humidity": (0, 100),
-        "wind_speed": (0, 200),
-        "wind_deg": (0, 360),
-        "clouds": (0, 100),
-        "precip_prob": (0, 100),
-        "precipitation": (0, 1000),
-        "rain": (0, 1000),
-        "snow": (0, 1000)
-    }
-
-    for col, (min_val, max_val) in clipping_rules.items():
+    for col, (min_val, max_val) in CLIPPING_RULES.items():
         if col in df.columns:
             # Clip извън диапазона → NaN
             df[col] = pd.to_numeric(df[col], errors='coerce')